@@ -0,0 +1,17 @@
+# agents/__init__.py
+
+from .base_agent import BaseAgent
+from .random_agent import RandomAgent
+from .greedy_agent import GreedyAgent
+from .scripted_agent import ScriptedAgent
+from .priority_agent import PriorityAgent
+from .mcts_agent import MCTSAgent
+
+__all__ = [
+    'BaseAgent',
+    'RandomAgent',
+    'GreedyAgent',
+    'ScriptedAgent',
+    'PriorityAgent',
+    'MCTSAgent',
+]
@@ -0,0 +1,28 @@
+# agents/base_agent.py
+
+from abc import ABC, abstractmethod
+
+class BaseAgent(ABC):
+    """
+    Answers the prompts of a ConsoleInterface on behalf of a player.
+    """
+    @abstractmethod
+    def select_action(self, actions, player_id):
+        """Returns one element of actions."""
+        pass
+
+    @abstractmethod
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        """Returns a list of distinct elements of actions."""
+        pass
+
+    def select_yes_no(self, message, player_id):
+        return False
+
+    def bind(self, game_engine):
+        """Called by the engine once the game is set up."""
+        self._game_engine = game_engine
+
+    def close(self):
+        """Called once the agent's games are over, to release what it holds."""
+        pass
@@ -0,0 +1,100 @@
+# agents/greedy_agent.py
+
+from .base_agent import BaseAgent
+from models import Card
+from models.action import (
+    NoResponseAction,
+    SynthesisAction,
+    PurchaseAction,
+    RefineAction,
+    CounterCardAction,
+    HolyLightCardAction,
+    MagicBulletCounterCardAction,
+    AttackCardAction,
+    PoisonCardAction,
+    WeaknessCardAction,
+    HolyShieldCardAction,
+    MagicBulletCardAction
+)
+
+ACTION_PRIORITY = {
+    SynthesisAction: 9,
+    HolyLightCardAction: 9,
+    AttackCardAction: 8,
+    CounterCardAction: 8,
+    MagicBulletCardAction: 7,
+    MagicBulletCounterCardAction: 7,
+    PoisonCardAction: 6,
+    WeaknessCardAction: 5,
+    RefineAction: 4,
+    HolyShieldCardAction: 3,
+    PurchaseAction: 2,
+    NoResponseAction: 0,
+}
+
+CHOICE_PRIORITY = {
+    'gem': 2,
+    'crystal': 1,
+}
+
+class GreedyAgent(BaseAgent):
+    """
+    Picks the highest scoring option by a fixed one-step heuristic:
+    aggressive actions first, counters over taking hits, maximum healing,
+    opponents with the fullest hands as targets.
+    """
+    def __init__(self):
+        self._game_engine = None
+        self._pending_action = None
+
+    def select_action(self, actions, player_id):
+        best_idx = 0
+        best_score = None
+        for idx, action in enumerate(actions):
+            score = self._score(action, player_id)
+            if best_score is None or score > best_score:
+                best_idx, best_score = idx, score
+        selected = actions[best_idx]
+        if type(selected) in ACTION_PRIORITY:
+            self._pending_action = selected
+        return selected
+
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        # Discard the least useful cards and keep as many as allowed.
+        ranked = sorted(range(len(actions)), key=lambda idx: self._keep_score(actions[idx]))
+        return [actions[idx] for idx in ranked[:min_selections]]
+
+    def _score(self, option, player_id):
+        if type(option) in ACTION_PRIORITY:
+            return ACTION_PRIORITY[type(option)]
+        if self._game_engine is not None and option in self._game_engine.get_players():
+            return self._target_score(option, player_id)
+        if isinstance(option, bool):
+            return int(option)
+        if isinstance(option, int):
+            return option
+        if isinstance(option, tuple):
+            gems, crystals = option
+            return (gems + crystals, crystals)
+        if isinstance(option, str):
+            if option == 'draw 3 cards':
+                player = self._get_player(player_id)
+                return int(player is None or player.can_draw_cards(3))
+            return CHOICE_PRIORITY.get(option, 0)
+        return 0
+
+    def _target_score(self, target, player_id):
+        player = self._get_player(player_id)
+        is_ally = player is not None and target.get_team().is_red() == player.get_team().is_red()
+        wants_ally = isinstance(self._pending_action, HolyShieldCardAction)
+        return (is_ally == wants_ally, target.get_hand_size())
+
+    def _keep_score(self, card):
+        if isinstance(card, Card):
+            return (card.is_attack(), card.is_magic_bullet() or card.is_holy_light())
+        return (False, False)
+
+    def _get_player(self, player_id):
+        if self._game_engine is None:
+            return None
+        return self._game_engine.get_player(player_id)
@@ -0,0 +1,426 @@
+# agents/mcts_agent.py
+
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from game_engine import GameEngine
+from models import Card
+from models.action.base_action import BaseAction, CardAction, ActionCanceled
+from models.characters import BasePlayer
+from views.console_interface import ConsoleInterface, SILENT
+from .base_agent import BaseAgent
+from .priority_agent import PriorityAgent
+
+class Diverged(Exception):
+    """
+    Raised when a determinized game no longer matches the decisions taken in the real one.
+    """
+
+def decision_key(option):
+    """
+    Returns what identifies an option in any copy of the game: the action type and card
+    id of an action, the id of a card or player, the option itself otherwise.
+    """
+    if isinstance(option, CardAction):
+        return (type(option).__name__, option.card.get_card_id())
+    if isinstance(option, BaseAction):
+        return type(option).__name__
+    if isinstance(option, Card):
+        return ('card', option.get_card_id())
+    if isinstance(option, BasePlayer):
+        return ('player', option.get_id())
+    return option
+
+def _find_option(options, key):
+    for option in options:
+        if decision_key(option) == key:
+            return option
+    raise Diverged()
+
+class RolloutPolicy(PriorityAgent):
+    """
+    PriorityAgent that plays a random option with probability epsilon, so rollouts of
+    the same determinization do not all play out alike.
+    """
+    def __init__(self, rng, epsilon):
+        super().__init__()
+        self._rng = rng
+        self._epsilon = epsilon
+
+    def select_action(self, actions, player_id):
+        if self._rng.random() < self._epsilon:
+            return actions[self._rng.randrange(len(actions))]
+        return super().select_action(actions, player_id)
+
+    def select_yes_no(self, message, player_id):
+        return self._rng.random() < self._epsilon
+
+class RolloutInterface(ConsoleInterface):
+    """
+    Interface of the engine rollouts are played on. It answers the prompts of a turn
+    with the decisions already taken in the real game, answers the decision being
+    searched with the candidate under test, and leaves the rest to the rollout policy.
+    Decisions are given as decision keys, and a prompt without the recorded option
+    means the rollout diverged from the real game. Messages are dropped.
+    """
+    def __init__(self, policy):
+        super().__init__(debug=False)
+        self.level = SILENT
+        self._policy = policy
+        self._prefix = ()
+        self._position = 0
+        self._player_id = None
+        self._candidate = None
+
+    def send_message(self, message, player_id=None, broadcast=False, debug=False):
+        pass
+
+    def start(self, prefix, player_id, candidate):
+        self._prefix = prefix
+        self._position = 0
+        self._player_id = player_id
+        self._candidate = candidate
+
+    def is_searched_decision_reached(self):
+        return self._position > len(self._prefix)
+
+    def _scripted_answer(self, player_id):
+        """
+        Returns the recorded answer to the current prompt, or None once the policy plays.
+        """
+        position = self._position
+        if position < len(self._prefix):
+            answer = self._prefix[position]
+        elif position == len(self._prefix):
+            if player_id != self._player_id:
+                raise Diverged()
+            answer = self._candidate
+        else:
+            return None
+        self._position = position + 1
+        return answer
+
+    def prompt_action_selection(self, actions, player_id=None):
+        answer = self._scripted_answer(player_id)
+        if answer is None:
+            return self._policy.select_action(actions, player_id)
+        return _find_option(actions, answer)
+
+    def prompt_multiple_action_selection(self, actions, min_selections, max_selections, player_id=None):
+        answer = self._scripted_answer(player_id)
+        if answer is None:
+            return self._policy.select_multiple_actions(actions, min_selections, max_selections, player_id)
+        if type(answer) is not tuple or not min_selections <= len(answer) <= max_selections:
+            raise Diverged()
+        return [_find_option(actions, key) for key in answer]
+
+    def prompt_yes_no(self, message, player_id=None):
+        answer = self._scripted_answer(player_id)
+        if answer is None:
+            return self._policy.select_yes_no(message, player_id)
+        if type(answer) is not bool:
+            raise Diverged()
+        return answer
+
+class RolloutWorker:
+    """
+    Plays rollouts on a private engine built from the players, deck and turn limit of a
+    game config. A rollout restores the state at the start of the turn, deals the cards
+    the searching player cannot see anew (the hands of the other players, the deck order
+    and the next reshuffles), replays the turn up to the searched decision, answers it
+    with a candidate and lets the rollout policy play on for a number of turns.
+
+    The cards other players have shown this turn are kept in their hands and the cards
+    the searching player has drawn this turn are put on top of the deck, so the turn
+    replays as it went; when a recorded decision no longer fits the dealt cards, the
+    rollout is dropped.
+    """
+    def __init__(self, config, seed=None, epsilon=0.2, rollout_turns=4):
+        self._rng = random.Random(seed)
+        self._deck_rng = random.Random()
+        policy = RolloutPolicy(self._rng, epsilon)
+        self._interface = RolloutInterface(policy)
+        self._engine = GameEngine({
+            'player': config['player'],
+            'deck_path': config['deck_path'],
+            'max_turns': config.get('max_turns', None),
+            'seed': 0,
+            'interface': self._interface,
+        })
+        policy.bind(self._engine)
+        self._rollout_turns = rollout_turns
+
+    def _determinize(self, player, shown, drawn):
+        """
+        :param shown: Player id -> cards of that player's hand known to player.
+        :param drawn: Cards player drew this turn, in the order drawn.
+        """
+        # the order of the next reshuffle is hidden as well
+        self._deck_rng.seed(self._rng.getrandbits(64))
+        deck = self._engine.get_deck()
+        others = [other for other in self._engine.get_players() if other is not player]
+        drawn = [card for card in drawn if card in deck.cards]
+        pool = [card for card in deck.cards if card not in drawn]
+        for other in others:
+            kept = shown.get(other.get_id(), ())
+            pool.extend(card for card in other.get_hand_cards() if card not in kept)
+        self._rng.shuffle(pool)
+        for other in others:
+            kept = shown.get(other.get_id(), ())
+            dealt = other.get_hand_size() - len(kept)
+            other.remove_cards(list(other.get_hand_cards()), recycle=False, exhibition=False)
+            cards = list(kept)
+            if dealt:
+                cards.extend(pool[-dealt:])
+                del pool[-dealt:]
+            if cards:
+                other.add_cards(cards)
+        # the deck deals from its end
+        pool.extend(reversed(drawn))
+        deck.restore((pool, deck.discards, self._deck_rng.getstate()))
+
+    def _score(self, is_red):
+        """
+        Returns 1 for a win of the team of is_red, 0 for a loss, and an estimate from the
+        morale and grail margins in between for an unfinished game.
+        """
+        winner = self._engine.get_winner()
+        if winner is not None:
+            return 1.0 if winner.is_red() == is_red else 0.0
+        red_team, blue_team = self._engine.get_teams()
+        team, opponent = (red_team, blue_team) if is_red else (blue_team, red_team)
+        margin = team.get_morale() - opponent.get_morale() + 3 * (team.get_grail() - opponent.get_grail())
+        return min(max(0.5 + margin / 30, 0.05), 0.95)
+
+    def rollout(self, snapshot, shown, drawn, player_id, prefix, candidate):
+        """
+        Plays one rollout and returns its score for the team of player_id, or None if
+        the determinized game diverged from the recorded decisions.
+        """
+        engine = self._engine
+        engine.restore(snapshot)
+        player = engine.get_player(player_id)
+        self._determinize(player, shown, drawn)
+        self._interface.start(prefix, player_id, candidate)
+        first_turn = engine.get_turn_count()
+        try:
+            while engine.is_running() and engine.get_turn_count() - first_turn < self._rollout_turns:
+                engine.play_turn()
+        except (Diverged, ActionCanceled):
+            # a recorded answer the determinized game does not fit, or an action it no longer allows
+            return None
+        if not self._interface.is_searched_decision_reached():
+            return None
+        return self._score(player.get_team().is_red())
+
+    def search(self, snapshot, shown, drawn, player_id, prefix, candidates, time_budget, max_rollouts,
+               exploration=0.7):
+        """
+        Runs UCB1 over the candidates, given as decision keys, until the time budget or
+        the rollout count is spent.
+
+        :return: Visits and total score per candidate, and the number of dropped rollouts.
+        """
+        deadline = time.perf_counter() + time_budget
+        visits = [0] * len(candidates)
+        totals = [0.0] * len(candidates)
+        dropped = 0
+        for _ in range(max_rollouts):
+            if time.perf_counter() >= deadline:
+                break
+            unvisited = [index for index, count in enumerate(visits) if count == 0]
+            if unvisited:
+                index = unvisited[0]
+            else:
+                log_visits = math.log(sum(visits))
+                index = max(range(len(candidates)),
+                            key=lambda i: totals[i] / visits[i] + exploration * math.sqrt(log_visits / visits[i]))
+            score = self.rollout(snapshot, shown, drawn, player_id, prefix, candidates[index])
+            if score is None:
+                dropped += 1
+                if unvisited and dropped >= 4 * len(candidates) and not any(visits):
+                    # no determinization fits the recorded decisions
+                    break
+                continue
+            visits[index] += 1
+            totals[index] += score
+        return visits, totals, dropped
+
+# rollout worker of a pool process
+_worker = None
+
+def _init_worker(config, seed, epsilon, rollout_turns):
+    global _worker
+    _worker = RolloutWorker(config, seed=None if seed is None else seed ^ os.getpid(), epsilon=epsilon,
+                            rollout_turns=rollout_turns)
+
+def _search_in_worker(*args):
+    return _worker.search(*args)
+
+class MCTSAgent(BaseAgent):
+    """
+    Information-set Monte Carlo search over every decision of a player: turn actions,
+    counters, heal amounts, discards and jewel choices alike. The search is flat: UCB1
+    picks among the options of the current decision only, and every later decision of
+    a rollout is played by the rollout policy, without a tree below the root.
+
+    Each rollout samples a determinization of what the player cannot see (other hands
+    and deck order, from the cards not in the discards or the player's own hand) and
+    plays the candidate under test in it, so the statistics of a candidate are shared
+    across the information set rather than tied to one guess of the hidden cards. The
+    candidates are chosen by UCB1 and the most visited one is played.
+
+    Rollouts need the game's state at the start of the turn and the decisions taken
+    since, so the agent only searches in headless games.
+
+    :param time_budget: Seconds of search per decision.
+    :param max_rollouts: Rollouts per decision at most.
+    :param workers: Processes playing rollouts; 1 plays them in this process.
+    :param rollout_turns: Turns a rollout plays before the game is scored. Short rollouts
+                          scored by morale and grail beat longer ones at the same budget.
+    :param exploration: UCB1 exploration constant.
+    :param max_candidates: Discard sets sampled when there are more to choose from.
+    :param epsilon: Probability the rollout policy plays a random option.
+    """
+    def __init__(self, time_budget=0.5, max_rollouts=10000, workers=1, rollout_turns=4, exploration=0.7,
+                 max_candidates=32, epsilon=0.2, seed=None):
+        self._time_budget = time_budget
+        self._max_rollouts = max_rollouts
+        self._workers = workers
+        self._rollout_turns = rollout_turns
+        self._exploration = exploration
+        self._max_candidates = max_candidates
+        self._epsilon = epsilon
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._game_engine = None
+        self._fallback = PriorityAgent()
+        self._decisions = None
+        self._turn_snapshot = None
+        self._turn_hands = None
+        self._worker = None
+        self._pool = None
+        self._last_search = None
+
+    def bind(self, game_engine):
+        self._game_engine = game_engine
+        self._fallback.bind(game_engine)
+        self._decisions = game_engine.get_interface().enable_decision_log()
+        game_engine.get_event_manager().subscribe('before_round_start', self._on_before_round_start,
+                                                  priority=-1, name='_mcts_turn_snapshot')
+
+    def _on_before_round_start(self, event):
+        # before any handler of the turn has run, so a rollout can play the whole turn
+        self._turn_snapshot = self._game_engine.snapshot()
+        self._turn_hands = {player.get_id(): tuple(player.get_hand_cards()) for player in self._game_engine.get_players()}
+        del self._decisions[:]
+
+    def _get_seen_cards(self, player_id):
+        """
+        Returns the cards of the other players' hands at the start of the turn that have
+        left their hands since, and so were shown, by player id, and the cards the player
+        of player_id has drawn since.
+        """
+        shown = {}
+        drawn = ()
+        for player in self._game_engine.get_players():
+            turn_hand = self._turn_hands[player.get_id()]
+            if player.get_id() == player_id:
+                drawn = tuple(card for card in player.get_hand_cards() if card not in turn_hand)
+                continue
+            cards = tuple(card for card in turn_hand if card not in player.get_hand_cards())
+            if cards:
+                shown[player.get_id()] = cards
+        return shown, drawn
+
+    def _get_decision_keys(self):
+        return tuple(tuple(decision_key(option) for option in decision) if isinstance(decision, tuple)
+                     else decision_key(decision) for decision in self._decisions)
+
+    def _rollout_config(self):
+        config = self._game_engine.get_config()
+        return {'player': config['player'], 'deck_path': config['deck_path'], 'max_turns': config.get('max_turns', None)}
+
+    def _search(self, player_id, candidates):
+        """
+        Returns the index in candidates (decision keys) of the candidate to play, or None
+        to fall back to the priority rules.
+        """
+        if self._turn_snapshot is None:
+            return None
+        start = time.perf_counter()
+        shown, drawn = self._get_seen_cards(player_id)
+        args = (self._turn_snapshot, shown, drawn, player_id, self._get_decision_keys(), candidates)
+        if self._workers <= 1:
+            if self._worker is None:
+                self._worker = RolloutWorker(self._rollout_config(), seed=self._rng.getrandbits(32),
+                                             epsilon=self._epsilon, rollout_turns=self._rollout_turns)
+            results = [self._worker.search(*args, self._time_budget, self._max_rollouts, self._exploration)]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self._workers, initializer=_init_worker,
+                                                 initargs=(self._rollout_config(), self._seed, self._epsilon,
+                                                           self._rollout_turns))
+            rollouts_per_worker = -(-self._max_rollouts // self._workers)
+            futures = [self._pool.submit(_search_in_worker, *args, self._time_budget, rollouts_per_worker,
+                                         self._exploration)
+                       for _ in range(self._workers)]
+            results = [future.result() for future in futures]
+
+        visits = [sum(result[0][index] for result in results) for index in range(len(candidates))]
+        totals = [sum(result[1][index] for result in results) for index in range(len(candidates))]
+        self._last_search = {
+            'rollouts': sum(visits),
+            'dropped': sum(result[2] for result in results),
+            'elapsed': time.perf_counter() - start,
+            'visits': visits,
+            'values': [total / count if count else None for total, count in zip(totals, visits)],
+        }
+        if not any(visits):
+            return None
+        return max(range(len(candidates)), key=lambda index: (visits[index], totals[index]))
+
+    def select_action(self, actions, player_id):
+        if len(actions) == 1:
+            return actions[0]
+        best = self._search(player_id, [decision_key(action) for action in actions])
+        if best is None:
+            return self._fallback.select_action(actions, player_id)
+        return actions[best]
+
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        candidates = [combination for size in range(min_selections, max_selections + 1)
+                      for combination in itertools.combinations(range(len(actions)), size)]
+        if len(candidates) == 1:
+            return [actions[index] for index in candidates[0]]
+        if len(candidates) > self._max_candidates:
+            candidates = self._rng.sample(candidates, self._max_candidates)
+        best = self._search(player_id, [tuple(decision_key(actions[index]) for index in combination)
+                                        for combination in candidates])
+        if best is None:
+            return self._fallback.select_multiple_actions(actions, min_selections, max_selections, player_id)
+        return [actions[index] for index in candidates[best]]
+
+    def select_yes_no(self, message, player_id):
+        best = self._search(player_id, [False, True])
+        if best is None:
+            return self._fallback.select_yes_no(message, player_id)
+        return best == 1
+
+    def get_last_search(self):
+        """
+        Returns the rollouts, dropped rollouts, elapsed time and per-candidate visits and
+        mean scores of the last search, or None before the first one.
+        """
+        return self._last_search
+
+    def close(self):
+        """
+        Shuts the rollout processes down; a later search starts them again.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,126 @@
+# agents/priority_agent.py
+
+from .base_agent import BaseAgent
+from models.action import (
+    NoResponseAction,
+    SynthesisAction,
+    PurchaseAction,
+    RefineAction,
+    CounterCardAction,
+    HolyLightCardAction,
+    MagicBulletCounterCardAction,
+    AttackCardAction,
+    PoisonCardAction,
+    WeaknessCardAction,
+    HolyShieldCardAction,
+    MagicBulletCardAction
+)
+
+class PriorityAgent(BaseAgent):
+    """
+    Deterministic rule-based agent, the policy of the batch simulator written for the
+    object engine. Every choice is a fixed priority list with ties broken by card id
+    or seat, so the two engines can be cross-checked game by game:
+
+    - turn: synthesis, attack, magic bullet, poison, weakness on an opponent, holy shield
+      on self or an ally, purchase, refine, then any remaining weakness or holy shield;
+      cards of a kind are played lowest id first
+    - targets: the opponent holding the most cards; holy shield goes to self, then allies
+    - defense: counter, magic bullet counter, holy light, otherwise take the hit
+    - maximum healing, discard lowest ids first, skip a weakened turn only if drawing
+      3 cards would overflow the hand, prefer gems
+    """
+    def __init__(self):
+        self._game_engine = None
+        self._pending_action = None
+
+    def select_action(self, actions, player_id):
+        first = actions[0]
+        if isinstance(first, NoResponseAction) or isinstance(first, (CounterCardAction, HolyLightCardAction, MagicBulletCounterCardAction)):
+            selected = self._select_defense(actions)
+        elif isinstance(first, (SynthesisAction, PurchaseAction, RefineAction, AttackCardAction, PoisonCardAction,
+                                WeaknessCardAction, HolyShieldCardAction, MagicBulletCardAction)):
+            selected = self._select_turn_action(actions, player_id)
+        elif first in self._game_engine.get_players():
+            return self._select_target(actions, player_id)
+        elif isinstance(first, int):
+            return max(actions)
+        elif isinstance(first, tuple):
+            return self._select_jewels(actions)
+        elif isinstance(first, str):
+            return self._select_choice(actions, player_id)
+        else:
+            return first
+        self._pending_action = selected
+        return selected
+
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        return sorted(actions, key=lambda card: card.get_card_id())[:min_selections]
+
+    @staticmethod
+    def _lowest_card(actions, action_type):
+        candidates = [action for action in actions if type(action) is action_type]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda action: action.card.get_card_id())
+
+    def _select_defense(self, actions):
+        for action_type in (CounterCardAction, MagicBulletCounterCardAction, HolyLightCardAction):
+            action = self._lowest_card(actions, action_type)
+            if action is not None:
+                return action
+        return actions[0]
+
+    def _select_turn_action(self, actions, player_id):
+        player = self._game_engine.get_player(player_id)
+        players = self._game_engine.get_players()
+        for action in actions:
+            if type(action) is SynthesisAction:
+                return action
+        for action_type in (AttackCardAction, MagicBulletCardAction, PoisonCardAction):
+            action = self._lowest_card(actions, action_type)
+            if action is not None:
+                return action
+        if any(p.get_team() != player.get_team() and p.can_be_targeted('weakness') for p in players):
+            action = self._lowest_card(actions, WeaknessCardAction)
+            if action is not None:
+                return action
+        if any(p.get_team() == player.get_team() and p.can_be_targeted('holy_shield') for p in players):
+            action = self._lowest_card(actions, HolyShieldCardAction)
+            if action is not None:
+                return action
+        for action_type in (PurchaseAction, RefineAction):
+            for action in actions:
+                if type(action) is action_type:
+                    return action
+        for action_type in (WeaknessCardAction, HolyShieldCardAction):
+            action = self._lowest_card(actions, action_type)
+            if action is not None:
+                return action
+        return actions[0]
+
+    def _select_target(self, targets, player_id):
+        player = self._game_engine.get_player(player_id)
+        if isinstance(self._pending_action, HolyShieldCardAction):
+            if player in targets:
+                return player
+            allies = [target for target in targets if target.get_team() == player.get_team()]
+            return allies[0] if allies else targets[0]
+        opponents = [target for target in targets if target.get_team() != player.get_team()]
+        if not opponents:
+            return targets[0]
+        # max keeps the first of equal hands, i.e. the earliest seat
+        return max(opponents, key=lambda target: target.get_hand_size())
+
+    def _select_jewels(self, combinations):
+        if isinstance(self._pending_action, RefineAction):
+            return max(combinations, key=lambda combination: (combination[0] + combination[1], combination[0]))
+        return combinations[0]
+
+    def _select_choice(self, choices, player_id):
+        if 'gem' in choices:
+            return 'gem'
+        if 'draw 3 cards' in choices:
+            player = self._game_engine.get_player(player_id)
+            return 'draw 3 cards' if player.can_draw_cards(3) else 'skip turn'
+        return choices[0]
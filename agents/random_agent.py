@@ -0,0 +1,18 @@
+# agents/random_agent.py
+
+import random
+from .base_agent import BaseAgent
+
+class RandomAgent(BaseAgent):
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+
+    def select_action(self, actions, player_id):
+        return actions[self._rng.randrange(len(actions))]
+
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        num_selections = self._rng.randint(min_selections, max_selections)
+        return self._rng.sample(list(actions), num_selections)
+
+    def select_yes_no(self, message, player_id):
+        return self._rng.random() < 0.5
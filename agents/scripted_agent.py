@@ -0,0 +1,44 @@
+# agents/scripted_agent.py
+
+from .base_agent import BaseAgent
+
+class ScriptedAgent(BaseAgent):
+    """
+    Replays a fixed list of choices. Each entry is an option index for single
+    selections, a list of indices for multiple selections, or a bool for
+    yes/no prompts. Once the script runs out, the fallback agent is asked.
+    """
+    def __init__(self, choices, fallback=None):
+        self._choices = list(choices)
+        self._position = 0
+        self._fallback = fallback
+
+    def _next_choice(self):
+        if self._position >= len(self._choices):
+            return None
+        choice = self._choices[self._position]
+        self._position += 1
+        return choice
+
+    def _no_choice_left(self, player_id):
+        if self._fallback is None:
+            raise Exception(f"Script for player {player_id} ran out of choices.")
+        return self._fallback
+
+    def select_action(self, actions, player_id):
+        choice = self._next_choice()
+        if choice is None:
+            return self._no_choice_left(player_id).select_action(actions, player_id)
+        return actions[choice]
+
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        choice = self._next_choice()
+        if choice is None:
+            return self._no_choice_left(player_id).select_multiple_actions(actions, min_selections, max_selections, player_id)
+        return [actions[idx] for idx in choice]
+
+    def select_yes_no(self, message, player_id):
+        choice = self._next_choice()
+        if choice is None:
+            return self._no_choice_left(player_id).select_yes_no(message, player_id)
+        return bool(choice)
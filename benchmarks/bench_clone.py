@@ -0,0 +1,29 @@
+# benchmarks/bench_clone.py
+#
+# Compares GameEngine.snapshot/restore/clone against copy.deepcopy.
+# Run from the repository root: python -m benchmarks.bench_clone
+
+import copy
+import timeit
+from agents import RandomAgent
+from game_engine import GameEngine
+from simulation import build_headless_config
+
+def main(number=2000, deepcopy_number=200):
+    agents = {pid: RandomAgent(seed=pid) for pid in range(1, 5)}
+    game_engine = GameEngine(build_headless_config(agents, seed=0))
+    snapshot = game_engine.snapshot()
+
+    timings = {
+        'snapshot': timeit.timeit(game_engine.snapshot, number=number) / number,
+        'restore': timeit.timeit(lambda: game_engine.restore(snapshot), number=number) / number,
+        'clone': timeit.timeit(game_engine.clone, number=number) / number,
+        'deepcopy': timeit.timeit(lambda: copy.deepcopy(game_engine), number=deepcopy_number) / deepcopy_number,
+    }
+    for name, seconds in timings.items():
+        print(f"{name:>10}: {seconds * 1e6:10.1f} us")
+    print(f"clone is {timings['deepcopy'] / timings['clone']:.0f}x faster than deepcopy, "
+          f"snapshot + restore is {timings['deepcopy'] / (timings['snapshot'] + timings['restore']):.0f}x faster")
+
+if __name__ == "__main__":
+    main()
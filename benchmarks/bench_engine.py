@@ -0,0 +1,276 @@
+# benchmarks/bench_engine.py
+#
+# Times the hot paths of the engine in isolation: damage timelines of increasing depth,
+# action menus, counter lookups, deck dealing, hand explosions and whole games. Every
+# scenario starts from a fixed seed and agents answer prompts without I/O, so two runs
+# of the same tree do the same work. Scenarios that change the game restore a snapshot
+# first; the restore is part of the timing.
+# Run from the repository root: python -m benchmarks.bench_engine [--output results.json]
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import timeit
+from agents import RandomAgent
+from game_engine import GameEngine
+from simulation import build_headless_config, run_game
+from .common import FirstOptionAgent, build_engine, take_cards, set_hand
+
+class ChainAgent(FirstOptionAgent):
+    """
+    Always takes the last option: a counter whenever one is held, the last counter
+    target and all the healing available. Discards like FirstOptionAgent.
+    """
+    def select_action(self, actions, player_id):
+        return actions[-1]
+
+# name -> (setup, calls per sample); setup builds the state and returns the timed callable
+SCENARIOS = {}
+
+def scenario(name, number):
+    def register(setup):
+        SCENARIOS[name] = (setup, number)
+        return setup
+    return register
+
+def _damage_chain(attack_type, depth):
+    """
+    Sets up an attack of attack_type answered by depth counters in a row, and returns a
+    callable processing its whole damage timeline.
+    """
+    game_engine = build_engine(agent_factory=ChainAgent)
+    players = game_engine.get_players()
+    for player in players:
+        set_hand(player, [])
+    attacker = players[0]
+    if attack_type == "magic_bullet":
+        cards = take_cards(game_engine, lambda card: card.is_magic_bullet(), depth + 1)
+        defender = game_engine.get_magic_bullet_target(attacker)
+    else:
+        element_id = next(card.get_element_id() for card in game_engine.get_deck().cards
+                          if card.is_attack() and not card.is_dark_extinction())
+        cards = take_cards(game_engine, lambda card: card.is_attack() and card.get_element_id() == element_id, depth + 1)
+        defender = game_engine.get_attack_target(attacker)[0]
+
+    # hand every counter to the player the previous one targets, as ChainAgent will pick them
+    hands = {player: [] for player in players}
+    source, target = attacker, defender
+    for card in cards[1:]:
+        hands[target].append(card)
+        if attack_type == "magic_bullet":
+            source, target = target, game_engine.get_magic_bullet_target(target)
+        else:
+            source, target = target, game_engine.get_counter_targets(target, source)[-1]
+    for player, hand in hands.items():
+        set_hand(player, hand)
+    snapshot = game_engine.snapshot()
+
+    def run():
+        game_engine.restore(snapshot)
+        attack_event = {
+            'attack_type': attack_type,
+            'attacker': attacker,
+            'defender': defender,
+            'card': cards[0],
+            'damage_amount': 2,
+        }
+        game_engine.process_damage_timeline(attack_event, start_step=1)
+
+    event_manager = game_engine.get_event_manager()
+    profiler = event_manager.enable_profiling()
+    run()
+    event_manager.disable_profiling()
+    if profiler.get_max_damage_depth() != depth + 1:
+        raise Exception(f"Expected {depth + 1} nested damage timelines, got {profiler.get_max_damage_depth()}.")
+    return run
+
+for _depth in range(4):
+    scenario(f"damage_timeline_attack_counters_{_depth}", 2000)(lambda depth=_depth: _damage_chain("attack", depth))
+for _depth in range(4):
+    scenario(f"damage_timeline_magic_bullet_counters_{_depth}", 2000)(lambda depth=_depth: _damage_chain("magic_bullet", depth))
+
+def _full_hand_player():
+    """
+    Returns an engine and its first player holding a full hand of mixed cards.
+    """
+    game_engine = build_engine()
+    player = game_engine.get_players()[0]
+    cards = take_cards(game_engine, lambda card: card.is_attack() and not card.is_dark_extinction(), 2)
+    for predicate in (lambda card: card.is_dark_extinction(), lambda card: card.is_holy_light(),
+                      lambda card: card.is_magic_bullet(), lambda card: card.is_poison()):
+        cards.extend(take_cards(game_engine, predicate, 1))
+    set_hand(player, cards[:player.get_hand_max_size()])
+    return game_engine, player
+
+@scenario("available_actions_full_hand", 20000)
+def _available_actions_full_hand():
+    _, player = _full_hand_player()
+
+    def run():
+        # a changed hand version makes the action generator re-evaluate the card part
+        player.set_hand_max_size(player.get_hand_max_size())
+        player._get_available_actions()
+    return run
+
+@scenario("available_actions_unchanged", 50000)
+def _available_actions_unchanged():
+    _, player = _full_hand_player()
+    return player._get_available_actions
+
+def _counter_actions(attack_type):
+    game_engine, defender = _full_hand_player()
+    attacker = game_engine.get_players()[1]
+    if attack_type == "magic_bullet":
+        card = take_cards(game_engine, lambda card: card.is_magic_bullet(), 1)[0]
+    else:
+        element_id = defender.get_hand_cards()[0].get_element_id()
+        card = take_cards(game_engine, lambda card: card.is_attack() and card.get_element_id() == element_id, 1)[0]
+    attack_event = {
+        'attack_type': attack_type,
+        'attacker': attacker,
+        'defender': defender,
+        'card': card,
+        'damage_amount': 2,
+    }
+    return lambda: defender.get_valid_counter_actions(attack_event)
+
+scenario("counter_actions_attack", 50000)(lambda: _counter_actions("attack"))
+scenario("counter_actions_magic_bullet", 50000)(lambda: _counter_actions("magic_bullet"))
+
+def _deck(cards_left):
+    """
+    Returns an engine whose deck has cards_left cards and every other card in the discards.
+    """
+    game_engine = build_engine()
+    deck = game_engine.get_deck()
+    deck.discards = deck.cards[cards_left:]
+    deck.cards = deck.cards[:cards_left]
+    return game_engine, deck
+
+@scenario("deck_deal", 20000)
+def _deck_deal():
+    _, deck = _deck(cards_left=100)
+    snapshot = deck.snapshot()
+
+    def run():
+        deck.restore(snapshot)
+        deck.deal(2)
+    return run
+
+@scenario("deck_deal_across_reshuffle", 5000)
+def _deck_deal_across_reshuffle():
+    _, deck = _deck(cards_left=1)
+    snapshot = deck.snapshot()
+
+    def run():
+        deck.restore(snapshot)
+        deck.deal(2)
+    return run
+
+@scenario("deck_reset_deck", 5000)
+def _deck_reset_deck():
+    _, deck = _deck(cards_left=0)
+    snapshot = deck.snapshot()
+
+    def run():
+        deck.restore(snapshot)
+        deck.reset_deck()
+    return run
+
+@scenario("exploding_hand", 10000)
+def _exploding_hand():
+    game_engine, player = _full_hand_player()
+    extra_cards = take_cards(game_engine, lambda card: card.is_attack(), 3)
+    snapshot = game_engine.snapshot()
+
+    def run():
+        game_engine.restore(snapshot)
+        # three cards over a full hand: _handle_exploding_hand discards three of nine
+        player.add_cards(extra_cards)
+    return run
+
+def _game(num_players, seed=1):
+    def run():
+        agents = {pid: RandomAgent(seed=pid) for pid in range(1, num_players + 1)}
+        run_game(agents, seed=seed)
+    return run
+
+for _num_players in (4, 6, 8):
+    scenario(f"game_{_num_players}p", 5)(lambda num_players=_num_players: _game(num_players))
+
+@scenario("turn_loop", 20)
+def _turn_loop():
+    # 40 turns of a game whose agents always take the first option, without a winner to stop it early
+    def run():
+        agents = {pid: FirstOptionAgent() for pid in range(1, 5)}
+        GameEngine(build_headless_config(agents, max_turns=40, seed=1)).start_game()
+    return run
+
+def run_scenarios(names=None, repeat=5, scale=1.0):
+    """
+    Times the named scenarios, all of them by default.
+
+    :param repeat: Number of samples per scenario.
+    :param scale: Factor on the number of calls per sample.
+    :return: A dictionary mapping scenario name to its calls per sample and the seconds
+             per call of every sample.
+    """
+    results = {}
+    for name in names or SCENARIOS:
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}")
+        setup, number = SCENARIOS[name]
+        number = max(1, int(number * scale))
+        timed = setup()
+        samples = timeit.repeat(timed, number=number, repeat=repeat)
+        results[name] = {
+            'number': number,
+            'times': [sample / number for sample in samples],
+        }
+    return results
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def collect(names=None, repeat=5, scale=1.0):
+    """
+    Runs the scenarios and returns the results with the commit and Python version they were taken on.
+    """
+    return {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'scenarios': run_scenarios(names, repeat=repeat, scale=scale),
+    }
+
+def format_results(results):
+    lines = [f"{'scenario':<40} {'min us':>12} {'median us':>12}"]
+    for name, result in results['scenarios'].items():
+        lines.append(f"{name:<40} {min(result['times']) * 1e6:>12.2f} {statistics.median(result['times']) * 1e6:>12.2f}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Engine micro-benchmarks")
+    parser.add_argument("--output", default=None, help="JSON file to write the results to")
+    parser.add_argument("--only", nargs='+', default=None, metavar="SCENARIO", help="Scenarios to run, all by default")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per scenario")
+    parser.add_argument("--scale", type=float, default=1.0, help="Factor on the calls per sample")
+    parser.add_argument("--list", action="store_true", help="List the scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(SCENARIOS))
+        return
+    results = collect(args.only, repeat=args.repeat, scale=args.scale)
+    print(format_results(results))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
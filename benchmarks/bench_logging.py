@@ -0,0 +1,41 @@
+# benchmarks/bench_logging.py
+#
+# Measures the cost of debug logging on the damage timeline.
+# Run from the repository root: python -m benchmarks.bench_logging
+
+import timeit
+from .common import build_engine, find_card
+
+def time_damage_timeline(debug, number):
+    game_engine = build_engine(debug=debug)
+    attacker, defender = game_engine.get_players()[0], game_engine.get_players()[1]
+    card = find_card(game_engine, lambda card: card.is_attack())
+    snapshot = game_engine.snapshot()
+
+    def restore():
+        game_engine.restore(snapshot)
+
+    def attack():
+        game_engine.restore(snapshot)
+        attack_event = {
+            'attack_type': "attack",
+            'attacker': attacker,
+            'defender': defender,
+            'card': card,
+            'damage_amount': 2,
+        }
+        game_engine.process_damage_timeline(attack_event, start_step=1)
+
+    restore_time = min(timeit.repeat(restore, number=number, repeat=5)) / number
+    attack_time = min(timeit.repeat(attack, number=number, repeat=5)) / number
+    return attack_time - restore_time
+
+def main(number=5000):
+    off = time_damage_timeline(debug=False, number=number)
+    on = time_damage_timeline(debug=True, number=number)
+    print(f"damage timeline, debug off: {off * 1e6:8.2f} us")
+    print(f"damage timeline, debug on:  {on * 1e6:8.2f} us")
+    print(f"debug logging overhead:     {(on - off) / off * 100:8.1f} %")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/common.py
+
+from agents import BaseAgent
+from game_engine import GameEngine
+from simulation import build_headless_config
+
+class FirstOptionAgent(BaseAgent):
+    """
+    Always takes the first option, which is 'No Response' for counters and no healing.
+    Keeps benchmarked timelines free of branching on agent decisions.
+    """
+    def select_action(self, actions, player_id):
+        return actions[0]
+
+    def select_multiple_actions(self, actions, min_selections, max_selections, player_id):
+        return list(actions[:min_selections])
+
+def build_engine(num_players=4, seed=0, debug=False, agent_factory=FirstOptionAgent):
+    agents = {pid: agent_factory() for pid in range(1, num_players + 1)}
+    config = build_headless_config(agents, seed=seed)
+    config['debug'] = debug
+    return GameEngine(config)
+
+def find_card(game_engine, predicate):
+    """
+    Returns the first card of the deck or a hand satisfying predicate.
+    """
+    cards = list(game_engine.get_deck().cards)
+    for player in game_engine.get_players():
+        cards.extend(player.get_hand_cards())
+    for card in cards:
+        if predicate(card):
+            return card
+    raise ValueError("No card matches the predicate.")
+
+def take_cards(game_engine, predicate, count):
+    """
+    Removes and returns count cards of the deck satisfying predicate, so that the deck
+    cannot deal them again while a benchmark holds them.
+    """
+    deck = game_engine.get_deck()
+    cards = [card for card in deck.cards if predicate(card)][:count]
+    if len(cards) < count:
+        raise ValueError(f"The deck has only {len(cards)} card(s) matching the predicate.")
+    for card in cards:
+        deck.cards.remove(card)
+    return cards
+
+def set_hand(player, cards):
+    """
+    Replaces the hand of player with cards, without recycling the old ones.
+    """
+    player.remove_cards(list(player.get_hand_cards()), recycle=False, exhibition=False)
+    if cards:
+        player.add_cards(list(cards))
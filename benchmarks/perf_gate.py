@@ -0,0 +1,159 @@
+# benchmarks/perf_gate.py
+#
+# Performance regression gate over the scenarios of bench_engine. A baseline file keeps
+# the samples of every scenario; a check runs the scenarios again (or reads a second
+# results file) and fails when a scenario is slower than the baseline by more than the
+# threshold with 95% confidence.
+#
+# Run from the repository root:
+#   python -m benchmarks.perf_gate save [--baseline FILE] [--only SCENARIO ...]
+#   python -m benchmarks.perf_gate check [--baseline FILE] [--threshold 0.1]
+#   python -m benchmarks.perf_gate compare BASE.json NEW.json
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+from .bench_engine import collect
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_REPEAT = 10
+BOOTSTRAP_ROUNDS = 2000
+
+REGRESSED = "regressed"
+SLOWER = "slower"
+FASTER = "faster"
+UNCHANGED = "unchanged"
+
+def _bootstrap_ratio(base, new, rounds, rng):
+    """
+    Returns the 2.5 and 97.5 percentiles of median(new) / median(base) over resampled samples.
+    """
+    ratios = []
+    for _ in range(rounds):
+        base_median = statistics.median(rng.choices(base, k=len(base)))
+        new_median = statistics.median(rng.choices(new, k=len(new)))
+        ratios.append(new_median / base_median)
+    ratios.sort()
+    return ratios[int(rounds * 0.025)], ratios[min(rounds - 1, int(rounds * 0.975))]
+
+def compare_scenario(base, new, threshold, rounds=BOOTSTRAP_ROUNDS, seed=0):
+    """
+    Compares two lists of seconds-per-call samples of one scenario.
+
+    The delta is the relative change of the median, with a 95% bootstrap confidence
+    interval. The scenario regressed if even the low end of the interval is slower than
+    threshold; it is slower or faster if the interval lies entirely on one side of no change.
+
+    :return: A dictionary with the delta, the interval and the verdict.
+    """
+    if not base or not new:
+        raise ValueError("Both runs need at least one sample.")
+    delta = statistics.median(new) / statistics.median(base) - 1
+    low, high = _bootstrap_ratio(base, new, rounds, random.Random(seed))
+    low, high = low - 1, high - 1
+    if low > threshold:
+        verdict = REGRESSED
+    elif low > 0:
+        verdict = SLOWER
+    elif high < 0:
+        verdict = FASTER
+    else:
+        verdict = UNCHANGED
+    return {'delta': delta, 'low': low, 'high': high, 'verdict': verdict}
+
+def compare_results(baseline, current, threshold):
+    """
+    Compares the scenarios of two bench_engine results.
+
+    :return: A dictionary mapping scenario name to its comparison, or None for a scenario
+             that is not in the baseline.
+    """
+    comparisons = {}
+    for name, result in current['scenarios'].items():
+        base = baseline['scenarios'].get(name)
+        comparisons[name] = None if base is None else compare_scenario(base['times'], result['times'], threshold)
+    return comparisons
+
+def format_comparisons(baseline, current, comparisons):
+    lines = [f"{'scenario':<40} {'base us':>10} {'new us':>10} {'delta':>8} {'95% interval':>19}  verdict"]
+    for name, comparison in comparisons.items():
+        new = statistics.median(current['scenarios'][name]['times']) * 1e6
+        if comparison is None:
+            lines.append(f"{name:<40} {'':>10} {new:>10.2f} {'':>8} {'':>19}  no baseline")
+            continue
+        base = statistics.median(baseline['scenarios'][name]['times']) * 1e6
+        interval = f"[{comparison['low'] * 100:+.1f}%, {comparison['high'] * 100:+.1f}%]"
+        lines.append(f"{name:<40} {base:>10.2f} {new:>10.2f} {comparison['delta'] * 100:>+7.1f}% {interval:>19}  "
+                     f"{comparison['verdict']}")
+    return "\n".join(lines)
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+def save_results(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+def save_baseline(path, names=None, repeat=DEFAULT_REPEAT, scale=1.0):
+    """
+    Runs the scenarios and stores them as the baseline. With names, only those scenarios
+    are replaced and the others stay as they were.
+    """
+    results = collect(names, repeat=repeat, scale=scale)
+    if names and os.path.exists(path):
+        baseline = load_results(path)
+        baseline['scenarios'].update(results['scenarios'])
+        results['scenarios'] = baseline['scenarios']
+    save_results(results, path)
+    return results
+
+def _report(baseline, current, threshold):
+    comparisons = compare_results(baseline, current, threshold)
+    print(format_comparisons(baseline, current, comparisons))
+    regressed = [name for name, comparison in comparisons.items()
+                 if comparison is not None and comparison['verdict'] == REGRESSED]
+    if regressed:
+        print(f"{len(regressed)} scenario(s) regressed by more than {threshold * 100:.0f}%: {', '.join(regressed)}")
+        return 1
+    print(f"No scenario regressed by more than {threshold * 100:.0f}%.")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performance regression gate")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("save", "check"):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results file")
+        subparser.add_argument("--only", nargs='+', default=None, metavar="SCENARIO", help="Scenarios to run, all by default")
+        subparser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Samples per scenario")
+        subparser.add_argument("--scale", type=float, default=1.0, help="Factor on the calls per sample")
+    subparsers.choices["check"].add_argument("--threshold", type=float, default=0.1,
+                                             help="Relative slowdown that fails the check")
+    subparsers.choices["check"].add_argument("--output", default=None, help="JSON file to write the new results to")
+    compare = subparsers.add_parser("compare")
+    compare.add_argument("base", help="Baseline results file")
+    compare.add_argument("new", help="New results file")
+    compare.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown that fails the check")
+    args = parser.parse_args(argv)
+
+    if args.command == "save":
+        results = save_baseline(args.baseline, args.only, repeat=args.repeat, scale=args.scale)
+        print(f"Saved {len(results['scenarios'])} scenario(s) to {args.baseline}.")
+        return 0
+    if args.command == "check":
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run the save command first.")
+            return 2
+        baseline = load_results(args.baseline)
+        current = collect(args.only, repeat=args.repeat, scale=args.scale)
+        if args.output:
+            save_results(current, args.output)
+        return _report(baseline, current, args.threshold)
+    return _report(load_results(args.base), load_results(args.new), args.threshold)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,37 +1,89 @@
 # client/game_client.py
 
-import socket
-import json
-import threading
+import asyncio
+from views.public_state import apply_delta, format_public_state
+from server.protocol import encode_message, read_message
 
 class GameClient:
-    def __init__(self, host, port):
+    def __init__(self, host, port, table=None, debug=False):
         self.host = host
         self.port = port
-        self.socket = None
+        self.table = table
+        self.debug = debug
+        self.reader = None
+        self.writer = None
         self.player_id = None
+        self.public_state = None
+        self.public_fields = None
 
     def connect(self):
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.connect((self.host, self.port))
+        asyncio.run(self.run())
+
+    async def run(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
         print(f"Connected to server at {self.host}:{self.port}")
-        threading.Thread(target=self.receive_messages).start()
+        await self.send_message({"type": "join", "table": self.table})
+        try:
+            await self.receive_messages()
+        finally:
+            self.writer.close()
 
-    def receive_messages(self):
+    async def receive_messages(self):
         while True:
-            try:
-                data = self.socket.recv(1024).decode('utf-8')
-                if not data:
-                    break
-                self.process_server_message(json.loads(data))
-            except Exception as e:
-                print(f"Error receiving message: {e}")
+            message = await read_message(self.reader)
+            if message is None:
+                print("Disconnected from server.")
                 break
-        self.socket.close()
+            await self.process_server_message(message)
 
-    def process_server_message(self, message):
-        # Process messages from the server and update local game state
-        pass
+    async def _input(self, prompt):
+        # input() blocks, so it runs outside the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+    async def process_server_message(self, message):
+        message_type = message['type']
+        if message_type == 'batch':
+            for batched_message in message['messages']:
+                await self.process_server_message(batched_message)
+        elif message_type == 'welcome':
+            self.player_id = message['player_id']
+            print(f"You are player {self.player_id} at table {message['table']}.")
+        elif message_type == 'public_state':
+            self.public_state = message['state']
+            self.public_fields = message['fields']
+            print(format_public_state(self.public_state))
+        elif message_type == 'delta':
+            apply_delta(self.public_state, self.public_fields, message['changes'])
+            print(format_public_state(self.public_state))
+        elif message_type in ('message', 'error'):
+            if self.debug or not message.get('debug', False):
+                print(message['content'])
+        elif message_type == 'action_selection':
+            for idx, action in enumerate(message['actions']):
+                print(f"{idx}: {action}")
+            choice = await self._ask_int("Select an action number: ")
+            await self.send_message({"type": message_type, "selected_action": choice})
+        elif message_type == 'yes_no_prompt':
+            choice = (await self._input(f"{message['message']} [Y/N]: ")).strip().lower()
+            await self.send_message({"type": message_type, "choice": choice == 'y'})
+        elif message_type == 'multiple_action_selection':
+            for idx, action in enumerate(message['actions']):
+                print(f"{idx}: {action}")
+            choices = await self._input(f"Select between {message['min_selections']} and "
+                                        f"{message['max_selections']} action number(s), separated by spaces: ")
+            try:
+                selected = [int(choice) for choice in choices.split()]
+            except ValueError:
+                selected = []
+            await self.send_message({"type": message_type, "selected_actions": selected})
+
+    async def _ask_int(self, prompt):
+        while True:
+            try:
+                return int(await self._input(prompt))
+            except ValueError:
+                print("Invalid input. Please enter a number.")
 
-    def send_message(self, message):
-        self.socket.send(json.dumps(message).encode('utf-8'))
+    async def send_message(self, message):
+        self.writer.write(encode_message(message))
+        await self.writer.drain()
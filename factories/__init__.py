@@ -2,8 +2,10 @@
 
 from .character_factory import CharacterFactory
 from .action_factory import ActionFactory
+from .action_generator import LegalActionGenerator
 
 __all__ = [
     'CharacterFactory',
-    'ActionFactory'
+    'ActionFactory',
+    'LegalActionGenerator'
 ]
\ No newline at end of file
@@ -46,6 +46,8 @@ class ActionFactory:
         self._card_actions = CARD_ACTIONS
         self._counter_card_actions = COUNTER_CARD_ACTIONS
         self._special_actions = SPECIAL_ACTIONS
+        # card traits -> card action types matching cards with those traits
+        self._card_action_types = {}
     
     def create_character_action(self):
         actions = []
@@ -58,13 +60,39 @@ class ActionFactory:
     def create_no_response_action(self):
         return [NoResponseAction(player=self._player, game_engine=self._game_engine)]
     
+    def get_card_action_types(self, card):
+        """
+        Returns the card action types that can ever be played with card.
+        """
+        key = card.get_traits()
+        action_types = self._card_action_types.get(key)
+        if action_types is None:
+            action_types = tuple(action_type for action_type in self._card_actions if action_type.matches_card(card))
+            self._card_action_types[key] = action_types
+        return action_types
+
     def create_card_action(self, card):
         card_actions = []
-        for action_type in self._card_actions:
+        for action_type in self.get_card_action_types(card):
             action = action_type(player=self._player, game_engine=self._game_engine, card=card)
             if action.available():
                 card_actions.append(action)
         return card_actions
+
+    def create_card_candidates(self, card):
+        """
+        Returns one action per type matching card, whether or not it is available now.
+        """
+        return tuple(action_type(player=self._player, game_engine=self._game_engine, card=card)
+                     for action_type in self.get_card_action_types(card))
+
+    def create_character_candidates(self):
+        return tuple(action_type(player=self._player, game_engine=self._game_engine)
+                     for action_type in self._character_actions)
+
+    def create_special_candidates(self):
+        return tuple(action_type(player=self._player, game_engine=self._game_engine)
+                     for action_type in self._special_actions)
     
     def create_special_action(self):
         special_actions = []
@@ -74,11 +102,13 @@ class ActionFactory:
                 special_actions.append(action)
         return special_actions
     
-    def create_counter_card_action(self, attack_event, card):
+    def create_counter_card_action(self, attack_event, card, counter_targets=None):
         counter_card_actions = []
         for action_type in self._counter_card_actions:
+            if not action_type.matches_card(card):
+                continue
             action = action_type(player=self._player, game_engine=self._game_engine, 
-                                 attack_event=attack_event, card=card)
+                                 attack_event=attack_event, card=card, counter_targets=counter_targets)
             if action.available():
                 counter_card_actions.append(action)
         return counter_card_actions
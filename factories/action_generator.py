@@ -0,0 +1,77 @@
+# factories/action_generator.py
+
+class LegalActionGenerator:
+    """
+    Builds a player's action menu without rebuilding it from scratch every time.
+
+    Action objects are created once and reused: one set per card from the action types
+    matching the card's traits, and one set of special actions. The card part of the menu
+    is only re-evaluated when the hand or the attack/magic availability changes, and the
+    special part only when action points, hand size or jewels change.
+    """
+    def __init__(self, player, action_factory):
+        self._player = player
+        self._action_factory = action_factory
+        self._game_engine = action_factory._game_engine
+        self._character_candidates = action_factory.create_character_candidates()
+        self._special_candidates = action_factory.create_special_candidates()
+        self._card_candidates = {}
+        self._card_key = None
+        self._card_part = ()
+        self._special_key = None
+        self._special_part = ()
+
+    def _get_card_candidates(self, card):
+        candidates = self._card_candidates.get(card)
+        if candidates is None:
+            candidates = self._action_factory.create_card_candidates(card)
+            self._card_candidates[card] = candidates
+        return candidates
+
+    def _card_state_key(self):
+        player = self._player
+        return (
+            player.get_hand_version(),
+            player.can_perform_action("attack"),
+            player.can_perform_action("magic"),
+            self._game_engine.has_targetable_player('weakness'),
+            self._game_engine.has_targetable_player('holy_shield'),
+        )
+
+    def _special_state_key(self):
+        player = self._player
+        return (
+            player.can_perform_action("special"),
+            player.get_hand_size(),
+            player.get_hand_max_size(),
+            player.get_team().get_jewels().snapshot(),
+            player.get_jewels().snapshot(),
+        )
+
+    def get_card_actions(self):
+        key = self._card_state_key()
+        if key != self._card_key:
+            card_part = []
+            for card in self._player.get_hand_cards():
+                for action in self._get_card_candidates(card):
+                    if action.available():
+                        card_part.append(action)
+            self._card_part = tuple(card_part)
+            self._card_key = key
+        return self._card_part
+
+    def get_special_actions(self):
+        key = self._special_state_key()
+        if key != self._special_key:
+            self._special_part = tuple(action for action in self._special_candidates if action.available())
+            self._special_key = key
+        return self._special_part
+
+    def get_available_actions(self):
+        """
+        Returns a new list of the currently available actions, in menu order.
+        """
+        available_actions = [action for action in self._character_candidates if action.available()]
+        available_actions.extend(self.get_card_actions())
+        available_actions.extend(self.get_special_actions())
+        return available_actions
@@ -2,5 +2,17 @@
 
 from .engine import GameEngine
 from .event_manager import EventManager
+from .emit_profiler import EmitProfiler
+from .journal import GameJournal, JournaledGame, read_journal, load_journal
+from .replay import replay_game
 
-__all__ = ['GameEngine', 'EventManager']
\ No newline at end of file
+__all__ = [
+    'GameEngine',
+    'EventManager',
+    'EmitProfiler',
+    'GameJournal',
+    'JournaledGame',
+    'read_journal',
+    'load_journal',
+    'replay_game',
+]
\ No newline at end of file
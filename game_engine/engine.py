@@ -1,26 +1,56 @@
 # game_engine/engine.py
 
+import random
+from collections import defaultdict
 from .event_manager import EventManager
-from views import LocalConsoleInterface, NetworkedConsoleInterface
+from .journal import RecordingInterface
+from views import LocalConsoleInterface, NetworkedConsoleInterface, HeadlessInterface
 from models import Team, Deck
 from models.effect import HolyShieldEffect
+from models.action.base_action import ActionCanceled
 from timeline import GameTimeline, DamageTimeline
 from factories import CharacterFactory
 from factories.action_factory import COUNTER_CARD_ACTIONS
 
 class GameEngine:
     def __init__(self, config):
+        self._config = config
         self._networked = config.get('networked', False)
-        if self._networked:
+        if config.get('interface') is not None:
+            self._interface = config['interface']
+        elif self._networked:
             self._interface = NetworkedConsoleInterface(game_server=config.get('game_server', None), 
                                                         debug=config.get('debug', False))
+        elif config.get('headless', False):
+            self._interface = HeadlessInterface(agents=config['agents'], debug=config.get('debug', False))
         else:
             self._interface = LocalConsoleInterface(debug=config.get('debug', False))
+        self._seed = config.get('seed', None)
+        self._journal = config.get('journal', None)
+        if self._journal is not None:
+            # a replay needs the deck order, so a journaled game always has a seed
+            if self._seed is None:
+                self._seed = random.getrandbits(64)
+            self._journal.begin_game({
+                'players': config['player'],
+                'deck_path': config['deck_path'],
+                'max_turns': config.get('max_turns', None),
+                'seed': self._seed,
+            })
+            self._interface = RecordingInterface(self._interface, self._journal)
         self._event_manager = EventManager(self._interface)
+        self._event_manager.journal = self._journal
         self._setup_game(config)
         self._current_turn = 0
+        self._turn_count = 0
+        self._max_turns = config.get('max_turns', None)
+        self._winner = None
         self._running = True
+        self._initial_state = self.snapshot()
         self._setup_event_handlers()
+        if config.get('headless', False):
+            for agent in config['agents'].values():
+                agent.bind(self)
 
     def _setup_game(self, config):
         # Initialize teams
@@ -28,9 +58,17 @@ class GameEngine:
         self._blue_team = Team(is_red=False, game_engine=self)
         
         # Initialize single deck
-        self._deck = Deck(config['deck_path'], interface=self._interface)
+        self._deck = Deck(config['deck_path'], interface=self._interface, seed=self._seed)
         
         # Initialize players
+        self._create_players(config)
+        for player in self._players:
+            player.draw_initial_hand()
+        
+        self._red_team.add_jewel(3, 2)
+        self._blue_team.add_jewel(3, 2)
+
+    def _create_players(self, config):
         self._players = []
         for player_config in config['player']:
             team = self._red_team if player_config['team'] == 'red' else self._blue_team
@@ -41,12 +79,51 @@ class GameEngine:
                 'game_engine': self
             }
             player = CharacterFactory.create_character(character_config)
-            player.draw_initial_hand()
             self._players.append(player)
             team.add_player(player)
-        
-        self._red_team.add_jewel(3, 2)
-        self._blue_team.add_jewel(3, 2)
+        self._build_seating()
+
+    def _build_seating(self):
+        """
+        Precomputes the seating tables used by the targeting queries. Seats never change
+        during a game, so these are built once, right after the players are created.
+        """
+        num_players = len(self._players)
+        self._players_by_id = {player.get_id(): player for player in self._players}
+        self._seats_order = {}
+        self._seat_ranks = {}
+        self._next_opponent = {}
+        for index, player in enumerate(self._players):
+            following = [self._players[(index + i) % num_players] for i in range(1, num_players)]
+            self._seats_order[player] = [p.get_id() for p in following]
+            # the player's own seat comes last
+            self._seat_ranks[player] = {p.get_id(): rank for rank, p in enumerate(following + [player])}
+            self._next_opponent[player] = next((p for p in following if p.get_team() != player.get_team()), None)
+        self._opponents = {
+            self._red_team: tuple(p for p in self._players if p.get_team() == self._blue_team),
+            self._blue_team: tuple(p for p in self._players if p.get_team() == self._red_team),
+        }
+        self._rebuild_targetable()
+
+    def _rebuild_targetable(self):
+        # effect type -> players that currently cannot be targeted by it
+        self._untargetable = defaultdict(set)
+        for player in self._players:
+            for state_type, value in player.get_state().items():
+                if state_type.startswith('can_be_') and not value:
+                    self._untargetable[state_type[len('can_be_'):]].add(player)
+
+    def set_player_targetable(self, player, effect_type, value):
+        """
+        Called by players whenever one of their can_be_* states changes.
+        """
+        if value:
+            self._untargetable[effect_type].discard(player)
+        else:
+            self._untargetable[effect_type].add(player)
+
+    def has_targetable_player(self, effect_type):
+        return len(self._untargetable[effect_type]) < len(self._players)
 
     def _setup_event_handlers(self):
         for event_type, handlers in GameTimeline.items():
@@ -62,66 +139,104 @@ class GameEngine:
                     self._event_manager.subscribe(event_type, handler, priority=priority, name=handler_name)
 
     def start_game(self):
-        self._interface.send_message("\n=== Game Start ===\n", debug=True)
+        self._interface.log_debug("\n=== Game Start ===\n")
         self._event_manager.emit("game_initialization")
         while self._running:
-            current_player = self._players[self._current_turn]
-            self.display_public_information()
-            self._interface.send_message(f"\n--- Player {current_player.get_id()}'s Turn ---", broadcast=True)
-            
-            # Begin player's turn
-            self._event_manager.emit("before_round_start", player=current_player)
-            self._event_manager.emit("round_start_phase", player=current_player)
-            continue_turn = self._event_manager.emit("before_action_phase", player=current_player)
-            if continue_turn:
-                self._event_manager.emit("action_phase_start", player=current_player)
-                self._event_manager.emit("during_action_phase", player=current_player)
-            self._event_manager.emit("turn_end_phase", player=current_player)
-            self._next_turn()
+            self.play_turn()
+        if self._journal is not None:
+            self._journal.end_game(None if self._winner is None else (0 if self._winner.is_red() else 1), self._turn_count)
+
+    def play_turn(self):
+        """
+        Plays the turn of the current player and moves on to the next one. A game
+        restored from a snapshot taken between turns can be continued turn by turn.
+        """
+        current_player = self._players[self._current_turn]
+        self.display_public_information()
+        self._interface.log_info("\n--- Player {}'s Turn ---", current_player.get_id(), broadcast=True)
+        
+        # Begin player's turn
+        self._emit_phase("before_round_start", current_player)
+        self._emit_phase("round_start_phase", current_player)
+        continue_turn = self._emit_phase("before_action_phase", current_player)
+        if continue_turn and self._running:
+            self._emit_phase("action_phase_start", current_player)
+            self._emit_phase("during_action_phase", current_player)
+        self._emit_phase("turn_end_phase", current_player)
+        self._next_turn()
+        if self._max_turns is not None and self._turn_count >= self._max_turns and self._running:
+            self._interface.log_info("Game ended after {} turns without a winner.", self._turn_count, broadcast=True)
+            self._running = False
+        self._interface.flush()
+
+    def new_game(self, seed=None):
+        """
+        Sets up a new game on this engine, reusing its players, teams, deck and handlers:
+        the state goes back to how it was after setup, and the deck is shuffled and the
+        hands dealt as a new engine with seed would. Call start_game() to play it.
+        """
+        self.restore(self._initial_state)
+        self._seed = seed
+        self._deck.new_game(seed)
+        for player in self._players:
+            player.remove_cards(list(player.get_hand_cards()), recycle=False, exhibition=False)
+        for player in self._players:
+            player.draw_initial_hand()
+
+    def _emit_phase(self, event_type, player):
+        """
+        Emits a turn phase of player, then flushes the messages queued during the phase.
+        """
+        result = self._event_manager.emit(event_type, subject=player.get_id(), player=player)
+        self._interface.flush()
+        return result
     
     # Game Timeline
     def _on_game_initialization(self, event):
-        self._interface.send_message("Game initialization started.", debug=True)
+        self._interface.log_debug("Game initialization started.")
         # Add logic for game initialization here
 
     def _on_before_round_start(self, event):
         player = event.data['player']
-        self._interface.send_message(f"Starting round for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("Starting round for Player {}.", player.get_id())
         # Add logic for before round start here
 
     def _on_round_start_phase(self, event):
         player = event.data['player']
-        self._interface.send_message(f"Round start phase for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("Round start phase for Player {}.", player.get_id())
         # Add logic for round start phase here
 
     def _on_before_action_phase(self, event):
         player = event.data['player']
-        self._interface.send_message(f"Before action phase for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("Before action phase for Player {}.", player.get_id())
         # Add logic for before action phase here
 
     def _on_action_phase_start(self, event):
         player = event.data['player']
-        self._interface.send_message(f"Action phase started for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("Action phase started for Player {}.", player.get_id())
         # Add logic for action phase start here
 
     def _on_during_action_phase(self, event):
         player = event.data['player']
-        self._interface.send_message(f"During action phase for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("During action phase for Player {}.", player.get_id())
         player.perform_actions()
         # Add logic for during action phase here
 
     def _on_after_action_phase(self, event):
         player = event.data['player']
-        self._interface.send_message(f"After action phase for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("After action phase for Player {}.", player.get_id())
         player.after_action(event)
         
     def _on_turn_end_phase(self, event):
         player = event.data['player']
-        self._interface.send_message(f"Turn end phase for Player {player.get_id()}.", debug=True)
+        self._interface.log_debug("Turn end phase for Player {}.", player.get_id())
         player.reset_actions()
     
     def end_game(self, is_red_team_win):
-        self._interface.send_message(f"Game ended. {'Red Team' if is_red_team_win else 'Blue Team'} wins.", broadcast=True)
+        if not self._running:
+            return
+        self._interface.log_info("Game ended. {} wins.", 'Red Team' if is_red_team_win else 'Blue Team', broadcast=True)
+        self._winner = self._red_team if is_red_team_win else self._blue_team
         self._running = False
 
     # Damage Timeline
@@ -131,7 +246,7 @@ class GameEngine:
         attacker = attack_event['attacker']
         defender = attack_event['defender']
         card = attack_event.get('card', None)
-        self._interface.send_message(f"[Step 1] {attacker.get_id()} {attack_type} {defender.get_id()} with {card}.", broadcast=True)
+        self._interface.log_info("[Step 1] {} {} {} with {}.", attacker.get_id(), attack_type, defender.get_id(), card, broadcast=True)
 
     def _on_hit_determination(self, event):
         attack_event = event.data['attack_event']
@@ -139,7 +254,7 @@ class GameEngine:
         defender = attack_event['defender']
         if attack_event.get('forced hit', False):
             attack_event['hit'] = True
-            self._interface.send_message(f"[Step 2] {attacker.get_id()}'s attack forced hit {defender.get_id()}.", broadcast=True)
+            self._interface.log_info("[Step 2] {}'s attack forced hit {}.", attacker.get_id(), defender.get_id(), broadcast=True)
             self._event_manager.emit("damage_timeline_step_2_hit", attack_event=attack_event)
             return
 
@@ -151,7 +266,7 @@ class GameEngine:
         defender_action = self._interface.prompt_action_selection(valid_counter_actions, defender.get_id())
         if isinstance(defender_action, tuple(COUNTER_CARD_ACTIONS)):
             attack_event['hit'] = False
-            self._interface.send_message(f"[Step 2] {defender.get_id()} counters with {defender_action}.", broadcast=True)
+            self._interface.log_info("[Step 2] {} counters with {}.", defender.get_id(), defender_action, broadcast=True)
             self._event_manager.emit("damage_timeline_step_2_miss", attack_event=attack_event)
             defender_action.execute()
             return False
@@ -160,13 +275,13 @@ class GameEngine:
             defender_holy_shield_effect = defender.get_effects(HolyShieldEffect)
             if defender_holy_shield_effect:
                 attack_event['hit'] = False
-                self._interface.send_message(f"[Step 2] {defender.get_id()} has Holy Shield, attack is blocked.", broadcast=True)
+                self._interface.log_info("[Step 2] {} has Holy Shield, attack is blocked.", defender.get_id(), broadcast=True)
                 defender_holy_shield_effect[0].execute()
                 self._event_manager.emit("damage_timeline_step_2_miss", attack_event=attack_event)
                 return False
             else:
                 attack_event['hit'] = True
-                self._interface.send_message(f"[Step 2] {defender.get_id()} takes the hit.", broadcast=True)
+                self._interface.log_info("[Step 2] {} takes the hit.", defender.get_id(), broadcast=True)
                 self._event_manager.emit("damage_timeline_step_2_hit", attack_event=attack_event)
         else:
             raise Exception(f"Invalid action type: {type(defender_action)}")
@@ -175,37 +290,37 @@ class GameEngine:
         attack_event = event.data['attack_event']
         attacker = attack_event['attacker']
         defender = attack_event['defender']
-        self._interface.send_message(f"[Step 2] {attacker.get_id()}'s attack hits {defender.get_id()}.", debug=True)
+        self._interface.log_debug("[Step 2] {}'s attack hits {}.", attacker.get_id(), defender.get_id())
 
     def _on_hit_determination_miss(self, event):
         attack_event = event.data['attack_event']
         attacker = attack_event['attacker']
         defender = attack_event['defender']
-        self._interface.send_message(f"[Step 2] {attacker.get_id()}'s attack misses {defender.get_id()}.", debug=True)
+        self._interface.log_debug("[Step 2] {}'s attack misses {}.", attacker.get_id(), defender.get_id())
 
     def _on_damage_calculation(self, event):
         attack_event = event.data['attack_event']
         if attack_event.get('hit', True) is False:
             raise Exception("Damage calculation should only happen when there is a hit.")
         
-        self._interface.send_message(f"[Step 3] Calculated damage: {attack_event['damage_amount']}.", debug=True)
+        self._interface.log_debug("[Step 3] Calculated damage: {}.", attack_event['damage_amount'])
 
     def _on_healing_response(self, event):
         attack_event = event.data['attack_event']
         if attack_event['damage_amount'] <= 0:
-            self._interface.send_message("[Step 4] No healing response needed.", debug=True)
+            self._interface.log_debug("[Step 4] No healing response needed.")
             return
         if not attack_event.get('can_heal', True):
-            self._interface.send_message("[Step 4] Defender cannot heal.", debug=True)
+            self._interface.log_debug("[Step 4] Defender cannot heal.")
             return
 
         defender = attack_event['defender']
         damage = attack_event['damage_amount']
-        self._interface.send_message(f"[Step 4] {defender.get_id()} has {damage} damage to respond to.", debug=True)
+        self._interface.log_debug("[Step 4] {} has {} damage to respond to.", defender.get_id(), damage)
         
         healing_used = defender.respond_to_damage(damage)
         attack_event['healing_used'] = healing_used.get('healing', 0)
-        self._interface.send_message(f"[Step 4] {defender.get_id()} uses {attack_event['healing_used']} healing.", broadcast=True)
+        self._interface.log_info("[Step 4] {} uses {} healing.", defender.get_id(), attack_event['healing_used'], broadcast=True)
 
     def _on_actual_damage_application(self, event):
         attack_event = event.data['attack_event']
@@ -213,7 +328,7 @@ class GameEngine:
         if damage < 0:
             raise Exception("Damage should not be negative.")
         attack_event['final_damage'] = damage
-        self._interface.send_message(f"[Step 5] {attack_event['defender'].get_id()} will receive {damage} damage after healing.", debug=True)
+        self._interface.log_debug("[Step 5] {} will receive {} damage after healing.", attack_event['defender'].get_id(), damage)
 
     def _on_damage_reception(self, event):
         attack_event = event.data['attack_event']
@@ -222,25 +337,25 @@ class GameEngine:
             defender = attack_event['defender']
             defender.take_damage(final_damage, damage_type=attack_event.get('attack_type', 'attack'), event=event)
         else:
-            self._interface.send_message("[Step 6] No actual damage to apply.", debug=True)
+            self._interface.log_debug("[Step 6] No actual damage to apply.")
         
         attacker_team = attack_event['attacker'].get_team()
         if attack_event.get('attack_type', 'attack') == 'attack':
             if attacker_team.can_add_jewel(gem_add=1):
                 attacker_team.add_jewel(gem_add=1)
-                self._interface.send_message(f"Attacker's team gains 1 Gem for a successful attack.", debug=True)
+                self._interface.log_debug("Attacker's team gains 1 Gem for a successful attack.")
             elif attacker_team.can_remove_jewel(crystal_remove=1):
                 attacker_team.remove_jewel(crystal_remove=1)
                 attacker_team.add_jewel(gem_add=1)
-                self._interface.send_message(f"Attacker's team loses 1 Crystal and gains 1 Gem for a successful attack.", debug=True)
+                self._interface.log_debug("Attacker's team loses 1 Crystal and gains 1 Gem for a successful attack.")
             else:
-                self._interface.send_message("Attacker's team cannot gain a gem or lose a crystal for a successful attack.", debug=True)
+                self._interface.log_debug("Attacker's team cannot gain a gem or lose a crystal for a successful attack.")
         elif attack_event.get('attack_type', 'attack') == 'counter':
             if attacker_team.can_add_jewel(crystal_add=1):
                 attacker_team.add_jewel(crystal_add=1)
-                self._interface.send_message(f"Attacker's team gains 1 Crystal for a successful counterattack.", debug=True)
+                self._interface.log_debug("Attacker's team gains 1 Crystal for a successful counterattack.")
             else:
-                self._interface.send_message("Attacker's team cannot gain a crystal for a successful counterattack.", debug=True)
+                self._interface.log_debug("Attacker's team cannot gain a crystal for a successful counterattack.")
 
     # Game Logic
     def process_damage_timeline(self, attack_event, start_step=1):
@@ -251,7 +366,7 @@ class GameEngine:
                              Expected keys: 'attacker', 'defender', 'card', 'damage_type'
         :param start_step: The step to start processing from (1 to 6).
         """
-        self._interface.send_message(f"\n=== Processing Damage Timeline for Attack: {attack_event} ===", debug=True)
+        self._interface.log_debug("\n=== Processing Damage Timeline for Attack: {} ===", attack_event)
         
         steps = [
             "damage_timeline_step_1",
@@ -264,18 +379,30 @@ class GameEngine:
         
         for step in steps[start_step-1:]:
             if not self._event_manager.emit(step, attack_event=attack_event):
-                self._interface.send_message(f"Damage timeline processing stopped at {step}.", debug=True)
+                self._interface.log_debug("Damage timeline processing stopped at {}.", step)
                 break
     
     def _next_turn(self):
+        self._turn_count += 1
         self._current_turn = (self._current_turn + 1) % len(self._players)
-        self._interface.send_message(f"--- Next Turn: Player {self._players[self._current_turn].get_id()} ---", broadcast=True)
+        self._interface.log_info("--- Next Turn: Player {} ---", self._players[self._current_turn].get_id(), broadcast=True)
     
     def display_public_information(self):
-        self._interface.send_message("\n--- Public Information ---", broadcast=True)
-        self._interface.send_message(f"{self._red_team}", broadcast=True)
-        self._interface.send_message(f"{self._blue_team}", broadcast=True)
-        self._interface.send_message("--------------------------\n", broadcast=True)
+        self._interface.display_public_information(self)
+
+    def get_public_state(self):
+        """
+        Returns everything every player may see, as a JSON-compatible dict.
+        Player ids are turned into strings so the dict survives a JSON round trip.
+        """
+        return {
+            'current_player': self._players[self._current_turn].get_id(),
+            'teams': {
+                'red': self._red_team.get_public_state(),
+                'blue': self._blue_team.get_public_state(),
+            },
+            'players': {str(player.get_id()): player.get_public_state() for player in self._players},
+        }
 
     def get_opposite_team(self, team):
         """
@@ -287,33 +414,31 @@ class GameEngine:
             return self._red_team
 
     def get_magic_bullet_target(self, player):
-        current_player_index = self._players.index(player)
-        num_players = len(self._players)
-        
-        for i in range(1, num_players):
-            next_player_index = (current_player_index + i) % num_players
-            next_player = self._players[next_player_index]
-            
-            if next_player.get_team() != player.get_team():
-                return next_player
-        
-        raise ValueError("No player from a different team found")
+        next_player = self._next_opponent[player]
+        if next_player is None:
+            raise ValueError("No player from a different team found")
+        return next_player
     
+    def get_counter_targets(self, player, attacker):
+        """
+        Returns the opponents player can counter an attack from attacker to, possibly none.
+        """
+        untargetable = self._untargetable['counter']
+        return [p for p in self._opponents[player.get_team()]
+                if p is not attacker and p not in untargetable]
+
     def get_attack_target(self, player, counter=False, attacker=None):
-        candidates = []
-        for p in self._players:
-            if p.get_team() != player.get_team():
-                if not counter and p.can_be_targeted('attack'):
-                    candidates.append(p)
-                elif counter and p != attacker and p.can_be_targeted('counter'):
-                    candidates.append(p)
+        if counter:
+            candidates = self.get_counter_targets(player, attacker)
+        else:
+            untargetable = self._untargetable['attack']
+            candidates = [p for p in self._opponents[player.get_team()] if p not in untargetable]
         if not candidates:
-            raise ValueError("No available opponents to counter. Action canceled.")
+            raise ActionCanceled("No available opponents to counter. Action canceled.")
         
         return candidates
     
     def get_magic_target(self, player, card):
-        candidates = []
         if card.is_poison():
             magic_type = 'poison'
         elif card.is_weakness():
@@ -323,23 +448,112 @@ class GameEngine:
         else:
             raise ValueError("Invalid card type for magic action.")
         
-        for p in self._players:
-            if p.can_be_targeted(magic_type):
-                candidates.append(p)
+        untargetable = self._untargetable[magic_type]
+        candidates = [p for p in self._players if p not in untargetable]
         if not candidates:
-            raise ValueError(f"No available opponents to {magic_type}. Action canceled.")
+            raise ActionCanceled(f"No available opponents to {magic_type}. Action canceled.")
         
         return candidates
 
     def get_seats_order(self, player):
-        current_player_index = self._players.index(player)
-        num_players = len(self._players)
-        seats = []
-        for i in range(1, num_players):
-            next_player_index = (current_player_index + i) % num_players
-            seats.append(self._players[next_player_index].get_id())
-        return seats
+        return list(self._seats_order[player])
+
+    def get_seat_ranks(self, player):
+        """
+        Returns a dict mapping each player id to its position in the seats following player,
+        player's own id ranking last. Do not modify it.
+        """
+        return self._seat_ranks[player]
     
+    def get_players(self):
+        return self._players
+
+    def get_player(self, player_id):
+        return self._players_by_id.get(player_id)
+
+    def get_teams(self):
+        return self._red_team, self._blue_team
+
+    def is_running(self):
+        return self._running
+
+    def get_winner(self):
+        """
+        Returns the winning team, or None if the game is still running or ended without a winner.
+        """
+        return self._winner
+
+    def get_turn_count(self):
+        return self._turn_count
+
+    # Game State
+    def snapshot(self):
+        """
+        Returns the mutable game state as nested tuples and dicts.
+        Cards are shared, everything else is copied, and nothing refers back to the engine.
+        """
+        return (
+            self._current_turn,
+            self._turn_count,
+            self._running,
+            None if self._winner is None else self._winner.is_red(),
+            self._red_team.snapshot(),
+            self._blue_team.snapshot(),
+            self._deck.snapshot(),
+            tuple(player.snapshot() for player in self._players),
+        )
+
+    def restore(self, snapshot):
+        """
+        Restores a state taken by snapshot() on this engine or on an engine with the same players.
+        """
+        current_turn, turn_count, running, winner_is_red, red_team, blue_team, deck, players = snapshot
+        if len(players) != len(self._players):
+            raise ValueError("Snapshot does not match the number of players.")
+        self._current_turn = current_turn
+        self._turn_count = turn_count
+        self._running = running
+        if winner_is_red is None:
+            self._winner = None
+        else:
+            self._winner = self._red_team if winner_is_red else self._blue_team
+        self._red_team.restore(red_team)
+        self._blue_team.restore(blue_team)
+        self._deck.restore(deck)
+        for player, player_snapshot in zip(self._players, players):
+            player.restore(player_snapshot)
+        self._rebuild_targetable()
+
+    def clone(self, interface=None):
+        """
+        Returns an independent copy of the game without rereading the card file or dealing.
+        Only the engine's and players' own handlers are subscribed on the copy.
+
+        :param interface: Interface of the copy, defaults to the interface of this game.
+        """
+        engine = GameEngine.__new__(GameEngine)
+        engine._config = self._config
+        engine._networked = self._networked
+        if interface is None:
+            # copies are never journaled
+            interface = self._interface.get_wrapped() if self._journal is not None else self._interface
+        engine._interface = interface
+        engine._seed = self._seed
+        engine._journal = None
+        engine._event_manager = EventManager(engine._interface)
+        engine._red_team = Team(is_red=True, game_engine=engine)
+        engine._blue_team = Team(is_red=False, game_engine=engine)
+        engine._deck = self._deck.clone(engine._interface)
+        engine._create_players(self._config)
+        engine._max_turns = self._max_turns
+        engine._initial_state = self._initial_state
+        engine._setup_event_handlers()
+        engine.restore(self.snapshot())
+        return engine
+
+    def get_config(self):
+        return self._config
+
     def get_interface(self):
         return self._interface
     
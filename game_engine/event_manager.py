@@ -1,25 +1,44 @@
 # game_engine/event_manager.py
 
 from collections import defaultdict
+from itertools import count
 from timeline import GameTimeline, DamageTimeline
+from .emit_profiler import EmitProfiler
 
 class Event:
-    def __init__(self, event_type, **data):
+    def __init__(self, event_type, subject=None, **data):
         self.type = event_type
+        self.subject = subject
         self.data = data
 
 class EventHandler:
-    def __init__(self, callback, priority=0):
+    def __init__(self, callback, priority=0, order=0):
         self.callback = callback
         self.priority = priority
+        self.order = order
 
     def handle(self, event):
         return self.callback(event)
 
 class EventManager:
+    """
+    Dispatches events to handlers in priority order.
+
+    Handlers subscribed with a subject (e.g. a player id) are only called for events
+    emitted with that subject; handlers without a subject are called for every event.
+    The merged handler list of each (event type, subject) pair is cached until the
+    next subscription to that event type.
+
+    If journal is set, every emitted event is recorded into it before dispatch.
+    """
     def __init__(self, console_interface):
         self.interface = console_interface
+        self.journal = None
+        self.profiler = None
         self.handlers = defaultdict(list)
+        self.subject_handlers = defaultdict(lambda: defaultdict(list))
+        self._dispatch_cache = {}
+        self._subscription_order = count()
         self.initialize_timelines()
 
     def initialize_timelines(self):
@@ -28,27 +47,93 @@ class EventManager:
         for event_type in DamageTimeline.keys():
             self.handlers[event_type] = []
 
-    def subscribe(self, event_type, listener, priority=0, name=None):
+    def subscribe(self, event_type, listener, priority=0, name=None, subject=None):
         if event_type not in self.handlers:
             raise ValueError(f"Event type '{event_type}' is not in the game or damage timeline.")
         listener_name = name if name else listener.__name__
-        handler = EventHandler(listener, priority)
-        self.handlers[event_type].append((listener_name, handler))
-        self.sort_handlers(event_type)
-        self.interface.send_message(f"Listener '{listener_name}' subscribed to {event_type} with priority {priority}.", debug=True)
+        handler = EventHandler(listener, priority, next(self._subscription_order))
+        if subject is None:
+            self.handlers[event_type].append((listener_name, handler))
+            self.sort_handlers(event_type)
+        else:
+            subject_handlers = self.subject_handlers[event_type][subject]
+            subject_handlers.append((listener_name, handler))
+            subject_handlers.sort(key=lambda x: (x[1].priority, x[1].order))
+        for key in [key for key in self._dispatch_cache if key[0] == event_type]:
+            del self._dispatch_cache[key]
+        self.interface.log_debug("Listener '{}' subscribed to {} with priority {}.", listener_name, event_type, priority)
 
     def sort_handlers(self, event_type):
-        self.handlers[event_type].sort(key=lambda x: x[1].priority)
+        self.handlers[event_type].sort(key=lambda x: (x[1].priority, x[1].order))
+
+    def get_handlers(self, event_type, subject=None):
+        """
+        Returns the handlers called for event_type with the given subject, in call order.
+        """
+        key = (event_type, subject)
+        handlers = self._dispatch_cache.get(key)
+        if handlers is None:
+            handlers = self.handlers.get(event_type, [])
+            subject_handlers = self.subject_handlers[event_type].get(subject) if subject is not None else None
+            if subject_handlers:
+                handlers = sorted(handlers + subject_handlers, key=lambda x: (x[1].priority, x[1].order))
+            self._dispatch_cache[key] = handlers
+        return handlers
+
+    def _begin_emit(self, event_type, subject, kwargs):
+        """
+        Does everything an emit does before calling handlers, profiled or not: records
+        the event into the journal, builds it and looks up its handlers.
+        """
+        journal = self.journal
+        if journal is not None:
+            journal.record_event(event_type, subject, kwargs)
+        handlers = self.get_handlers(event_type, subject)
+        self.interface.log_debug("Emitting event '{}' to {} handler(s).", event_type, len(handlers))
+        return Event(event_type, subject, **kwargs), handlers
 
-    def emit(self, event_type, **kwargs):
-        event = Event(event_type, **kwargs)
-        handlers = self.handlers.get(event_type, [])
-        self.interface.send_message(f"Emitting event '{event_type}' to {len(handlers)} handler(s).", debug=True)
+    def emit(self, event_type, subject=None, **kwargs):
+        # _emit_profiled repeats this loop with timed calls; keep the two in step
+        event, handlers = self._begin_emit(event_type, subject, kwargs)
         all_successful = True
         for listener_name, handler in handlers:
             result = handler.handle(event)
             if result is False:
-                self.interface.send_message(f"Handler {listener_name} returned False for event '{event_type}'.", debug=True)
+                self.interface.log_debug("Handler {} returned False for event '{}'.", listener_name, event_type)
                 all_successful = False
                 break
-        return all_successful
\ No newline at end of file
+        return all_successful
+
+    def enable_profiling(self, profiler=None):
+        """
+        Times every handler call from now on and returns the EmitProfiler collecting the
+        timings, a new one unless given. Profiling replaces emit on this instance with a
+        timed copy, so the untimed emit carries no profiling code at all.
+        """
+        self.profiler = profiler if profiler is not None else EmitProfiler()
+        self.emit = self._emit_profiled
+        return self.profiler
+
+    def disable_profiling(self):
+        """
+        Stops timing and returns the profiler that was in use.
+        """
+        self.__dict__.pop('emit', None)
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def _emit_profiled(self, event_type, subject=None, **kwargs):
+        profiler = self.profiler
+        event, handlers = self._begin_emit(event_type, subject, kwargs)
+        opened = profiler.enter_emit(event_type, kwargs)
+        all_successful = True
+        try:
+            for listener_name, handler in handlers:
+                result = profiler.call(event_type, listener_name, handler, event)
+                if result is False:
+                    self.interface.log_debug("Handler {} returned False for event '{}'.", listener_name, event_type)
+                    all_successful = False
+                    break
+        finally:
+            profiler.exit_emit(opened)
+        return all_successful
@@ -0,0 +1,289 @@
+# game_engine/journal.py
+#
+# Append-only binary game journal. A journal file holds any number of games one after
+# another, each a header followed by records. Everything is laid out in 8-byte units,
+# so a reader can slice out the record types of a whole file with data[::8].
+#
+#   header:  0x06, format version, 2 unused bytes, JSON length (4 bytes), then the JSON
+#            object (players, deck path, turn limit, deck seed) padded with spaces to
+#            a multiple of 8 bytes
+#   record:  type, five 1-byte fields, one 2-byte field (all little-endian):
+#     event:   0x01, event type id, subject, actor, target, unused, card id
+#     choice:  0x02, unused x5, index of the chosen option
+#     choices: 0x03, up to five chosen indexes, number of them; a selection takes as many
+#              records as needed and ends with a record holding fewer than five
+#     yes/no:  0x04, answer, unused x4, unused
+#     end:     0x05, winner (0 red, 1 blue, 255 none), unused x4, turns played
+#
+# Event type ids are positions in EVENT_TYPES. Player ids are player pids; 255 stands for
+# "none" in player fields and 65535 in the card field. The deck seed and the answers to
+# the prompts are enough to play the game again, see game_engine/replay.py.
+
+import gzip
+import json
+import struct
+from timeline import GameTimeline, DamageTimeline
+from views import ConsoleInterface
+from views.console_interface import SILENT
+
+VERSION = 1
+UNIT = 8
+HEADER = struct.Struct('<BBHI')
+RECORD = struct.Struct('<BBBBBBH')
+_pack_record = RECORD.pack
+
+EVENT = 0x01
+CHOICE = 0x02
+CHOICES = 0x03
+YES_NO = 0x04
+END = 0x05
+GAME_HEADER = 0x06
+
+CHOICES_PER_RECORD = 5
+
+EVENT_TYPES = tuple(GameTimeline) + tuple(DamageTimeline)
+EVENT_TYPE_IDS = {event_type: event_id for event_id, event_type in enumerate(EVENT_TYPES)}
+
+NO_PLAYER = 0xFF
+NO_CARD = 0xFFFF
+NO_WINNER = 0xFF
+
+BUFFER_SIZE = 1 << 16
+
+def _player_id(player):
+    return NO_PLAYER if player is None else player.get_id()
+
+def event_record(event_type, subject, data):
+    """
+    Returns the record of an emitted event.
+    """
+    player = data.get('player')
+    if player is not None:
+        actor, target, card = player.get_id(), NO_PLAYER, None
+    else:
+        attack_event = data.get('attack_event')
+        if attack_event is not None:
+            actor = _player_id(attack_event.get('attacker'))
+            target = _player_id(attack_event.get('defender'))
+            card = attack_event.get('card')
+        else:
+            actor, target, card = NO_PLAYER, NO_PLAYER, None
+    return (EVENT, EVENT_TYPE_IDS[event_type], NO_PLAYER if subject is None else subject, actor, target, 0,
+            NO_CARD if card is None else card.get_card_id())
+
+def _decode_event(record):
+    _, event_id, subject, actor, target, _, card_id = record
+    return (EVENT_TYPES[event_id], None if subject == NO_PLAYER else subject, None if actor == NO_PLAYER else actor,
+            None if target == NO_PLAYER else target, None if card_id == NO_CARD else card_id)
+
+class GameJournal:
+    """
+    Records games into a binary stream. Records are buffered and written in blocks,
+    so recording an event costs one struct.pack.
+
+    :param stream: Binary file object to append to.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffer = bytearray()
+
+    @classmethod
+    def open(cls, path):
+        """
+        Returns a journal appending to the file at path, gzip-compressed if path ends with .gz.
+        """
+        return cls(_open_journal_file(path, 'ab'))
+
+    def begin_game(self, header):
+        payload = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        self._buffer += HEADER.pack(GAME_HEADER, VERSION, 0, len(payload))
+        self._buffer += payload.ljust(-(-len(payload) // UNIT) * UNIT)
+
+    def record_event(self, event_type, subject, data):
+        # replay verification compares with event_record, so it is the only encoder of events
+        self._buffer += _pack_record(*event_record(event_type, subject, data))
+        if len(self._buffer) >= BUFFER_SIZE:
+            self._write()
+
+    def record_choice(self, index):
+        self._buffer += RECORD.pack(CHOICE, 0, 0, 0, 0, 0, index)
+
+    def record_choices(self, indexes):
+        for start in range(0, len(indexes) + 1, CHOICES_PER_RECORD):
+            chunk = indexes[start:start + CHOICES_PER_RECORD]
+            self._buffer += RECORD.pack(CHOICES, *chunk, *(0,) * (CHOICES_PER_RECORD - len(chunk)), len(chunk))
+
+    def record_yes_no(self, answer):
+        self._buffer += RECORD.pack(YES_NO, 1 if answer else 0, 0, 0, 0, 0, 0)
+
+    def end_game(self, winner, turns):
+        """
+        :param winner: 0 for red, 1 for blue, None for no winner.
+        """
+        self._buffer += RECORD.pack(END, NO_WINNER if winner is None else winner, 0, 0, 0, 0, min(turns, 0xFFFF))
+        self._write()
+
+    def _write(self):
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer = bytearray()
+
+    def flush(self):
+        self._write()
+        self._stream.flush()
+
+    def close(self):
+        self.flush()
+        self._stream.close()
+
+class JournaledGame:
+    """
+    One game read back from a journal.
+
+    :ivar header: The header dictionary.
+    :ivar records: The raw record tuples, in order.
+    """
+    def __init__(self, header, records):
+        self.header = header
+        self.records = records
+
+    def get_events(self):
+        """
+        Returns (event type, subject, actor, target, card id) per emitted event, None for none.
+        """
+        return [_decode_event(record) for record in self.records if record[0] == EVENT]
+
+    def get_decisions(self):
+        """
+        Returns (record type, answer) per prompt, in order. The answer is an index for
+        CHOICE, a tuple of indexes for CHOICES and a bool for YES_NO.
+        """
+        decisions = []
+        selection = None
+        for record in self.records:
+            record_type = record[0]
+            if record_type == CHOICE:
+                decisions.append((CHOICE, record[6]))
+            elif record_type == CHOICES:
+                if selection is None:
+                    selection = []
+                selection.extend(record[1:1 + record[6]])
+                if record[6] < CHOICES_PER_RECORD:
+                    decisions.append((CHOICES, tuple(selection)))
+                    selection = None
+            elif record_type == YES_NO:
+                decisions.append((YES_NO, record[1] != 0))
+        return decisions
+
+    def get_result(self):
+        """
+        Returns (winner, turns) with winner 0 for red, 1 for blue, None for no winner,
+        or None if the game did not finish.
+        """
+        if not self.records or self.records[-1][0] != END:
+            return None
+        winner, turns = self.records[-1][1], self.records[-1][6]
+        return (None if winner == NO_WINNER else winner, turns)
+
+def read_journal(data):
+    """
+    Splits journal bytes into a list of JournaledGame, without playing anything.
+    """
+    if len(data) % UNIT:
+        raise ValueError("Journal is truncated.")
+    types = data[::UNIT]
+    games = []
+    unit = 0
+    while unit < len(types):
+        record_type, version, _, length = HEADER.unpack_from(data, unit * UNIT)
+        if record_type != GAME_HEADER:
+            raise ValueError(f"Expected a game header at byte {unit * UNIT}.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported journal version {version}.")
+        start = unit * UNIT + HEADER.size
+        header = json.loads(data[start:start + length].decode('utf-8'))
+        first = unit + 1 + -(-length // UNIT)
+        # header payloads are JSON text, so the game header type byte only appears in headers
+        unit = types.find(GAME_HEADER, first)
+        if unit < 0:
+            unit = len(types)
+        games.append(JournaledGame(header, list(RECORD.iter_unpack(data[first * UNIT:unit * UNIT]))))
+    return games
+
+def _open_journal_file(path, mode):
+    # journals are mostly repeated event records; the fastest level already shrinks them about 6x
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode, compresslevel=1)
+    return open(path, mode)
+
+def load_journal(path):
+    with _open_journal_file(path, 'rb') as f:
+        return read_journal(f.read())
+
+class RecordingInterface:
+    """
+    Wraps an interface and records the answer to every prompt into a journal as the
+    index of the chosen option. Everything else is forwarded to the wrapped interface.
+    """
+    def __init__(self, interface, journal):
+        self._interface = interface
+        self._journal = journal
+
+    def __getattr__(self, name):
+        value = getattr(self._interface, name)
+        if callable(value):
+            # later lookups of the method skip __getattr__
+            self.__dict__[name] = value
+        return value
+
+    def get_wrapped(self):
+        return self._interface
+
+    def prompt_action_selection(self, actions, player_id=None):
+        selected = self._interface.prompt_action_selection(actions, player_id)
+        self._journal.record_choice(actions.index(selected))
+        return selected
+
+    def prompt_multiple_action_selection(self, actions, *args, **kwargs):
+        selected = self._interface.prompt_multiple_action_selection(actions, *args, **kwargs)
+        self._journal.record_choices([actions.index(choice) for choice in selected])
+        return selected
+
+    def prompt_yes_no(self, message, player_id=None):
+        answer = self._interface.prompt_yes_no(message, player_id)
+        self._journal.record_yes_no(answer)
+        return answer
+
+class ReplayInterface(ConsoleInterface):
+    """
+    Answers every prompt from the decisions of a JournaledGame, in order, and drops messages.
+    """
+    def __init__(self, decisions):
+        super().__init__(debug=False)
+        self.level = SILENT
+        self._decisions = decisions
+        self._position = 0
+
+    def send_message(self, message, player_id=None, broadcast=False, debug=False):
+        pass
+
+    def _next(self, record_type):
+        if self._position >= len(self._decisions):
+            raise ValueError("The journal has no more decisions.")
+        recorded_type, answer = self._decisions[self._position]
+        if recorded_type != record_type:
+            raise ValueError(f"The journal does not match the game at decision {self._position}.")
+        self._position += 1
+        return answer
+
+    def prompt_action_selection(self, actions, player_id=None):
+        return actions[self._next(CHOICE)]
+
+    def prompt_multiple_action_selection(self, actions, min_selections, max_selections, player_id=None):
+        return [actions[index] for index in self._next(CHOICES)]
+
+    def prompt_yes_no(self, message, player_id=None):
+        return self._next(YES_NO)
+
+    def is_finished(self):
+        return self._position == len(self._decisions)
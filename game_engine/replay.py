@@ -0,0 +1,52 @@
+# game_engine/replay.py
+
+from .engine import GameEngine
+from .journal import ReplayInterface, event_record, EVENT
+
+class _EventChecker:
+    """
+    Stands in for a GameJournal during a replay and compares the emitted events
+    with the recorded ones.
+    """
+    def __init__(self, records):
+        self._events = [record for record in records if record[0] == EVENT]
+        self._position = 0
+
+    def record_event(self, event_type, subject, data):
+        expected = self._events[self._position] if self._position < len(self._events) else None
+        actual = event_record(event_type, subject, data)
+        if actual != expected:
+            raise ValueError(f"Replay diverged at event {self._position}: expected {expected}, got {actual}.")
+        self._position += 1
+
+def replay_game(game, deck_path=None, verify=False):
+    """
+    Plays a journaled game again from its seed and recorded decisions, without prompts,
+    and returns the finished GameEngine. The game is simulated again, so a replay costs
+    about as much as playing it minus the agents; get_events() of the JournaledGame is
+    far cheaper when only the events are needed.
+
+    :param deck_path: Card file to use instead of the one in the header.
+    :param verify: Also check every emitted event against the journal.
+    """
+    header = game.header
+    interface = ReplayInterface(game.get_decisions())
+    config = {
+        'player': header['players'],
+        'deck_path': deck_path or header['deck_path'],
+        'interface': interface,
+        'max_turns': header['max_turns'],
+        'seed': header['seed'],
+        'debug': False,
+    }
+    engine = GameEngine(config)
+    if verify:
+        engine.get_event_manager().journal = _EventChecker(game.records)
+    engine.start_game()
+    recorded = game.get_result()
+    if recorded is not None:
+        winner = engine.get_winner()
+        result = (None if winner is None else (0 if winner.is_red() else 1), engine.get_turn_count())
+        if result != recorded or not interface.is_finished():
+            raise ValueError(f"Replay ended with {result}, the journal recorded {recorded}.")
+    return engine
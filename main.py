@@ -1,16 +1,39 @@
 # main.py
 
 import argparse
-from game_engine import GameEngine
+import time
+from game_engine import GameEngine, GameJournal, EmitProfiler, load_journal, replay_game
 from server import GameServer
 from client import GameClient
+from simulation import Simulator, Tournament
+from simulation.simulator import AGENT_TYPES, MCTS_BUDGET, load_scripts
 
 def main():
     parser = argparse.ArgumentParser(description="AGR Game")
-    parser.add_argument("--mode", choices=["local", "server", "client"], default="local", help="Game mode")
+    parser.add_argument("--mode", choices=["local", "server", "client", "simulate", "tournament", "batch", "replay"], default="local", help="Game mode")
     parser.add_argument("--host", default="localhost", help="Server host (for client mode)")
     parser.add_argument("--port", type=int, default=5000, help="Server port (for server and client mode)")
-    parser.add_argument("--num_players", type=int, default=4, help="Number of players (for server mode)")
+    parser.add_argument("--num_players", type=int, default=4, help="Number of players (for server, simulate and tournament mode)")
+    parser.add_argument("--num_games", type=int, default=1000, help="Number of games to play (for simulate and tournament mode)")
+    parser.add_argument("--agents", nargs='+', choices=list(AGENT_TYPES), default=["random"],
+                        help="Agent type per seat, repeated to fill the table (for simulate and tournament mode)")
+    parser.add_argument("--max_turns", type=int, default=500, help="Turn limit per game (for simulate and tournament mode)")
+    parser.add_argument("--mcts_budget", type=float, default=MCTS_BUDGET,
+                        help="Seconds of search per decision of mcts agents (for simulate and tournament mode)")
+    parser.add_argument("--script", default=None, metavar="FILE",
+                        help="JSON choices of scripted agents: one list for all, or lists by player id "
+                             "(for simulate and tournament mode)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (for simulate mode), master seed (for tournament mode)")
+    parser.add_argument("--tables", type=int, default=1, help="Games hosted at the same time (for server mode)")
+    parser.add_argument("--table", type=int, default=None, help="Table to join, defaults to the first open one (for client mode)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, defaults to CPU count (for tournament mode)")
+    parser.add_argument("--cross_check", type=int, default=0,
+                        help="Also replay this many games on GameEngine and compare the results (for batch mode)")
+    parser.add_argument("--journal", default=None,
+                        help="Journal file to record games into (for simulate mode) or to replay (for replay mode), "
+                             "or directory of the table journals (for server mode); .gz files are compressed")
+    parser.add_argument("--profile_handlers", nargs='?', const='-', default=None, metavar="FILE",
+                        help="Time every event handler and print a table, or write JSON to FILE (for simulate mode)")
     args = parser.parse_args()
 
     if args.mode == "local":
@@ -28,11 +51,75 @@ def main():
         game_engine = GameEngine(config)
         game_engine.start_game()
     elif args.mode == "server":
-        server = GameServer(args.host, args.port, args.num_players)
+        server = GameServer(args.host, args.port, args.num_players, max_tables=args.tables,
+                            max_games=1 if args.tables == 1 else None, journal_dir=args.journal)
         server.start()
     elif args.mode == "client":
-        client = GameClient(args.host, args.port)
+        client = GameClient(args.host, args.port, table=args.table)
         client.connect()
+    elif args.mode == "simulate":
+        agent_types = [args.agents[seat % len(args.agents)] for seat in range(args.num_players)]
+        journal = GameJournal.open(args.journal) if args.journal else None
+        profiler = EmitProfiler() if args.profile_handlers else None
+        scripts = load_scripts(args.script, args.num_players) if args.script else None
+        simulator = Simulator(agent_types, max_turns=args.max_turns, seed=args.seed, journal=journal,
+                              profiler=profiler, mcts_budget=args.mcts_budget, scripts=scripts)
+        summary = simulator.run(args.num_games)
+        if journal is not None:
+            journal.close()
+        print(f"Played {summary['games']} game(s) in {summary['elapsed']:.2f}s "
+              f"({summary['games'] / summary['elapsed'] * 60:.0f} games/min).")
+        print(f"Red wins: {summary['red_wins']}, Blue wins: {summary['blue_wins']}, "
+              f"Draws: {summary['draws']}, Errors: {summary['errors']}")
+        if summary['first_error'] is not None:
+            print(f"First error:\n{summary['first_error']}", end='')
+        if summary['games']:
+            print(f"Average turns: {summary['total_turns'] / summary['games']:.1f}")
+        if profiler is not None:
+            if args.profile_handlers == '-':
+                print(profiler.format_table())
+            else:
+                with open(args.profile_handlers, 'w') as f:
+                    f.write(profiler.to_json())
+    elif args.mode == "tournament":
+        agent_types = [args.agents[seat % len(args.agents)] for seat in range(args.num_players)]
+        scripts = load_scripts(args.script, args.num_players) if args.script else None
+        tournament = Tournament(agent_types, args.num_games, master_seed=args.seed or 0,
+                                workers=args.workers, max_turns=args.max_turns, mcts_budget=args.mcts_budget,
+                                scripts=scripts)
+        summary = tournament.run()
+        print(f"Played {summary['games']} game(s) on {summary['workers']} worker(s) in {summary['elapsed']:.2f}s "
+              f"({summary['games'] / summary['elapsed'] * 60:.0f} games/min).")
+        print(f"Red wins: {summary['red_wins']}, Blue wins: {summary['blue_wins']}, "
+              f"Draws: {summary['draws']}, Errors: {summary['errors']}")
+        print(f"Average turns: {summary['average_turns']:.1f}")
+    elif args.mode == "replay":
+        start = time.perf_counter()
+        games = load_journal(args.journal)
+        loaded = time.perf_counter()
+        for game in games:
+            replay_game(game, verify=True)
+        replayed = time.perf_counter()
+        print(f"Read {len(games)} game(s) and {sum(len(game.records) for game in games)} record(s) "
+              f"in {(loaded - start) * 1000:.1f}ms.")
+        print(f"Replayed and verified them in {replayed - loaded:.2f}s "
+              f"({len(games) / (replayed - loaded) * 60:.0f} games/min).")
+    elif args.mode == "batch":
+        # batch mode is the only mode that needs NumPy
+        from simulation import BatchSimulator, cross_check
+        simulator = BatchSimulator(args.num_players, max_turns=args.max_turns)
+        start = time.perf_counter()
+        results = simulator.run(args.num_games, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        winners = results['winner']
+        print(f"Played {args.num_games} game(s) in {elapsed:.2f}s ({args.num_games / elapsed * 60:.0f} games/min).")
+        print(f"Red wins: {(winners == 0).sum()}, Blue wins: {(winners == 1).sum()}, "
+              f"Draws: {((winners < 0) & ~results['error']).sum()}, Errors: {results['error'].sum()}")
+        print(f"Average turns: {results['turns'].mean():.1f}")
+        if args.cross_check:
+            mismatches = cross_check(list(range(args.cross_check)), args.num_players, max_turns=args.max_turns)
+            print(f"Cross-checked {args.cross_check} game(s) against GameEngine: {len(mismatches)} mismatch(es)"
+                  + (f", seeds {mismatches}" if mismatches else "."))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,10 +6,12 @@ from .player_hand import PlayerHand
 from .player_effects import PlayerEffects
 from .player_heal import PlayerHeal
 from .card import Card
+from .card_table import CardTable
 from .deck import Deck
 
 __all__ = [
     'Card',
+    'CardTable',
     'Deck',
     'PlayerHeal',
     'Jewel',
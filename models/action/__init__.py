@@ -1,6 +1,6 @@
 # models/action/__init__.py
 
-from .base_action import NoResponseAction
+from .base_action import NoResponseAction, ActionCanceled
 from .special_action import (
     SynthesisAction, 
     PurchaseAction, 
@@ -21,6 +21,7 @@ from .magic_action import (
 
 __all__ = [
     'NoResponseAction',
+    'ActionCanceled',
     'SynthesisAction', 
     'PurchaseAction', 
     'RefineAction',
@@ -1,7 +1,7 @@
 # models/action/attack_action.py
 
 from abc import ABC, abstractmethod
-from .base_action import BaseAction, CardAction
+from .base_action import BaseAction, CardAction, ActionCanceled
 
 class BaseAttackAction(BaseAction):
     @property
@@ -29,6 +29,10 @@ class AttackCardAction(BaseAttackAction, CardAction):
     def name(self):
         return f"Attack with {self.card}"
 
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_attack()
+
     def available(self):
         return (
             self.card.is_attack() and
@@ -36,12 +40,12 @@ class AttackCardAction(BaseAttackAction, CardAction):
         )
 
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting an Attack Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting an Attack Action with {}.", self._player.get_id(), self.card.get_name())
         
         candidates = self._game_engine.get_attack_target(self._player)
         target = self._interface.prompt_action_selection(candidates, player_id=self._player.get_id())
         if not target:
-            raise Exception("No valid target selected. Action canceled.")
+            raise ActionCanceled("No valid target selected. Action canceled.")
         
         self._player.remove_cards(self.card)
         
@@ -54,6 +58,6 @@ class AttackCardAction(BaseAttackAction, CardAction):
             'can_not_counter': self.card.is_dark_extinction(),
         }
         self._game_engine.process_damage_timeline(attack_event, start_step=1)
-        self._interface.send_message(f"Player {self._player.get_id()} plays {self.card.get_name()} to attack Player {target.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} plays {} to attack Player {}.", self._player.get_id(), self.card.get_name(), target.get_id(), broadcast=True)
 
         return True
\ No newline at end of file
@@ -2,6 +2,12 @@
 
 from abc import ABC, abstractmethod
 
+class ActionCanceled(ValueError):
+    """
+    Raised when a chosen action cannot be carried out, e.g. no valid target or jewel
+    combination is left for it.
+    """
+
 class BaseAction(ABC):
     def __init__(self, player, game_engine):
         self._player = player
@@ -64,6 +70,14 @@ class CardAction(ABC):
     def __init__(self, card):
         self._card = card
 
+    @classmethod
+    def matches_card(cls, card):
+        """
+        Returns True if the action can ever be played with card, whatever the game state.
+        Only depends on the card's traits, so the result can be cached per traits.
+        """
+        return True
+
     @property
     def card(self):
         return self._card
@@ -1,7 +1,7 @@
 # models/action/counter_action.py
 
 from abc import ABC, abstractmethod
-from .base_action import BaseAction, CardAction
+from .base_action import BaseAction, CardAction, ActionCanceled
 
 class BaseCounterAction(BaseAction):
     def __init__(self, player, game_engine, attack_event):
@@ -24,9 +24,22 @@ class BaseCounterAction(BaseAction):
         raise Exception("Counter action should not be successful")
         
 class CounterCardAction(BaseCounterAction, CardAction):
-    def __init__(self, player, game_engine, attack_event, card):
+    def __init__(self, player, game_engine, attack_event, card, counter_targets=None):
         BaseCounterAction.__init__(self, player, game_engine, attack_event)
         CardAction.__init__(self, card)
+        self._counter_targets = counter_targets
+
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_attack()
+
+    def _get_counter_targets(self):
+        """
+        Players that can be countered. Computed once per attack when given by the caller.
+        """
+        if self._counter_targets is None:
+            self._counter_targets = self._game_engine.get_counter_targets(self._player, self._attack_event['attacker'])
+        return self._counter_targets
 
     @property
     def name(self):
@@ -37,18 +50,20 @@ class CounterCardAction(BaseCounterAction, CardAction):
             self.card.is_attack() and
             (self._attack_event['attack_type'] == "attack" or
              self._attack_event['attack_type'] == "counter") and
-            (self._attack_event['card'].get_element() == self.card.get_element() or 
+            (self._attack_event['card'].get_element_id() == self.card.get_element_id() or 
             self.card.is_dark_extinction()) and
-            self._game_engine.get_attack_target(self._player, counter=True, attacker=self._attack_event['attacker'])
+            len(self._get_counter_targets()) > 0
         )
 
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Counter Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Counter Action with {}.", self._player.get_id(), self.card.get_name())
         
-        candidates = self._game_engine.get_attack_target(self._player, counter=True, attacker=self._attack_event['attacker'])
+        candidates = self._get_counter_targets()
+        if not candidates:
+            raise ActionCanceled("No available opponents to counter. Action canceled.")
         target = self._interface.prompt_action_selection(candidates, player_id=self._player.get_id())
         if not target:
-            raise Exception("No valid target selected. Action canceled.")
+            raise ActionCanceled("No valid target selected. Action canceled.")
         
         self._player.remove_cards(self.card)
         
@@ -61,15 +76,19 @@ class CounterCardAction(BaseCounterAction, CardAction):
             'can_not_counter': self.card.is_dark_extinction(),
         }
         self._game_engine.process_damage_timeline(counter_event, start_step=2)
-        self._interface.send_message(f"Player {self._player.get_id()} plays {self.card.get_name()} to counter Player {target.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} plays {} to counter Player {}.", self._player.get_id(), self.card.get_name(), target.get_id(), broadcast=True)
 
         return True
 
 class HolyLightCardAction(BaseCounterAction, CardAction):
-    def __init__(self, player, game_engine, attack_event, card):
+    def __init__(self, player, game_engine, attack_event, card, counter_targets=None):
         BaseCounterAction.__init__(self, player, game_engine, attack_event)
         CardAction.__init__(self, card)
 
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_holy_light()
+
     @property
     def name(self):
         return f"Holy Light"
@@ -80,16 +99,20 @@ class HolyLightCardAction(BaseCounterAction, CardAction):
         )
 
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} uses Holy Light", broadcast=True)
+        self._interface.log_info("\nPlayer {} uses Holy Light", self._player.get_id(), broadcast=True)
         self._player.remove_cards(self.card)
         
         return True
 
 class MagicBulletCounterCardAction(BaseCounterAction, CardAction):
-    def __init__(self, player, game_engine, attack_event, card):
+    def __init__(self, player, game_engine, attack_event, card, counter_targets=None):
         BaseCounterAction.__init__(self, player, game_engine, attack_event)
         CardAction.__init__(self, card)
 
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_magic_bullet()
+
     @property
     def name(self):
         return f"Counter {self.card}"
@@ -101,7 +124,7 @@ class MagicBulletCounterCardAction(BaseCounterAction, CardAction):
         )
     
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Magic Bullet Counter Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Magic Bullet Counter Action with {}.", self._player.get_id(), self.card.get_name())
         
         target = self._game_engine.get_magic_bullet_target(self._player)
         
@@ -115,6 +138,6 @@ class MagicBulletCounterCardAction(BaseCounterAction, CardAction):
             'damage_amount': self._attack_event['damage_amount'] + 1,
         }
         self._game_engine.process_damage_timeline(attack_event, start_step=1)
-        self._interface.send_message(f"Player {self._player.get_id()} plays {self.card.get_name()} to counter Player {target.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} plays {} to counter Player {}.", self._player.get_id(), self.card.get_name(), target.get_id(), broadcast=True)
         
         return True
\ No newline at end of file
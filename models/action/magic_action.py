@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from models.effect import PoisonEffect, WeaknessEffect, HolyShieldEffect
-from .base_action import BaseAction, CardAction
+from .base_action import BaseAction, CardAction, ActionCanceled
 
 class BaseMagicAction(BaseAction):
     @property
@@ -30,6 +30,10 @@ class PoisonCardAction(BaseMagicAction, CardAction):
     def name(self):
         return f"Cast poison card {self.card}"
 
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_poison()
+
     def available(self):
         return (
             self.card.is_poison() and
@@ -37,17 +41,17 @@ class PoisonCardAction(BaseMagicAction, CardAction):
         )
     
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Poison Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Poison Action with {}.", self._player.get_id(), self.card.get_name())
         
         candidates = self._game_engine.get_magic_target(self._player, card=self.card)
         target = self._interface.prompt_action_selection(candidates, player_id=self._player.get_id())
         if not target:
-            raise Exception("No valid target selected. Action canceled.")
+            raise ActionCanceled("No valid target selected. Action canceled.")
         
         self._player.remove_cards(self.card, recycle=False)
         effect = PoisonEffect(source=self._player, target=target, game_engine=self._game_engine, card=self.card)
         effect.apply()
-        self._interface.send_message(f"Player {target.get_id()} is affected by {self.card.get_name()} by Player {self._player.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} is affected by {} by Player {}.", target.get_id(), self.card.get_name(), self._player.get_id(), broadcast=True)
         
         return True
     
@@ -59,25 +63,30 @@ class WeaknessCardAction(BaseMagicAction, CardAction):
     @property
     def name(self):
         return f"Cast weakness card {self.card}"
+
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_weakness()
     
     def available(self):
         return (
             self.card.is_weakness() and
-            self._player.can_perform_action("magic")
+            self._player.can_perform_action("magic") and
+            self._game_engine.has_targetable_player('weakness')
         )
     
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Weakness Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Weakness Action with {}.", self._player.get_id(), self.card.get_name())
 
         candidates = self._game_engine.get_magic_target(self._player, card=self.card)
         target = self._interface.prompt_action_selection(candidates, player_id=self._player.get_id())
         if not target:
-            raise Exception("No valid target selected. Action canceled.")
+            raise ActionCanceled("No valid target selected. Action canceled.")
         
         self._player.remove_cards(self.card, recycle=False)
         effect = WeaknessEffect(source=self._player, target=target, game_engine=self._game_engine, card=self.card)
         effect.apply()
-        self._interface.send_message(f"Player {target.get_id()} is affected by {self.card.get_name()} by Player {self._player.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} is affected by {} by Player {}.", target.get_id(), self.card.get_name(), self._player.get_id(), broadcast=True)
         
         return True
     
@@ -89,26 +98,30 @@ class HolyShieldCardAction(BaseMagicAction, CardAction):
     @property
     def name(self):
         return f"Cast holy shield card {self.card}"
+
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_holy_shield()
     
     def available(self):
-        # TODO: if four people have holy shield, then you can't cast magic cards
         return (
             self.card.is_holy_shield() and
-            self._player.can_perform_action("magic")
+            self._player.can_perform_action("magic") and
+            self._game_engine.has_targetable_player('holy_shield')
         )
     
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Holy Shield Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Holy Shield Action with {}.", self._player.get_id(), self.card.get_name())
         
         candidates = self._game_engine.get_magic_target(self._player, card=self.card)
         target = self._interface.prompt_action_selection(candidates, player_id=self._player.get_id())
         if not target:
-            raise Exception("No valid target selected. Action canceled.")
+            raise ActionCanceled("No valid target selected. Action canceled.")
         
         self._player.remove_cards(self.card, recycle=False)
         effect = HolyShieldEffect(source=self._player, target=target, game_engine=self._game_engine, card=self.card)
         effect.apply()
-        self._interface.send_message(f"Player {target.get_id()} is affected by {self.card.get_name()} by Player {self._player.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} is affected by {} by Player {}.", target.get_id(), self.card.get_name(), self._player.get_id(), broadcast=True)
         
         return True
     
@@ -120,6 +133,10 @@ class MagicBulletCardAction(BaseMagicAction, CardAction):
     @property
     def name(self):
         return f"Cast {self.card}"
+
+    @classmethod
+    def matches_card(cls, card):
+        return card.is_magic_bullet()
     
     def available(self):
         return (
@@ -128,7 +145,7 @@ class MagicBulletCardAction(BaseMagicAction, CardAction):
         )
     
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Magic Bullet Action with {self.card.get_name()}.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Magic Bullet Action with {}.", self._player.get_id(), self.card.get_name())
         
         target = self._game_engine.get_magic_bullet_target(self._player)
         
@@ -142,6 +159,6 @@ class MagicBulletCardAction(BaseMagicAction, CardAction):
             'damage_amount': 2,
         }
         self._game_engine.process_damage_timeline(attack_event, start_step=1)
-        self._interface.send_message(f"Player {self._player.get_id()} plays {self.card.get_name()} to cast Magic Bullet on Player {target.get_id()}.", broadcast=True)
+        self._interface.log_info("Player {} plays {} to cast Magic Bullet on Player {}.", self._player.get_id(), self.card.get_name(), target.get_id(), broadcast=True)
         
         return True
\ No newline at end of file
@@ -1,7 +1,7 @@
 # models/action/special_action.py
 
 from abc import ABC, abstractmethod
-from .base_action import BaseAction
+from .base_action import BaseAction, ActionCanceled
 
 class BaseSpecialAction(BaseAction):
     @abstractmethod
@@ -26,16 +26,16 @@ class SynthesisAction(BaseSpecialAction):
                self._player.can_perform_action("special"))
 
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Synthesis Action.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Synthesis Action.", self._player.get_id())
 
         if not self._player.get_team().can_synthesis():
-            raise Exception("Not enough jewels to perform 'Synthesize'. Action canceled.")
+            raise ActionCanceled("Not enough jewels to perform 'Synthesize'. Action canceled.")
         if not self._player.can_draw_cards(3):
-            raise Exception(f"Cannot perform 'Synthesize' as drawing 3 cards would exceed hand size. Action canceled.")
+            raise ActionCanceled(f"Cannot perform 'Synthesize' as drawing 3 cards would exceed hand size. Action canceled.")
 
         valid_combinations = self._player.get_team().get_synthesis_jewel_combination()
         if not valid_combinations:
-            raise Exception("No valid jewel combination to perform 'Synthesize'. Action canceled.")
+            raise ActionCanceled("No valid jewel combination to perform 'Synthesize'. Action canceled.")
         
         gems_to_use, crystals_to_use = self._interface.prompt_action_selection(valid_combinations, player_id=self._player.get_id())
 
@@ -57,18 +57,18 @@ class PurchaseAction(BaseSpecialAction):
                self._player.can_perform_action("special"))
         
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Purchase Action.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Purchase Action.", self._player.get_id())
 
         if not self._player.can_draw_cards(3):
-            raise Exception(f"Cannot perform 'Purchase' as drawing 3 cards would exceed hand size. Action canceled.")
+            raise ActionCanceled(f"Cannot perform 'Purchase' as drawing 3 cards would exceed hand size. Action canceled.")
 
         self._player.take_damage(3, damage_type="draw")
         
         if self._player.get_team().can_add_jewel(gem_add=1, crystal_add=1):
             self._player.get_team().add_jewel(gem_add=1, crystal_add=1)
-            self._interface.send_message(f"{self._player.get_team()} gains 1 Gem and 1 Crystal from Purchase.", debug=True)
+            self._interface.log_debug("{} gains 1 Gem and 1 Crystal from Purchase.", self._player.get_team())
         elif self._player.get_team().can_add_jewel(gem_add=1) or self._player.get_team().can_add_jewel(crystal_add=1):
-            self._interface.send_message(f"You can add one more jewel to team.", player_id=self._player.get_id())
+            self._interface.log_info("You can add one more jewel to team.", player_id=self._player.get_id())
             choices = []
             if self._player.get_team().can_add_jewel(gem_add=1):
                 choices.append('gem')
@@ -77,14 +77,14 @@ class PurchaseAction(BaseSpecialAction):
             choice = self._interface.prompt_action_selection(choices, player_id=self._player.get_id())
             if choice == 'gem':
                 self._player.get_team().add_jewel(gem_add=1)
-                self._interface.send_message(f"{self._player.get_team()} gains 1 Gem from Purchase.", debug=True)
+                self._interface.log_debug("{} gains 1 Gem from Purchase.", self._player.get_team())
             elif choice == 'crystal':
                 self._player.get_team().add_jewel(crystal_add=1)
-                self._interface.send_message(f"{self._player.get_team()} gains 1 Crystal from Purchase.", debug=True)
+                self._interface.log_debug("{} gains 1 Crystal from Purchase.", self._player.get_team())
             else:
                 raise Exception("Invalid choice for adding jewel in Purchase action.")
         else:
-            self._interface.send_message(f"{self._player.get_team()}'s jewels are already at maximum. Purchase completed without adding jewels.", debug=True)
+            self._interface.log_debug("{}'s jewels are already at maximum. Purchase completed without adding jewels.", self._player.get_team())
 
         return True
 
@@ -97,26 +97,21 @@ class RefineAction(BaseSpecialAction):
         return (
             self._player.can_perform_action("special") and
             self._player.get_team().can_refine() and
-            (self._player.can_add_jewel(gem_add=1) or 
-             self._player.can_add_jewel(crystal_add=1))
+            self._player.get_jewel_capacity() > 0
         )
 
     def execute(self):
-        self._interface.send_message(f"\nPlayer {self._player.get_id()} is attempting a Refine Action.", debug=True)
+        self._interface.log_debug("\nPlayer {} is attempting a Refine Action.", self._player.get_id())
 
-        candidates = self._player.get_team().get_refine_jewel_combination()
-        valid_combinations = []
-        for combination in candidates:
-            if self._player.can_add_jewel(gem_add=combination[0], crystal_add=combination[1]):
-                valid_combinations.append(combination)
+        valid_combinations = self._player.get_team().get_refine_jewel_combination(capacity=self._player.get_jewel_capacity())
 
         if not valid_combinations:
-            raise Exception("No valid jewel combination to perform 'Refine'. Action canceled.")
+            raise ActionCanceled("No valid jewel combination to perform 'Refine'. Action canceled.")
         
         gems_to_transfer, crystals_to_transfer = self._interface.prompt_action_selection(valid_combinations, player_id=self._player.get_id())
 
         self._player.get_team().remove_jewel(gem_remove=gems_to_transfer, crystal_remove=crystals_to_transfer)
         self._player.add_jewel(gem_add=gems_to_transfer, crystal_add=crystals_to_transfer)
-        self._interface.send_message(f"Player {self._player.get_id()} refined {gems_to_transfer} gem(s) and {crystals_to_transfer} crystal(s). Current Jewels: {self._player.get_jewels()}", broadcast=True)
+        self._interface.log_info("Player {} refined {} gem(s) and {} crystal(s). Current Jewels: {}", self._player.get_id(), gems_to_transfer, crystals_to_transfer, self._player.get_jewels(), broadcast=True)
         
         return True
\ No newline at end of file
@@ -1,125 +1,291 @@
 # models/card.py
 
+# Card types
+ATTACK = 0
+MAGIC = 1
+
+CARD_TYPES = {
+    "attack": ATTACK,
+    "magic": MAGIC,
+}
+
+# Elements
+EARTH = 0
+WIND = 1
+FIRE = 2
+WATER = 3
+THUNDER = 4
+LIGHT = 5
+DARKNESS = 6
+
+ELEMENTS = {
+    "earth": EARTH,
+    "wind": WIND,
+    "fire": FIRE,
+    "water": WATER,
+    "thunder": THUNDER,
+    "light": LIGHT,
+    "darkness": DARKNESS,
+}
+
+# Trait bits. Every Card predicate is a test of one bit in Card._traits.
+TRAIT_ATTACK = 1 << 0
+TRAIT_MAGIC = 1 << 1
+
+TRAIT_EARTH = 1 << 2
+TRAIT_WIND = 1 << 3
+TRAIT_FIRE = 1 << 4
+TRAIT_WATER = 1 << 5
+TRAIT_THUNDER = 1 << 6
+TRAIT_LIGHT = 1 << 7
+TRAIT_DARKNESS = 1 << 8
+
+TRAIT_POISON = 1 << 9
+TRAIT_WEAKNESS = 1 << 10
+TRAIT_HOLY_SHIELD = 1 << 11
+TRAIT_MAGIC_BULLET = 1 << 12
+TRAIT_DARK_EXTINCTION = 1 << 13
+TRAIT_HOLY_LIGHT = 1 << 14
+
+TRAIT_BLOOD_KNIFE = 1 << 15
+TRAIT_BLOOD_ROAR = 1 << 16
+TRAIT_HEALING_LIGHT = 1 << 17
+TRAIT_HEALING_ART = 1 << 18
+TRAIT_SOUL_GIFT = 1 << 19
+TRAIT_SOUL_BLAST = 1 << 20
+TRAIT_ANGEL_WALL = 1 << 21
+TRAIT_POWER_BLESSING = 1 << 22
+TRAIT_SPEED_BLESSING = 1 << 23
+TRAIT_PRECISE_SHOT = 1 << 24
+TRAIT_FLASH_TRAP = 1 << 25
+TRAIT_BLOOD_CRY = 1 << 26
+TRAIT_METEOR = 1 << 27
+TRAIT_WIND_BLADE = 1 << 28
+TRAIT_FIREBALL = 1 << 29
+TRAIT_LIGHTNING = 1 << 30
+TRAIT_FREEZE = 1 << 31
+
+TYPE_TRAITS = {
+    "attack": TRAIT_ATTACK,
+    "magic": TRAIT_MAGIC,
+}
+
+ELEMENT_TRAITS = {
+    "earth": TRAIT_EARTH,
+    "wind": TRAIT_WIND,
+    "fire": TRAIT_FIRE,
+    "water": TRAIT_WATER,
+    "thunder": TRAIT_THUNDER,
+    "light": TRAIT_LIGHT,
+    "darkness": TRAIT_DARKNESS,
+}
+
+ELEMENT_TRAIT_MASK = TRAIT_EARTH | TRAIT_WIND | TRAIT_FIRE | TRAIT_WATER | TRAIT_THUNDER | TRAIT_LIGHT | TRAIT_DARKNESS
+
+# Named cards
+NAME_POISON = "中毒"
+NAME_WEAKNESS = "虛弱"
+NAME_HOLY_SHIELD = "聖盾"
+NAME_MAGIC_BULLET = "魔彈"
+NAME_DARK_EXTINCTION = "暗滅"
+NAME_HOLY_LIGHT = "聖光"
+
+NAME_TRAITS = {
+    NAME_POISON: TRAIT_POISON,
+    NAME_WEAKNESS: TRAIT_WEAKNESS,
+    NAME_HOLY_SHIELD: TRAIT_HOLY_SHIELD,
+    NAME_MAGIC_BULLET: TRAIT_MAGIC_BULLET,
+    NAME_DARK_EXTINCTION: TRAIT_DARK_EXTINCTION,
+    NAME_HOLY_LIGHT: TRAIT_HOLY_LIGHT,
+}
+
+SKILL_TRAITS = {
+    "血影狂刀": TRAIT_BLOOD_KNIFE,
+    "血腥咆哮": TRAIT_BLOOD_ROAR,
+    "治癒之光": TRAIT_HEALING_LIGHT,
+    "治療術": TRAIT_HEALING_ART,
+    "靈魂賜予": TRAIT_SOUL_GIFT,
+    "靈魂震爆": TRAIT_SOUL_BLAST,
+    "天使之牆": TRAIT_ANGEL_WALL,
+    "威力賜福": TRAIT_POWER_BLESSING,
+    "迅捷賜福": TRAIT_SPEED_BLESSING,
+    "精准射擊": TRAIT_PRECISE_SHOT,
+    "閃光陷阱": TRAIT_FLASH_TRAP,
+    "血之悲鳴": TRAIT_BLOOD_CRY,
+    "隕石": TRAIT_METEOR,
+    "風刃": TRAIT_WIND_BLADE,
+    "火球": TRAIT_FIREBALL,
+    "雷擊": TRAIT_LIGHTNING,
+    "冰凍": TRAIT_FREEZE,
+}
+
 class Card:
+    """
+    Immutable card. Cards are flyweights: each card id is loaded once per process into
+    a CardTable and the same object is shared by every Deck, hand and effect.
+    """
+    __slots__ = ('_card_id', '_card_type', '_element', '_property', '_name',
+                 '_unique_skill1', '_unique_skill2', '_type_id', '_element_id', '_traits')
+
     def __init__(self, card_id, card_type, element, property_, name, unique_skill1=None, unique_skill2=None):
-        self._card_id = int(card_id)
-        self._card_type = card_type.lower()
-        self._element = element.lower()
-        self._property = property_.lower()
-        self._name = name
-        self._unique_skill1 = unique_skill1
-        self._unique_skill2 = unique_skill2
+        card_type = card_type.lower()
+        element = element.lower()
+        traits = TYPE_TRAITS.get(card_type, 0) | ELEMENT_TRAITS.get(element, 0) | NAME_TRAITS.get(name, 0)
+        for skill in (unique_skill1, unique_skill2):
+            traits |= SKILL_TRAITS.get(skill, 0)
+        set_attribute = object.__setattr__
+        set_attribute(self, '_card_id', int(card_id))
+        set_attribute(self, '_card_type', card_type)
+        set_attribute(self, '_element', element)
+        set_attribute(self, '_property', property_.lower())
+        set_attribute(self, '_name', name)
+        set_attribute(self, '_unique_skill1', unique_skill1)
+        set_attribute(self, '_unique_skill2', unique_skill2)
+        set_attribute(self, '_type_id', CARD_TYPES.get(card_type))
+        set_attribute(self, '_element_id', ELEMENTS.get(element))
+        set_attribute(self, '_traits', traits)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable.")
+
+    def __reduce__(self):
+        return (Card, (self._card_id, self._card_type, self._element, self._property, self._name,
+                       self._unique_skill1, self._unique_skill2))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self):
         return f"Card(ID: {self._card_id}, Type: {self._card_type}, Element: {self._element}, Property: {self._property}, Name: {self._name})"
 
     def get_card_id(self):
         return self._card_id
-    
+
     def get_card_type(self):
         return self._card_type
-    
+
     def get_element(self):
         return self._element
-    
+
+    def get_type_id(self):
+        return self._type_id
+
+    def get_element_id(self):
+        return self._element_id
+
+    def get_traits(self):
+        return self._traits
+
+    def has_traits(self, traits):
+        """
+        Returns True if the card has all the given trait bits.
+        """
+        return self._traits & traits == traits
+
     def get_property(self):
         return self._property
-    
+
     def get_name(self):
         return self._name
-    
+
+    def get_unique_skills(self):
+        return (self._unique_skill1, self._unique_skill2)
+
     # type related
     def is_attack(self):
-        return self._card_type == "attack"
+        return self._traits & TRAIT_ATTACK != 0
 
     def is_magic(self):
-        return self._card_type == "magic"
-    
+        return self._traits & TRAIT_MAGIC != 0
+
     def is_poison(self):
-        return self._name == "中毒"
+        return self._traits & TRAIT_POISON != 0
 
     def is_weakness(self):
-        return self._name == "虛弱"
+        return self._traits & TRAIT_WEAKNESS != 0
 
     def is_holy_shield(self):
-        return self._name == "聖盾"
+        return self._traits & TRAIT_HOLY_SHIELD != 0
 
     def is_magic_bullet(self):
-        return self._name == "魔彈"
+        return self._traits & TRAIT_MAGIC_BULLET != 0
 
     def is_dark_extinction(self):
-        return self._name == "暗滅"
+        return self._traits & TRAIT_DARK_EXTINCTION != 0
 
     def is_holy_light(self):
-        return self._name == "聖光"
-    
+        return self._traits & TRAIT_HOLY_LIGHT != 0
+
     # element related
     def is_earth(self):
-        return self._element == "earth"
-    
+        return self._traits & TRAIT_EARTH != 0
+
     def is_wind(self):
-        return self._element == "wind"
-    
+        return self._traits & TRAIT_WIND != 0
+
     def is_light(self):
-        return self._element == "light"
-    
+        return self._traits & TRAIT_LIGHT != 0
+
     def is_fire(self):
-        return self._element == "fire"
-    
+        return self._traits & TRAIT_FIRE != 0
+
     def is_thunder(self):
-        return self._element == "thunder"
-    
+        return self._traits & TRAIT_THUNDER != 0
+
     def is_water(self):
-        return self._element == "water"
-    
+        return self._traits & TRAIT_WATER != 0
+
     # unique skill related
     def is_blood_knife(self):
-        return self._unique_skill1 == "血影狂刀" or self._unique_skill2 == "血影狂刀"
-    
+        return self._traits & TRAIT_BLOOD_KNIFE != 0
+
     def is_blood_roar(self):
-        return self._unique_skill1 == "血腥咆哮" or self._unique_skill2 == "血腥咆哮"
+        return self._traits & TRAIT_BLOOD_ROAR != 0
 
     def is_healing_light(self):
-        return self._unique_skill1 == "治癒之光" or self._unique_skill2 == "治癒之光"
+        return self._traits & TRAIT_HEALING_LIGHT != 0
 
     def is_healing_art(self):
-        return self._unique_skill1 == "治療術" or self._unique_skill2 == "治療術"
+        return self._traits & TRAIT_HEALING_ART != 0
 
     def is_soul_gift(self):
-        return self._unique_skill1 == "靈魂賜予" or self._unique_skill2 == "靈魂賜予"
+        return self._traits & TRAIT_SOUL_GIFT != 0
 
     def is_soul_blast(self):
-        return self._unique_skill1 == "靈魂震爆" or self._unique_skill2 == "靈魂震爆"
+        return self._traits & TRAIT_SOUL_BLAST != 0
 
     def is_angel_wall(self):
-        return self._unique_skill1 == "天使之牆" or self._unique_skill2 == "天使之牆"
+        return self._traits & TRAIT_ANGEL_WALL != 0
 
     def is_power_blessing(self):
-        return self._unique_skill1 == "威力賜福" or self._unique_skill2 == "威力賜福"
+        return self._traits & TRAIT_POWER_BLESSING != 0
 
     def is_speed_blessing(self):
-        return self._unique_skill1 == "迅捷賜福" or self._unique_skill2 == "迅捷賜福"
+        return self._traits & TRAIT_SPEED_BLESSING != 0
 
     def is_precise_shot(self):
-        return self._unique_skill1 == "精准射擊" or self._unique_skill2 == "精准射擊"
+        return self._traits & TRAIT_PRECISE_SHOT != 0
 
     def is_flash_trap(self):
-        return self._unique_skill1 == "閃光陷阱" or self._unique_skill2 == "閃光陷阱"
+        return self._traits & TRAIT_FLASH_TRAP != 0
 
     def is_blood_cry(self):
-        return self._unique_skill1 == "血之悲鳴" or self._unique_skill2 == "血之悲鳴"
+        return self._traits & TRAIT_BLOOD_CRY != 0
 
     def is_meteor(self):
-        return self._unique_skill1 == "隕石" or self._unique_skill2 == "隕石"
+        return self._traits & TRAIT_METEOR != 0
 
     def is_wind_blade(self):
-        return self._unique_skill1 == "風刃" or self._unique_skill2 == "風刃"
+        return self._traits & TRAIT_WIND_BLADE != 0
 
     def is_fireball(self):
-        return self._unique_skill1 == "火球" or self._unique_skill2 == "火球"
+        return self._traits & TRAIT_FIREBALL != 0
 
     def is_lightning(self):
-        return self._unique_skill1 == "雷擊" or self._unique_skill2 == "雷擊"
+        return self._traits & TRAIT_LIGHTNING != 0
 
     def is_freeze(self):
-        return self._unique_skill1 == "冰凍" or self._unique_skill2 == "冰凍"
+        return self._traits & TRAIT_FREEZE != 0
@@ -0,0 +1,166 @@
+# models/card_db.py
+#
+# Compiled card database. The text card file stays the source of truth; the
+# compiled file next to it (cardDB.txt -> cardDB.cdb) is rebuilt whenever the
+# text file changes and is read back with a single read.
+#
+# Layout (little endian):
+#   header   magic, version, source mtime_ns, source size, source sha256,
+#            number of strings, number of cards
+#   strings  per string: uint16 byte length + utf-8 bytes
+#   cards    per card: uint16 card id and string indexes of type, element,
+#            property, name, unique skill 1 and unique skill 2 (NO_STRING if None)
+
+import hashlib
+import os
+import struct
+from .card import Card
+
+MAGIC = b'AGCD'
+VERSION = 1
+HEADER = struct.Struct('<4sHqq32sII')
+STRING_LENGTH = struct.Struct('<H')
+CARD_RECORD = struct.Struct('<7H')
+NO_STRING = 0xFFFF
+
+def parse_text(path):
+    """
+    Parses a text card file, one card per line:
+    card_id card_type element property name [unique_skill1 [unique_skill2]]
+    """
+    cards = []
+    try:
+        with open(path, 'r', encoding="UTF-8") as file:
+            for line in file:
+                parts = line.strip().split(' ')
+                if len(parts) >= 5:
+                    card = Card(
+                        card_id=parts[0],
+                        card_type=parts[1],
+                        element=parts[2],
+                        property_=parts[3],
+                        name=parts[4],
+                        unique_skill1=parts[5] if len(parts) > 5 else None,
+                        unique_skill2=parts[6] if len(parts) > 6 else None
+                    )
+                    cards.append(card)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Card file {path} not found.")
+    return cards
+
+def compiled_path(text_path):
+    return os.path.splitext(text_path)[0] + '.cdb'
+
+def _source_hash(text_path):
+    with open(text_path, 'rb') as file:
+        return hashlib.sha256(file.read()).digest()
+
+def compile_card_db(text_path, db_path=None):
+    """
+    Compiles the text card file into the binary format and returns the parsed cards.
+    """
+    db_path = db_path or compiled_path(text_path)
+    cards = parse_text(text_path)
+    stat = os.stat(text_path)
+
+    strings = []
+    string_ids = {}
+    def string_id(value):
+        if value is None:
+            return NO_STRING
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    records = []
+    for card in cards:
+        records.append(CARD_RECORD.pack(
+            card.get_card_id(),
+            string_id(card.get_card_type()),
+            string_id(card.get_element()),
+            string_id(card.get_property()),
+            string_id(card.get_name()),
+            string_id(card.get_unique_skills()[0]),
+            string_id(card.get_unique_skills()[1]),
+        ))
+
+    chunks = [HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, stat.st_size, _source_hash(text_path),
+                          len(strings), len(cards))]
+    for value in strings:
+        encoded = value.encode('utf-8')
+        chunks.append(STRING_LENGTH.pack(len(encoded)))
+        chunks.append(encoded)
+    chunks.extend(records)
+
+    tmp_path = f"{db_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(b''.join(chunks))
+    os.replace(tmp_path, db_path)
+    return cards
+
+def read_card_db(db_path, text_path=None):
+    """
+    Reads a compiled card file. Returns None if it is missing, malformed or older than text_path.
+    The source is considered unchanged if its mtime and size match, or failing that, its hash.
+    """
+    try:
+        with open(db_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    if len(data) < HEADER.size:
+        return None
+    magic, version, mtime_ns, size, source_hash, num_strings, num_cards = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        return None
+    if text_path is not None:
+        stat = os.stat(text_path)
+        if (stat.st_mtime_ns != mtime_ns or stat.st_size != size) and _source_hash(text_path) != source_hash:
+            return None
+
+    try:
+        return _decode_cards(data, num_strings, num_cards)
+    except (struct.error, IndexError, UnicodeDecodeError):
+        # truncated or corrupted after the header
+        return None
+
+def _decode_cards(data, num_strings, num_cards):
+    offset = HEADER.size
+    strings = []
+    for _ in range(num_strings):
+        (length,) = STRING_LENGTH.unpack_from(data, offset)
+        offset += STRING_LENGTH.size
+        strings.append(data[offset:offset + length].decode('utf-8'))
+        offset += length
+    if len(data) != offset + num_cards * CARD_RECORD.size:
+        return None
+
+    cards = []
+    for card_id, card_type, element, property_, name, skill1, skill2 in CARD_RECORD.iter_unpack(data[offset:]):
+        cards.append(Card(
+            card_id=card_id,
+            card_type=strings[card_type],
+            element=strings[element],
+            property_=strings[property_],
+            name=strings[name],
+            unique_skill1=None if skill1 == NO_STRING else strings[skill1],
+            unique_skill2=None if skill2 == NO_STRING else strings[skill2]
+        ))
+    return cards
+
+def load_cards(text_path):
+    """
+    Returns the cards of text_path, from the compiled file when it is up to date.
+    Otherwise the text file is parsed and the compiled file rebuilt; if it cannot be
+    written, the parsed cards are used as they are.
+    """
+    if not os.path.exists(text_path):
+        raise FileNotFoundError(f"Card file {text_path} not found.")
+    cards = read_card_db(compiled_path(text_path), text_path)
+    if cards is not None:
+        return cards
+    try:
+        return compile_card_db(text_path)
+    except OSError:
+        return parse_text(text_path)
@@ -0,0 +1,42 @@
+# models/card_table.py
+
+import os
+from .card_db import load_cards
+
+class CardTable:
+    """
+    Immutable table of the cards of one card file, indexed by card id.
+    Tables are cached per file, so every Deck built from the same file
+    shares the same Card objects.
+    """
+    _tables = {}
+
+    def __init__(self, cards):
+        self._cards = tuple(cards)
+        by_id = [None] * (max((card.get_card_id() for card in self._cards), default=-1) + 1)
+        for card in self._cards:
+            if by_id[card.get_card_id()] is not None:
+                raise ValueError(f"Duplicate card id {card.get_card_id()}.")
+            by_id[card.get_card_id()] = card
+        self._by_id = tuple(by_id)
+
+    @classmethod
+    def load(cls, path):
+        key = os.path.abspath(path)
+        table = cls._tables.get(key)
+        if table is None:
+            table = cls(load_cards(path))
+            cls._tables[key] = table
+        return table
+
+    def get(self, card_id):
+        return self._by_id[card_id]
+
+    def __getitem__(self, card_id):
+        return self._by_id[card_id]
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __len__(self):
+        return len(self._cards)
@@ -2,8 +2,11 @@
 
 from timeline import GameTimeline, DamageTimeline
 from models import Jewel, PlayerHeal, PlayerHand, PlayerEffects
+from models.card import (TRAIT_ATTACK, TRAIT_DARK_EXTINCTION, TRAIT_HOLY_LIGHT, TRAIT_MAGIC_BULLET,
+                         ELEMENT_TRAIT_MASK)
 from models.effect import PoisonEffect, WeaknessEffect
 from factories.action_factory import ActionFactory
+from factories.action_generator import LegalActionGenerator
 
 class BasePlayer:
     def __init__(self, character_config):
@@ -14,6 +17,7 @@ class BasePlayer:
         self._interface = self._game_engine.get_interface()
         self._event_manager = self._game_engine.get_event_manager()
         self._action_factory = ActionFactory(player=self)
+        self._action_generator = LegalActionGenerator(player=self, action_factory=self._action_factory)
         
         self._heal = PlayerHeal()
         self._hand = PlayerHand()
@@ -32,11 +36,13 @@ class BasePlayer:
         self._setup_event_handlers()
 
     def _setup_event_handlers(self):
+        # Game timeline events are emitted for the player whose turn it is,
+        # so the player's handlers only listen to their own turn.
         for event_type, handlers in GameTimeline.items():
             for priority, handler_name in enumerate(handlers):
                 handler = getattr(self, handler_name, None)
                 if handler:
-                    self._event_manager.subscribe(event_type, handler, priority=priority)
+                    self._event_manager.subscribe(event_type, handler, priority=priority, subject=self._id)
 
         for event_type, handlers in DamageTimeline.items():
             for priority, handler_name in enumerate(handlers):
@@ -45,19 +51,13 @@ class BasePlayer:
                     self._event_manager.subscribe(event_type, handler, priority=priority)
 
     def _poison_trigger(self, event):
-        if event.data['player'].get_id() != self._id:
-            return
-        self._interface.send_message(f'processing poison trigger for player {self._id}', debug=True)
-        poison_effects = self._effects.get_effects(PoisonEffect)
-        seats = self._game_engine.get_seats_order(self)
-        poison_effects_sorted = sorted(poison_effects, key=lambda effect: seats.index(effect.get_source().get_id()))
-        for poison_effect in poison_effects_sorted:
+        self._interface.log_debug('processing poison trigger for player {}', self._id)
+        # already in resolution order, see add_effect
+        for poison_effect in self._effects.get_effects(PoisonEffect):
             poison_effect.execute()
 
     def _weakness_trigger(self, event):
-        if event.data['player'].get_id() != self._id:
-            return
-        self._interface.send_message(f'processing weakness trigger for player {self._id}', debug=True)
+        self._interface.log_debug('processing weakness trigger for player {}', self._id)
         weakness_effects = self._effects.get_effects(WeaknessEffect)
         if len(weakness_effects) > 1:
             raise Exception("Player has more than one weakness effect.")
@@ -81,29 +81,31 @@ class BasePlayer:
                 raise Exception("Player chose not to select an action.")
             
             if selected_action.is_no_response():
-                self._interface.send_message(f"Player {self._id} chose to end their turn.", broadcast=True)
+                self._interface.log_info("Player {} chose to end their turn.", self._id, broadcast=True)
                 break
             
             success = selected_action.execute()
             if success:
                 selected_action.on_action_success()
-                self._event_manager.emit('after_action_phase', player=self, action=selected_action)
+                self._event_manager.emit('after_action_phase', subject=self._id, player=self, action=selected_action)
             else:
                 raise Exception("Action execution failed.")
             # Action points are deducted within execute_action if successful
+            if not self._game_engine.is_running():
+                break
             
             available_actions = self._get_available_actions()
             if not available_actions:
-                self._interface.send_message("No more available actions.", debug=True)
+                self._interface.log_debug("No more available actions.")
                 break
             else:
                 available_actions.extend(self._action_factory.create_no_response_action())
     
     def after_action(self, event):
-        self._interface.send_message(f"Player {self._id} performed action: {event.data['action']}", debug=True)
+        self._interface.log_debug("Player {} performed action: {}", self._id, event.data['action'])
 
     def reset_actions(self):
-        self._interface.send_message(f'resetting actions for player {self._id}', debug=True)
+        self._interface.log_debug('resetting actions for player {}', self._id)
         self._action_points = {
             "general": 1,
             "attack": 0,
@@ -112,31 +114,31 @@ class BasePlayer:
         }
 
     def draw_initial_hand(self):
-        self._interface.send_message(f"Player {self._id} drew initial hand.", debug=True)
+        self._interface.log_debug("Player {} drew initial hand.", self._id)
         initial_cards = self._deck.deal(3)
         exploded = self._hand.add_cards(initial_cards)
         if exploded:
             raise Exception("Player's initial hand exploded.")
 
     def take_damage(self, amount, damage_type='attack', **kwargs):
-        self._interface.send_message(f"Player {self._id} takes {amount} {damage_type} damage.", debug=True)
+        self._interface.log_debug("Player {} takes {} {} damage.", self._id, amount, damage_type)
         cards_drawn = self._deck.deal(amount)
         morale_penalty = self.add_cards(cards_drawn)
         if 'event' in kwargs:
-            if kwargs['event'].get('max_morale_penalty', 100) < morale_penalty:
-                morale_penalty = kwargs['event'].get('max_morale_penalty', 100)
+            attack_event = kwargs['event'].data.get('attack_event', {})
+            if attack_event.get('max_morale_penalty', 100) < morale_penalty:
+                morale_penalty = attack_event.get('max_morale_penalty', 100)
             kwargs['event'].data['morale_penalty'] = morale_penalty
         self._team.add_morale(-morale_penalty)
 
     def _get_available_actions(self):
-        available_actions = []
-
-        available_actions.extend(self._action_factory.create_character_action())
-        for card in self._hand.get_cards():
-            available_actions.extend(self._action_factory.create_card_action(card))
-        available_actions.extend(self._action_factory.create_special_action())
+        return self._action_generator.get_available_actions()
 
-        return available_actions
+    def get_available_actions(self):
+        """
+        Returns the actions the player can take now. Cheap enough for bots to call in tight loops.
+        """
+        return self._action_generator.get_available_actions()
     
     def get_valid_counter_actions(self, attack_event):
         """
@@ -144,8 +146,26 @@ class BasePlayer:
         """
         valid_counter_actions = []
         valid_counter_actions.extend(self._action_factory.create_no_response_action())
-        for card in self._hand.get_cards():
-            valid_counter_actions.extend(self._action_factory.create_counter_card_action(attack_event, card))
+
+        # only look at the cards that can answer this attack
+        attack_type = attack_event['attack_type']
+        hand = self._hand
+        mask = hand.get_traits_mask(TRAIT_HOLY_LIGHT)
+        counter_targets = None
+        if attack_type == "attack" or attack_type == "counter":
+            counter_mask = hand.get_traits_mask(TRAIT_DARK_EXTINCTION)
+            element_traits = attack_event['card'].get_traits() & ELEMENT_TRAIT_MASK
+            if element_traits:
+                counter_mask |= hand.get_traits_mask(TRAIT_ATTACK | element_traits)
+            if counter_mask:
+                counter_targets = self._game_engine.get_counter_targets(self, attack_event['attacker'])
+                if counter_targets:
+                    mask |= counter_mask
+        elif attack_type == "magic_bullet":
+            mask |= hand.get_traits_mask(TRAIT_MAGIC_BULLET)
+
+        for card in hand.get_cards_in_mask(mask):
+            valid_counter_actions.extend(self._action_factory.create_counter_card_action(attack_event, card, counter_targets))
         
         return valid_counter_actions
 
@@ -158,6 +178,21 @@ class BasePlayer:
 Hand: {self._hand}, Effects: {self._effects}, \
 Heal: {self._heal}")
 
+    def get_public_state(self):
+        """
+        Returns the player's public information as a JSON-compatible dict, without revealing the hand.
+        """
+        return {
+            'team': 'red' if self._team.is_red() else 'blue',
+            'gem': self._jewels.get_gem(),
+            'crystal': self._jewels.get_crystal(),
+            'hand': self._hand.size(),
+            'hand_max': self._hand.get_max_size(),
+            'effects': [str(effect) for effect in self._effects.get_effects()],
+            'heal': self._heal.get_amount(),
+            'heal_max': self._heal.get_max_amount(),
+        }
+
     def respond_to_damage(self, damage):
         """
         Allows the player to respond to incoming damage with healing or other effects.
@@ -168,7 +203,7 @@ Heal: {self._heal}")
         healing_available = min(self._heal.get_amount(), damage)
         healing_to_use = 0
         if healing_available > 0:
-            self._interface.send_message(f"Player {self._id} has {healing_available} healing available.", debug=True)
+            self._interface.log_debug("Player {} has {} healing available.", self._id, healing_available)
             actions = [i for i in range(healing_available + 1)]
             healing_to_use = self._interface.prompt_action_selection(actions, player_id=self._id)
         if healing_to_use > 0:
@@ -178,6 +213,25 @@ Heal: {self._heal}")
     def __str__(self):
         # Optional: Override to prevent displaying the hand when not needed
         return self.get_public_info()
+
+    def snapshot(self):
+        return (
+            self._heal.snapshot(),
+            self._hand.snapshot(),
+            self._effects.snapshot(),
+            self._jewels.snapshot(),
+            self._state.copy(),
+            self._action_points.copy(),
+        )
+
+    def restore(self, snapshot):
+        heal, hand, effects, jewels, state, action_points = snapshot
+        self._heal.restore(heal)
+        self._hand.restore(hand)
+        self._effects.restore(effects, self._game_engine)
+        self._jewels.restore(jewels)
+        self._state = state.copy()
+        self._action_points = action_points.copy()
     
     # Getters
     def get_id(self):
@@ -198,9 +252,9 @@ Heal: {self._heal}")
     # hand related
     def show_hand(self):
         hand = self._hand.get_cards()
-        self._interface.send_message(f"\n--- Player {self._id}'s Hand ---", player_id=self._id)
+        self._interface.log_info("\n--- Player {}'s Hand ---", self._id, player_id=self._id)
         for idx, card in enumerate(hand):
-            self._interface.send_message(f"{idx}: {card}", player_id=self._id)
+            self._interface.log_info("{}: {}", idx, card, player_id=self._id)
         self._interface.send_message("--------------------------\n", player_id=self._id)
     
     def add_cards(self, cards):
@@ -222,7 +276,7 @@ Heal: {self._heal}")
         if recycle:
             self._deck.recycle(cards)
         if exhibition:
-            self._interface.send_message(f"Player {self._id} discarded {cards} for exhibition.", broadcast=True)
+            self._interface.log_info("Player {} discarded {} for exhibition.", self._id, cards, broadcast=True)
 
     def _handle_exploding_hand(self):
         """
@@ -231,12 +285,12 @@ Heal: {self._heal}")
         Returns the morale penalty for the player's team.
         """
         excess_cards = self._hand.size() - self._hand.get_max_size()
-        self._interface.send_message(f"Player {self._id} has exceeded the hand limit by {excess_cards} card(s). Must discard down to {self._hand.get_max_size()} cards.", player_id=self._id)
+        self._interface.log_info("Player {} has exceeded the hand limit by {} card(s). Must discard down to {} cards.", self._id, excess_cards, self._hand.get_max_size(), player_id=self._id)
 
         discard_choice = self._interface.prompt_multiple_action_selection(self._hand.get_cards(), min_selections=excess_cards, 
                                                                             max_selections=excess_cards, player_id=self._id)
         self.remove_cards(discard_choice)
-        self._interface.send_message(f"Player {self._id}'s hand size is now {self._hand.size()}.", debug=True)
+        self._interface.log_debug("Player {}'s hand size is now {}.", self._id, self._hand.size())
         
         morale_penalty = excess_cards
         return morale_penalty
@@ -262,6 +316,9 @@ Heal: {self._heal}")
     
     def get_hand_cards(self):
         return self._hand.get_cards()
+
+    def get_hand_version(self):
+        return self._hand.get_version()
     
     #TODO
     # can discard same type of hand cards
@@ -271,15 +328,26 @@ Heal: {self._heal}")
     def get_effects(self, effect_type=None):
         return self._effects.get_effects(effect_type)
     
+    def has_effect(self, effect_type):
+        return self._effects.has_effect(effect_type)
+
+    def count_effects(self, effect_type=None):
+        return self._effects.count_effects(effect_type)
+
     def add_effect(self, effect):
-        self._effects.add_effect(effect)
+        if isinstance(effect, PoisonEffect):
+            # Poisons resolve in seat order from this player; a player may poison
+            # themselves, and their own poison resolves last.
+            self._effects.add_effect(effect, rank=self._game_engine.get_seat_ranks(self)[effect.get_source().get_id()])
+        else:
+            self._effects.add_effect(effect)
     
     def remove_effect(self, effect):
         self._effects.remove_effect(effect)
     
     # healing related
     def _use_healing(self, amount):
-        self._interface.send_message(f"Player {self._id} uses {amount} healing.", debug=True)
+        self._interface.log_debug("Player {} uses {} healing.", self._id, amount)
         self._heal.remove(amount)
 
     def get_heal_amount(self):
@@ -306,19 +374,22 @@ Heal: {self._heal}")
         return self._jewels.can_remove(gem_remove, crystal_remove)
     
     def add_jewel(self, gem_add=0, crystal_add=0):
-        self._interface.send_message(f"Player {self._id} added {gem_add} gem(s) and {crystal_add} crystal(s).", debug=True)
+        self._interface.log_debug("Player {} added {} gem(s) and {} crystal(s).", self._id, gem_add, crystal_add)
         self._jewels.add_jewel(gem_add, crystal_add)
     
     def remove_jewel(self, gem_remove=0, crystal_remove=0):
-        self._interface.send_message(f"Player {self._id} removed {gem_remove} gem(s) and {crystal_remove} crystal(s).", debug=True)
+        self._interface.log_debug("Player {} removed {} gem(s) and {} crystal(s).", self._id, gem_remove, crystal_remove)
         self._jewels.remove_jewel(gem_remove, crystal_remove)
     
-    def get_jewel_combination(self, min_num, max_num, gem_min=0, crystal_min=0):
-        return self._jewels.get_jewel_combination(min_num, max_num, gem_min, crystal_min)
+    def get_jewel_combination(self, min_num, max_num, gem_min=0, crystal_min=0, capacity=None):
+        return self._jewels.get_jewel_combination(min_num, max_num, gem_min, crystal_min, capacity)
+
+    def get_jewel_capacity(self):
+        return self._jewels.get_capacity()
 
     # action points related
     def add_action_point(self, action_type):
-        self._interface.send_message(f"Player {self._id} added 1 action point to {action_type}.", debug=True)
+        self._interface.log_debug("Player {} added 1 action point to {}.", self._id, action_type)
         self._action_points[action_type] += 1
     
     def remove_action_point(self, action_type):
@@ -337,9 +408,11 @@ Heal: {self._heal}")
     # state related
     def set_state(self, state_type, value):
         self._state[state_type] = value
+        if state_type.startswith('can_be_'):
+            self._game_engine.set_player_targetable(self, state_type[len('can_be_'):], value)
     
     def set_targetable_state(self, effect_type, value):
-        self._state[f'can_be_{effect_type}'] = value
+        self.set_state(f'can_be_{effect_type}', value)
     
     def can_be_targeted(self, effect_type):
         return self._state.get(f'can_be_{effect_type}', True)
@@ -1,40 +1,25 @@
 # models/deck.py
 
 import random
-from models import Card
+from models import CardTable
 
 class Deck:
-    def __init__(self, card_file_path, interface):
+    def __init__(self, card_file_path, interface, seed=None):
         self.interface = interface
+        self._card_file_path = card_file_path
+        self._rng = random.Random(seed)
         self.cards = self.load_cards(card_file_path)
         self.discards = []
         self.shuffle()
 
     def load_cards(self, path):
-        cards = []
-        try:
-            with open(path, 'r', encoding="UTF-8") as file:
-                for line in file:
-                    parts = line.strip().split(' ')
-                    if len(parts) >= 5:
-                        card = Card(
-                            card_id=parts[0],
-                            card_type=parts[1],
-                            element=parts[2],
-                            property_=parts[3],
-                            name=parts[4],
-                            unique_skill1=parts[5] if len(parts) > 5 else None,
-                            unique_skill2=parts[6] if len(parts) > 6 else None
-                        )
-                        cards.append(card)
-            self.interface.send_message(f"Loaded {len(cards)} cards into the deck.", debug=True)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Card file {path} not found.")
+        cards = list(CardTable.load(path))
+        self.interface.log_debug("Loaded {} cards into the deck.", len(cards))
         return cards
 
     def shuffle(self):
-        random.shuffle(self.cards)
-        self.interface.send_message("Deck shuffled.", debug=True)
+        self._rng.shuffle(self.cards)
+        self.interface.log_debug("Deck shuffled.")
 
     def deal(self, num):
         dealt_cards = []
@@ -43,21 +28,50 @@ class Deck:
                 self.reset_deck()
             if self.cards:
                 dealt_cards.append(self.cards.pop())
-        self.interface.send_message(f"Dealt {len(dealt_cards)} card(s).", debug=True)
+        self.interface.log_debug("Dealt {} card(s).", len(dealt_cards))
         return dealt_cards
 
     def recycle(self, cards):
         self.discards.extend(cards)
-        self.interface.send_message(f"Recycled {len(cards)} card(s) into discards.", debug=True)
+        self.interface.log_debug("Recycled {} card(s) into discards.", len(cards))
 
     def reset_deck(self):
         if self.discards:
             self.cards = self.discards.copy()
             self.discards = []
             self.shuffle()
-            self.interface.send_message("Deck reset from discards.", debug=True)
+            self.interface.log_debug("Deck reset from discards.")
         else:
-            self.interface.send_message("No cards to reset the deck.", debug=True)
+            self.interface.log_debug("No cards to reset the deck.")
+
+    def new_game(self, seed=None):
+        """
+        Puts every card back and shuffles them as a new deck built with seed would.
+        """
+        self._rng.seed(seed)
+        self.cards = self.load_cards(self._card_file_path)
+        self.discards = []
+        self.shuffle()
+
+    def snapshot(self):
+        return (tuple(self.cards), tuple(self.discards), self._rng.getstate())
+
+    def restore(self, snapshot):
+        cards, discards, rng_state = snapshot
+        self.cards = list(cards)
+        self.discards = list(discards)
+        self._rng.setstate(rng_state)
+
+    def clone(self, interface):
+        """
+        Returns a copy of the deck without reloading the card file. Cards are shared.
+        """
+        deck = Deck.__new__(Deck)
+        deck.interface = interface
+        deck._card_file_path = self._card_file_path
+        deck._rng = random.Random(0)
+        deck.restore(self.snapshot())
+        return deck
 
     def __str__(self):
         return f"Deck has {len(self.cards)} card(s)."
\ No newline at end of file
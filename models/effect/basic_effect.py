@@ -20,17 +20,29 @@ class BasicEffect(BaseEffect):
     def __str__(self):
         return "BasicEffect"
 
+    def snapshot(self):
+        return (type(self), self._source.get_id(), self._target.get_id(), self._card)
+
+    @classmethod
+    def from_snapshot(cls, snapshot, game_engine):
+        """
+        Rebuilds the effect for the players of game_engine.
+        """
+        _, source_id, target_id, card = snapshot
+        return cls(source=game_engine.get_player(source_id), target=game_engine.get_player(target_id),
+                   game_engine=game_engine, card=card)
+
 class PoisonEffect(BasicEffect):
     def __init__(self, source, target, game_engine, card, amount=1):
         super().__init__(source, target, game_engine, card)
         self._amount = amount
 
     def apply(self):
-        self._interface.send_message(f"Player {self._target.get_id()} is poisoned by Player {self._source.get_id()}.", debug=True)
+        self._interface.log_debug("Player {} is poisoned by Player {}.", self._target.get_id(), self._source.get_id())
         self._target.add_effect(self)
 
     def execute(self):
-        self._interface.send_message(f"Processing PoisonEffect to Player {self._target.get_id()} by Player {self._source.get_id()}: {self._amount} damage.", broadcast=True)
+        self._interface.log_info("Processing PoisonEffect to Player {} by Player {}: {} damage.", self._target.get_id(), self._source.get_id(), self._amount, broadcast=True)
 
         attack_event = {
             'attack_type': "magic",
@@ -49,9 +61,18 @@ class PoisonEffect(BasicEffect):
     def get_source(self):
         return self._source
 
+    def snapshot(self):
+        return (type(self), self._source.get_id(), self._target.get_id(), self._card, self._amount)
+
+    @classmethod
+    def from_snapshot(cls, snapshot, game_engine):
+        _, source_id, target_id, card, amount = snapshot
+        return cls(source=game_engine.get_player(source_id), target=game_engine.get_player(target_id),
+                   game_engine=game_engine, card=card, amount=amount)
+
 class WeaknessEffect(BasicEffect):
     def apply(self):
-        self._interface.send_message(f"Player {self._target.get_id()} is weakened by Player {self._source.get_id()}.", debug=True)
+        self._interface.log_debug("Player {} is weakened by Player {}.", self._target.get_id(), self._source.get_id())
         self._target.add_effect(self)
         self._target.set_targetable_state(effect_type="weakness", value=False)
 
@@ -59,7 +80,7 @@ class WeaknessEffect(BasicEffect):
         """
         Returns True if the turn should continue, False if the turn should end.
         """
-        self._interface.send_message(f"Processing WeaknessEffect to Player {self._target.get_id()} by Player {self._source.get_id()}.", broadcast=True)
+        self._interface.log_info("Processing WeaknessEffect to Player {} by Player {}.", self._target.get_id(), self._source.get_id(), broadcast=True)
         
         valid_actions = ['skip turn', 'draw 3 cards']
         action = self._interface.prompt_action_selection(valid_actions, player_id=self._target.get_id())
@@ -87,12 +108,12 @@ class WeaknessEffect(BasicEffect):
 
 class HolyShieldEffect(BasicEffect):
     def apply(self):
-        self._interface.send_message(f"Player {self._target.get_id()} activates Holy Shield.", debug=True)
+        self._interface.log_debug("Player {} activates Holy Shield.", self._target.get_id())
         self._target.add_effect(self)
         self._target.set_targetable_state(effect_type="holy_shield", value=False)
 
     def execute(self):
-        self._interface.send_message(f"Processing HolyShieldEffect to Player {self._target.get_id()}.", broadcast=True)
+        self._interface.log_info("Processing HolyShieldEffect to Player {}.", self._target.get_id(), broadcast=True)
         self._target.remove_effect(self)
         self._game_engine.get_deck().recycle([self._card])
         self._target.set_targetable_state(effect_type="holy_shield", value=True)
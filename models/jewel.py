@@ -1,5 +1,32 @@
 # models/jewel.py
 
+# (gem, crystal, min_num, max_num, gem_min, crystal_min, capacity) -> combinations
+_combination_table = {}
+
+def jewel_combinations(gem, crystal, min_num, max_num, gem_min=0, crystal_min=0, capacity=None):
+    """
+    Returns the (gem, crystal) pairs that can be taken out of gem gems and crystal crystals:
+    between min_num and max_num jewels, with at least gem_min gems and crystal_min crystals,
+    and no more than capacity jewels if capacity is given. Pairs are ordered by total, then
+    by gem count.
+
+    Results are computed once per key and shared, so they are returned as tuples.
+    """
+    key = (gem, crystal, min_num, max_num, gem_min, crystal_min, capacity)
+    combinations = _combination_table.get(key)
+    if combinations is None:
+        if capacity is not None:
+            max_num = min(max_num, capacity)
+        combinations = []
+        for total_jewels in range(max(min_num, gem_min + crystal_min), min(max_num, gem + crystal) + 1):
+            for gem_count in range(max(gem_min, total_jewels - crystal), min(gem, total_jewels - crystal_min) + 1):
+                crystal_count = total_jewels - gem_count
+                if crystal_count >= crystal_min and gem_count <= gem and crystal_count <= crystal:
+                    combinations.append((gem_count, crystal_count))
+        combinations = tuple(combinations)
+        _combination_table[key] = combinations
+    return combinations
+
 class Jewel:
     def __init__(self, maxJewel=5):
         self._gem = 0
@@ -26,23 +53,37 @@ class Jewel:
         else:
             raise ValueError("Not enough jewels to remove.")
         
-    def get_jewel_combination(self, min_num, max_num, gem_min=0, crystal_min=0):
+    def get_jewel_combination(self, min_num, max_num, gem_min=0, crystal_min=0, capacity=None):
+        """
+        Returns the (gem, crystal) pairs that can be taken, as a shared immutable tuple.
+        See jewel_combinations.
+        """
         if max_num < gem_min + crystal_min or max_num > self._max_jewel:
             raise ValueError("Invalid maximum number of jewels.")
         if gem_min > self._gem or crystal_min > self._crystal:
             raise ValueError("Not enough jewels to remove.")
-        
-        combinations = []
-        for total_jewels in range(max(min_num, gem_min + crystal_min), min(max_num, self.total_jewels()) + 1):
-            for gem in range(max(gem_min, total_jewels - self._crystal), min(self._gem, total_jewels - crystal_min) + 1):
-                crystal = total_jewels - gem
-                if crystal >= crystal_min and gem <= self._gem and crystal <= self._crystal:
-                    combinations.append((gem, crystal))
-        
-        return combinations
+        return jewel_combinations(self._gem, self._crystal, min_num, max_num, gem_min, crystal_min, capacity)
+
+    def get_capacity(self):
+        """
+        Returns how many more jewels fit.
+        """
+        return self._max_jewel - self._gem - self._crystal
 
     def total_jewels(self):
         return self._gem + self._crystal
+
+    def get_gem(self):
+        return self._gem
+
+    def get_crystal(self):
+        return self._crystal
+
+    def snapshot(self):
+        return (self._gem, self._crystal, self._max_jewel)
+
+    def restore(self, snapshot):
+        self._gem, self._crystal, self._max_jewel = snapshot
     
     def __str__(self):
         return f"{self._gem}/{self._crystal}"
\ No newline at end of file
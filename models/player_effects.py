@@ -1,27 +1,82 @@
 # models/player_effects.py
 
 class PlayerEffects:
+    """
+    Effects on a player, bucketed by effect class, so looking up, checking and removing
+    effects of a type does not scan the other effects.
+
+    Every effect has a rank. Within a bucket effects are kept in ascending rank, then in
+    the order they were added, so stacked poisons come out in resolution order without
+    sorting when they trigger.
+    """
     def __init__(self):
-        self._effects = []
+        self._effects = {}  # effect -> rank, in the order added
+        self._buckets = {}  # effect class -> {effect: rank}, in rank order
+        self._bucket_types = {}  # queried type -> effect classes that are subclasses of it
 
-    def add_effect(self, effect):
-        self._effects.append(effect)
+    def add_effect(self, effect, rank=0):
+        self._effects[effect] = rank
+        effect_class = type(effect)
+        bucket = self._buckets.get(effect_class)
+        if bucket is None:
+            bucket = self._buckets[effect_class] = {}
+            self._bucket_types = {}
+        last_rank = next(reversed(bucket.values()), rank)
+        bucket[effect] = rank
+        if rank < last_rank:
+            # sorted is stable, so equal ranks stay in the order they were added
+            self._buckets[effect_class] = dict(sorted(bucket.items(), key=lambda item: item[1]))
 
     def remove_effect(self, effect):
         if effect in self._effects:
-            self._effects.remove(effect)
+            del self._effects[effect]
+            del self._buckets[type(effect)][effect]
         else:
             raise Exception(f"Effect {effect} not found in effects.")
 
+    def _get_bucket_types(self, effect_type):
+        bucket_types = self._bucket_types.get(effect_type)
+        if bucket_types is None:
+            bucket_types = tuple(effect_class for effect_class in self._buckets if issubclass(effect_class, effect_type))
+            self._bucket_types[effect_type] = bucket_types
+        return bucket_types
+
     def get_effects(self, effect_type=None):
-        if effect_type:
-            effects = [effect for effect in self._effects if isinstance(effect, effect_type)]
-            return effects
-        else:
-            return self._effects
-    
+        """
+        Returns a new list of the effects of effect_type (subclasses included) in rank
+        order, or of every effect in the order added if effect_type is None.
+        """
+        if effect_type is None:
+            return list(self._effects)
+        effects = []
+        for effect_class in self._get_bucket_types(effect_type):
+            effects.extend(self._buckets[effect_class])
+        return effects
+
+    def count_effects(self, effect_type=None):
+        """
+        Returns the number of effects of effect_type (subclasses included), or of every
+        effect if effect_type is None, without listing them.
+        """
+        if effect_type is None:
+            return len(self._effects)
+        return sum(len(self._buckets[effect_class]) for effect_class in self._get_bucket_types(effect_type))
+
+    def has_effect(self, effect_type):
+        return any(self._buckets[effect_class] for effect_class in self._get_bucket_types(effect_type))
+
     def clear(self):
-        self._effects = []
+        self._effects = {}
+        self._buckets = {}
+        self._bucket_types = {}
+
+    def snapshot(self):
+        return tuple((effect.snapshot(), rank) for effect, rank in self._effects.items())
+
+    def restore(self, snapshot, game_engine):
+        self.clear()
+        for effect_state, rank in snapshot:
+            self.add_effect(effect_state[0].from_snapshot(effect_state, game_engine), rank)
 
     def __str__(self):
-        return f"Effects: {[str(effect) for effect in self._effects]}"
\ No newline at end of file
+        return f"Effects: {[str(effect) for effect in self._effects]}"
@@ -1,45 +1,171 @@
 # models/player_hand.py
 
+from models.card import CARD_TYPES, TYPE_TRAITS, ELEMENTS, ELEMENT_TRAITS, NAME_TRAITS
+
+_TYPE_ID_TRAITS = {CARD_TYPES[name]: trait for name, trait in TYPE_TRAITS.items()}
+_ELEMENT_ID_TRAITS = {ELEMENTS[name]: trait for name, trait in ELEMENT_TRAITS.items()}
+
+# trait bits of each traits value, filled on first use
+_trait_bits = {}
+
+def _split_traits(traits):
+    bits = _trait_bits.get(traits)
+    if bits is None:
+        bits = tuple(1 << index for index in range(traits.bit_length()) if traits >> index & 1)
+        _trait_bits[traits] = bits
+    return bits
+
 class PlayerHand:
+    """
+    Cards held by a player, as a bitmask over card ids (bit card_id is set for every
+    held card) plus an ordered view of the cards for display. Adding, removing and
+    membership tests are O(1).
+
+    For every trait bit of models.card the hand also keeps the mask of the held cards
+    having that trait, so questions such as "how many fire attack cards do I hold" are
+    an AND of masks and a popcount.
+    """
     def __init__(self, max_size=6):
-        self._cards = []
+        self._cards = {}  # card -> None, in hand order
+        self._view = None
+        self._mask = 0
+        self._trait_masks = {}
         self._max_size = max_size
-    
+        self._version = 0
+
+    def _changed(self):
+        self._view = None
+        self._version += 1
+
+    def _index(self, card):
+        bit = 1 << card.get_card_id()
+        self._mask |= bit
+        trait_masks = self._trait_masks
+        for trait in _split_traits(card.get_traits()):
+            trait_masks[trait] = trait_masks.get(trait, 0) | bit
+
+    def _unindex(self, card):
+        bit = 1 << card.get_card_id()
+        self._mask &= ~bit
+        trait_masks = self._trait_masks
+        for trait in _split_traits(card.get_traits()):
+            trait_masks[trait] &= ~bit
+
+    def _reindex(self):
+        self._mask = 0
+        self._trait_masks = {}
+        for card in self._cards:
+            self._index(card)
+
     def add_cards(self, cards):
-        self._cards.extend(cards)
+        for card in cards:
+            self._cards[card] = None
+            self._index(card)
+        self._changed()
         return self.exploded()
 
     def remove_cards(self, cards):
         for card in cards:
             if card in self._cards:
-                self._cards.remove(card)
+                del self._cards[card]
+                self._unindex(card)
             else:
                 raise Exception(f"Card {card} not found in hand.")
+        self._changed()
+
+    def __contains__(self, card):
+        return card in self._cards
 
     def size(self):
         return len(self._cards)
-    
+
     def get_max_size(self):
         return self._max_size
 
     def is_full(self):
         return len(self._cards) == self._max_size
-    
+
     def exploded(self):
         return len(self._cards) > self._max_size
 
     def clear(self):
-        self._cards = []
+        self._cards = {}
+        self._reindex()
+        self._changed()
 
     def can_draw_cards(self, number):
         return (len(self._cards) + number) <= self._max_size
-    
+
     def __str__(self):
         return f"{len(self._cards)}/{self._max_size}"
-    
+
     def get_cards(self):
-        return self._cards
-    
+        """
+        Returns the held cards in hand order. The list must not be modified.
+        """
+        if self._view is None:
+            self._view = list(self._cards)
+        return self._view
+
+    def get_mask(self):
+        """
+        Returns the held cards as a bitmask over card ids.
+        """
+        return self._mask
+
+    def get_traits_mask(self, traits):
+        """
+        Returns the mask of the held cards having all the given trait bits.
+        """
+        mask = self._mask
+        trait_masks = self._trait_masks
+        for trait in _split_traits(traits):
+            mask &= trait_masks.get(trait, 0)
+        return mask
+
+    def count_traits(self, traits):
+        """
+        Returns the number of held cards having all the given trait bits.
+        """
+        return self.get_traits_mask(traits).bit_count()
+
+    def get_cards_in_mask(self, mask):
+        """
+        Returns the held cards whose bit is set in mask, in hand order.
+        """
+        if mask & self._mask == self._mask:
+            return self.get_cards()
+        return [card for card in self._cards if mask >> card.get_card_id() & 1]
+
+    def get_cards_with_traits(self, traits):
+        return self.get_cards_in_mask(self.get_traits_mask(traits))
+
+    def get_cards_by_element(self, element_id):
+        return self.get_cards_with_traits(_ELEMENT_ID_TRAITS[element_id]) if element_id in _ELEMENT_ID_TRAITS else []
+
+    def get_cards_by_type(self, type_id):
+        return self.get_cards_with_traits(_TYPE_ID_TRAITS[type_id]) if type_id in _TYPE_ID_TRAITS else []
+
+    def get_cards_by_name(self, name):
+        if name in NAME_TRAITS:
+            return self.get_cards_with_traits(NAME_TRAITS[name])
+        return [card for card in self._cards if card.get_name() == name]
+
     def set_max_size(self, max_size):
         self._max_size = max_size
+        self._version += 1
+
+    def get_version(self):
+        """
+        Returns a number that changes whenever the hand changes.
+        """
+        return self._version
+
+    def snapshot(self):
+        return (tuple(self._cards), self._max_size)
 
+    def restore(self, snapshot):
+        cards, self._max_size = snapshot
+        self._cards = dict.fromkeys(cards)
+        self._reindex()
+        self._changed()
@@ -23,6 +23,12 @@ class PlayerHeal:
     def set_amount(self, amount):
         self._amount = amount
 
+    def snapshot(self):
+        return (self._amount, self._max_amount)
+
+    def restore(self, snapshot):
+        self._amount, self._max_amount = snapshot
+
     def __str__(self):
         return f"{self._amount}/{self._max_amount}"
 
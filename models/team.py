@@ -14,42 +14,66 @@ class Team:
         self._players = []
 
     def add_player(self, player):
-        self._interface.send_message(f"Player {player.get_id()} added to {'Red' if self._is_red else 'Blue'} Team.", debug=True)
+        self._interface.log_debug("Player {} added to {} Team.", player.get_id(), 'Red' if self._is_red else 'Blue')
         self._players.append(player)
 
     def add_morale(self, amount):
         self._morale += amount
         action = "increased" if amount >= 0 else "decreased"
-        self._interface.send_message(f"{'Red' if self._is_red else 'Blue'} Team morale {action} by {abs(amount)}. Current morale: {self._morale}", broadcast=True)
+        self._interface.log_info("{} Team morale {} by {}. Current morale: {}", 'Red' if self._is_red else 'Blue', action, abs(amount), self._morale, broadcast=True)
         self._check_end()
 
     def add_grail(self, amount):
         self._grail += amount
-        self._interface.send_message(f"{'Red' if self._is_red else 'Blue'} Team grail increased by {amount}. Current grail: {self._grail}", broadcast=True)
+        self._interface.log_info("{} Team grail increased by {}. Current grail: {}", 'Red' if self._is_red else 'Blue', amount, self._grail, broadcast=True)
         self._check_end()
 
     def _check_end(self):
         if self._grail >= 5:
-            self._interface.send_message(f"{'Red' if self._is_red else 'Blue'} Team has synthesized 5 grails and wins the game!", broadcast=True)
+            self._interface.log_info("{} Team has synthesized 5 grails and wins the game!", 'Red' if self._is_red else 'Blue', broadcast=True)
             self._game_engine.end_game(self._is_red)
         if self._morale <= 0:
-            self._interface.send_message(f"{'Red' if self._is_red else 'Blue'} Team morale has dropped to {self._morale} and loses the game!", broadcast=True)
+            self._interface.log_info("{} Team morale has dropped to {} and loses the game!", 'Red' if self._is_red else 'Blue', self._morale, broadcast=True)
             self._game_engine.end_game(not self._is_red)
     
     def add_jewel(self, gem_add=0, crystal_add=0):
-        self._interface.send_message(f"{'Red' if self._is_red else 'Blue'} Team added {gem_add} gem(s) and {crystal_add} crystal(s).", debug=True)
+        self._interface.log_debug("{} Team added {} gem(s) and {} crystal(s).", 'Red' if self._is_red else 'Blue', gem_add, crystal_add)
         self._jewels.add_jewel(gem_add, crystal_add)
     
     def remove_jewel(self, gem_remove=0, crystal_remove=0):
-        self._interface.send_message(f"{'Red' if self._is_red else 'Blue'} Team removed {gem_remove} gem(s) and {crystal_remove} crystal(s).", debug=True)
+        self._interface.log_debug("{} Team removed {} gem(s) and {} crystal(s).", 'Red' if self._is_red else 'Blue', gem_remove, crystal_remove)
         self._jewels.remove_jewel(gem_remove, crystal_remove)
 
     def is_red(self):
         return self._is_red
+
+    def get_morale(self):
+        return self._morale
+
+    def get_grail(self):
+        return self._grail
+
+    def get_players(self):
+        return self._players
+
+    def snapshot(self):
+        return (self._jewels.snapshot(), self._morale, self._grail)
+
+    def restore(self, snapshot):
+        jewels, self._morale, self._grail = snapshot
+        self._jewels.restore(jewels)
     
     def get_opposite_team(self):
         return self._game_engine.get_opposite_team(self)
 
+    def get_public_state(self):
+        return {
+            'morale': self._morale,
+            'grail': self._grail,
+            'gem': self._jewels.get_gem(),
+            'crystal': self._jewels.get_crystal(),
+        }
+
     def __str__(self):
         team_color = "Red" if self._is_red else "Blue"
         team_info = (f"{team_color} Team - Morale: {self._morale}, Grail: {self._grail}, Jewels(G/C): {self._jewels}\n"
@@ -59,6 +83,9 @@ class Team:
             team_info += f"\n{player_info}"
         return team_info
     
+    def get_jewels(self):
+        return self._jewels
+
     def total_jewels(self):
         return self._jewels.total_jewels()
     
@@ -77,5 +104,8 @@ class Team:
     def get_synthesis_jewel_combination(self):
         return self._jewels.get_jewel_combination(min_num=3, max_num=3)
     
-    def get_refine_jewel_combination(self):
-        return self._jewels.get_jewel_combination(min_num=1, max_num=2)
+    def get_refine_jewel_combination(self, capacity=None):
+        """
+        Returns the combinations a player can refine, at most capacity jewels if given.
+        """
+        return self._jewels.get_jewel_combination(min_num=1, max_num=2, capacity=capacity)
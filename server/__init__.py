@@ -1,3 +1,5 @@
 from .game_server import GameServer
+from .game_table import GameTable, TableStats
+from .table_manager import TableManager
 
-__all__ = ['GameServer']
+__all__ = ['GameServer', 'GameTable', 'TableStats', 'TableManager']
@@ -0,0 +1,47 @@
+# server/connection.py
+
+# Outgoing bytes allowed to pile up for one client before it is dropped as too slow.
+MAX_WRITE_BUFFER = 1 << 20
+
+class ClientConnection:
+    """
+    One connected client: its stream pair, its seat and the future of the prompt it has to answer.
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.player_id = None
+        self.table = None
+        self.pending_response = None
+        self.closed = False
+
+    def send(self, data):
+        if self.writer.is_closing():
+            return
+        self.writer.write(data)
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.close(ConnectionError(f"Player {self.player_id} is not reading its messages."))
+
+    def expect_response(self, loop):
+        self.pending_response = loop.create_future()
+        if self.closed or self.writer.is_closing():
+            # the prompt cannot reach the client, so its answer is never coming
+            self.fail_response(ConnectionError(f"Player {self.player_id} disconnected."))
+
+    def resolve(self, message):
+        if self.pending_response is not None and not self.pending_response.done():
+            self.pending_response.set_result(message)
+
+    def fail_response(self, error):
+        """
+        Fails the pending prompt with error. The game thread may have stopped waiting
+        already, so the error is marked as retrieved to keep asyncio from logging it.
+        """
+        if self.pending_response is not None and not self.pending_response.done():
+            self.pending_response.set_exception(error)
+            self.pending_response.exception()
+
+    def close(self, error=None):
+        self.closed = True
+        self.fail_response(error or ConnectionError(f"Player {self.player_id} disconnected."))
+        self.writer.close()
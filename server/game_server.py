@@ -1,73 +1,92 @@
 # server/game_server.py
 
-import socket
-import json
-import threading
-from game_engine.engine import GameEngine
+import asyncio
+from .connection import ClientConnection
+from .protocol import encode_message, read_message, ProtocolError, PROMPT_TYPES
+from .table_manager import TableManager
+from .game_table import RESPONSE_TIMEOUT
 
 class GameServer:
-    def __init__(self, host, port, num_players):
+    """
+    Hosts networked games on asyncio streams.
+
+    All sockets are served by a single event loop. A client joins by sending
+    {"type": "join"} as its first message, optionally with the id of the table to sit
+    at; the TableManager seats it and runs every full table in its own worker.
+
+    :param max_tables: Number of games played at the same time.
+    :param max_games: Stop after this many games, or run forever if None.
+    :param journal_dir: Directory to journal every game into, one file per table.
+    :param response_timeout: Seconds a player has to answer a prompt before its game is aborted.
+    """
+    def __init__(self, host, port, num_players, max_tables=1, max_games=1, deck_path="assets/cardDB.txt", debug=False,
+                 journal_dir=None, response_timeout=RESPONSE_TIMEOUT):
         self.host = host
         self.port = port
         self.num_players = num_players
-        self.game_engine = None
-        self.clients = []
-        self.server_socket = None
+        self.max_games = max_games
+        self.tables = TableManager(num_players, max_tables=max_tables, deck_path=deck_path, debug=debug,
+                                   on_table_end=self._on_table_end, journal_dir=journal_dir,
+                                   response_timeout=response_timeout)
+        self._server = None
+        self._done = None
 
     def start(self):
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(self.num_players)
-        print(f"Server started on {self.host}:{self.port}")
+        asyncio.run(self.serve())
 
-        while len(self.clients) < self.num_players:
-            client_socket, addr = self.server_socket.accept()
-            print(f"New connection from {addr}")
-            self.clients.append(client_socket)
-            threading.Thread(target=self.handle_client, args=(client_socket,)).start()
+    async def serve(self):
+        self._done = asyncio.Event()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        print(f"Server started on {self.host}:{self.port}")
+        try:
+            await self._done.wait()
+        finally:
+            self._server.close()
+            for table in list(self.tables.tables.values()):
+                table.close()
+            await self.tables.wait_closed()
+            await self._server.wait_closed()
 
-        self.start_game()
+    def _on_table_end(self, table, error):
+        stats = table.stats.summary()
+        result = f"failed: {error}" if error else "finished"
+        print(f"Table {table.table_id} {result} (cpu {stats['cpu_time']:.3f}s, wall {stats['wall_time']:.1f}s, "
+              f"{stats['prompts']} prompts, mean wait {stats['response_wait_mean'] * 1000:.1f}ms, "
+              f"max wait {stats['response_wait_max'] * 1000:.1f}ms)")
+        if self.max_games is not None and self.tables.num_games_finished() >= self.max_games:
+            self._done.set()
 
-    def handle_client(self, client_socket):
-        while True:
+    async def _handle_connection(self, reader, writer):
+        client = ClientConnection(reader, writer)
+        error = None
+        try:
+            message = await read_message(reader)
+            if message is None:
+                return
+            if message['type'] != 'join':
+                raise ProtocolError("The first message must be a join.")
             try:
-                data = client_socket.recv(1024).decode('utf-8')
-                if not data:
+                table = self.tables.assign(client, message.get('table'))
+            except ValueError as e:
+                client.send(encode_message({"type": "error", "content": str(e)}))
+                return
+            print(f"New connection from {writer.get_extra_info('peername')} "
+                  f"as player {client.player_id} at table {table.table_id}")
+            client.send(encode_message({"type": "welcome", "player_id": client.player_id, "table": table.table_id}))
+            while True:
+                message = await read_message(reader)
+                if message is None:
                     break
-                self.process_client_message(client_socket, json.loads(data))
-            except Exception as e:
-                print(f"Error handling client: {e}")
-                break
-        client_socket.close()
+                self.process_client_message(client, message)
+        except (ProtocolError, ConnectionError) as e:
+            print(f"Error handling player {client.player_id}: {e}")
+            error = ConnectionError(f"Player {client.player_id} was disconnected: {e}")
+        finally:
+            client.close(error)
+            if client.table is not None:
+                client.table.leave(client)
 
-    def process_client_message(self, client_socket, message):
-        if message['type'] == 'action_selection':
-            # Handle action selection
-            pass
-        elif message['type'] == 'yes_no_prompt':
-            # Handle yes/no prompt
-            pass
+    def process_client_message(self, client, message):
+        if message['type'] in PROMPT_TYPES:
+            client.resolve(message)
         # ... (handle other message types)
-
-    def start_game(self):
-        config = {
-            'num_players': self.num_players,
-            'red_players': [1, 3],
-            'blue_players': [2, 4],
-            'deck_path': "cardDB.txt",
-            'networked': True,
-            'game_server': self
-        }
-        self.game_engine = AgrGameEngine(config)
-        self.game_engine.start_game()
-
-    def broadcast(self, message):
-        for client in self.clients:
-            client.send(json.dumps(message).encode('utf-8'))
-
-    def send_to_player(self, player_id, message):
-        self.clients[player_id - 1].send(json.dumps(message).encode('utf-8'))
-
-    def wait_for_response(self, player_id):
-        # Implement logic to wait for a response from a specific player
-        pass
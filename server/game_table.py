@@ -0,0 +1,207 @@
+# server/game_table.py
+
+import asyncio
+import concurrent.futures
+import time
+from game_engine.engine import GameEngine
+from game_engine.journal import GameJournal
+from .protocol import encode_message, encode_json, encode_batch, PROMPT_TYPES
+
+# Seconds a player has to answer a prompt before the game is aborted
+RESPONSE_TIMEOUT = 300.0
+
+class TableStats:
+    """
+    Resource accounting of one table. CPU time is the CPU time of the thread running
+    the engine, so time spent waiting for players is not counted; response waits are
+    measured from the moment the game thread starts waiting to the moment the answer arrives.
+    """
+    def __init__(self):
+        self.cpu_time = 0.0
+        self.wall_time = 0.0
+        self.prompts = 0
+        self.response_wait_total = 0.0
+        self.response_wait_max = 0.0
+
+    def add_response_wait(self, seconds):
+        self.prompts += 1
+        self.response_wait_total += seconds
+        if seconds > self.response_wait_max:
+            self.response_wait_max = seconds
+
+    def summary(self):
+        return {
+            'cpu_time': self.cpu_time,
+            'wall_time': self.wall_time,
+            'prompts': self.prompts,
+            'response_wait_mean': self.response_wait_total / self.prompts if self.prompts else 0.0,
+            'response_wait_max': self.response_wait_max,
+        }
+
+class GameTable:
+    """
+    One game and the clients seated at it. The table is the game server of its engine:
+    send_to_player, broadcast and wait_for_response are called from the thread running
+    the engine and hand the work over to the event loop.
+
+    A game cannot go on without one of its players: once it has started, a client that
+    leaves or does not answer a prompt within response_timeout seconds aborts it.
+    """
+    def __init__(self, table_id, num_players, loop, deck_path="assets/cardDB.txt", debug=False, journal_path=None,
+                 response_timeout=RESPONSE_TIMEOUT):
+        self.table_id = table_id
+        self.num_players = num_players
+        self.deck_path = deck_path
+        self.journal_path = journal_path
+        self.debug = debug
+        self.clients = {}
+        self.game_engine = None
+        # set when the full table is handed to the worker pool, before the engine exists
+        self.started = False
+        self.response_timeout = response_timeout
+        self._abort_error = None
+        self.stats = TableStats()
+        self._loop = loop
+
+    def is_full(self):
+        return len(self.clients) == self.num_players
+
+    def seat(self, client):
+        """
+        Seats client on the first free seat and returns its player id.
+        """
+        player_id = next(pid for pid in range(1, self.num_players + 1) if pid not in self.clients)
+        self.clients[player_id] = client
+        client.player_id = player_id
+        client.table = self
+        return player_id
+
+    def leave(self, client):
+        """
+        Frees the seat of a client that disconnects before the game starts, or aborts
+        the game if it has started.
+        """
+        if self.clients.get(client.player_id) is not client:
+            return
+        if not self.started:
+            del self.clients[client.player_id]
+        elif self._abort_error is None:
+            self._abort_error = ConnectionError(f"Player {client.player_id} left the game.")
+            # wake the game thread if it is waiting on another player
+            for other in self.clients.values():
+                other.fail_response(self._abort_error)
+
+    def close(self):
+        for client in self.clients.values():
+            client.close()
+
+    def run(self):
+        """
+        Plays the game to the end. Runs in a worker thread.
+        """
+        config = {
+            'player': [{'pid': pid, 'character_type': 'BasePlayer', 'team': 'red' if pid % 2 == 1 else 'blue'}
+                       for pid in range(1, self.num_players + 1)],
+            'deck_path': self.deck_path,
+            'networked': True,
+            'game_server': self,
+            'debug': self.debug
+        }
+        journal = GameJournal.open(self.journal_path) if self.journal_path is not None else None
+        config['journal'] = journal
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            self.game_engine = GameEngine(config)
+            self.game_engine.start_game()
+        finally:
+            self.stats.cpu_time = time.thread_time() - start_cpu
+            self.stats.wall_time = time.perf_counter() - start_wall
+            if journal is not None:
+                journal.close()
+
+    # Called from the game thread
+    def _call_in_loop(self, callback, *args):
+        self._loop.call_soon_threadsafe(callback, *args)
+
+    def _send(self, player_id, data, expects_response):
+        client = self.clients.get(player_id)
+        if client is None:
+            return
+        if expects_response:
+            client.expect_response(self._loop)
+        client.send(data)
+
+    def _broadcast(self, data):
+        for client in self.clients.values():
+            client.send(data)
+
+    def _send_frames(self, frames, prompted_player_id):
+        for player_id, data in frames.items():
+            self._send(player_id, data, player_id == prompted_player_id)
+
+    def get_player_ids(self):
+        return list(range(1, self.num_players + 1))
+
+    def send_batches(self, batches, prompted_player_id=None):
+        """
+        Sends each player its list of messages as one frame, all in a single hand-over to
+        the event loop. A message object shared by several lists is JSON encoded once.
+        If the batch of prompted_player_id ends with a prompt, its response future is
+        registered before the frame goes out.
+        """
+        texts = {}
+        frames = {}
+        for player_id, messages in batches.items():
+            parts = []
+            for message in messages:
+                text = texts.get(id(message))
+                if text is None:
+                    text = texts[id(message)] = encode_json(message)
+                parts.append(text)
+            frames[player_id] = encode_batch(parts)
+        self._call_in_loop(self._send_frames, frames, prompted_player_id)
+
+    def broadcast(self, message):
+        self._call_in_loop(self._broadcast, encode_message(message))
+
+    def send_to_player(self, player_id, message):
+        """
+        Sends message to a player. A prompt also registers the future its answer resolves,
+        before the prompt goes out, so an early answer is never missed.
+        """
+        self._call_in_loop(self._send, player_id, encode_message(message), message.get('type') in PROMPT_TYPES)
+
+    async def _wait_response(self, player_id):
+        client = self.clients.get(player_id)
+        if client is None or client.pending_response is None:
+            raise ConnectionError(f"Player {player_id} has no pending prompt.")
+        try:
+            return await client.pending_response
+        finally:
+            client.pending_response = None
+
+    def _cancel_response(self, player_id):
+        client = self.clients.get(player_id)
+        if client is not None and client.pending_response is not None:
+            client.pending_response.cancel()
+
+    def wait_for_response(self, player_id, timeout=None):
+        """
+        Blocks the game thread until the player answers the last prompt sent to them.
+        Raises ConnectionError if the game was aborted or the answer does not come within
+        timeout seconds (response_timeout by default).
+        """
+        if self._abort_error is not None:
+            raise self._abort_error
+        timeout = self.response_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        future = asyncio.run_coroutine_threadsafe(self._wait_response(player_id), self._loop)
+        try:
+            response = future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # cancelling the prompt's future ends _wait_response and leaves nothing for close() to fail
+            self._call_in_loop(self._cancel_response, player_id)
+            raise ConnectionError(f"Player {player_id} did not answer within {timeout:g}s.")
+        self.stats.add_response_wait(time.perf_counter() - start)
+        return response
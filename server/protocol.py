@@ -0,0 +1,72 @@
+# server/protocol.py
+#
+# Wire format shared by the server and the client. Every message is a JSON object
+# sent as one frame: a 4-byte big-endian length followed by that many bytes of UTF-8 JSON.
+
+import json
+import struct
+
+FRAME_HEADER = struct.Struct('>I')
+MAX_MESSAGE_SIZE = 1 << 20
+
+# Messages the server sends that the client must answer with a message of the same type.
+PROMPT_TYPES = frozenset(["action_selection", "yes_no_prompt", "multiple_action_selection"])
+
+class ProtocolError(Exception):
+    pass
+
+def encode_json(message):
+    """
+    Returns the JSON text of message, as put in frames.
+    """
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':'))
+
+def encode_frame(text):
+    """
+    Returns the JSON text of one message as a complete frame.
+    """
+    payload = text.encode('utf-8')
+    if len(payload) > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message of {len(payload)} bytes exceeds the {MAX_MESSAGE_SIZE} byte limit.")
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+def encode_message(message):
+    """
+    Returns message as a complete frame.
+    """
+    return encode_frame(encode_json(message))
+
+def encode_batch(texts):
+    """
+    Returns one frame holding the messages whose JSON texts are given, in order: the message
+    itself if there is only one, otherwise a {"type": "batch", "messages": [...]} message.
+    The texts are spliced in as they are, so a message shared by several batches is encoded once.
+    """
+    if len(texts) == 1:
+        return encode_frame(texts[0])
+    return encode_frame('{"type":"batch","messages":[' + ','.join(texts) + ']}')
+
+async def read_message(reader):
+    """
+    Reads one frame from an asyncio StreamReader and returns the decoded message,
+    or None if the connection was closed between frames. A connection closed inside
+    a frame raises ProtocolError.
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except EOFError:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Incoming message of {length} bytes exceeds the {MAX_MESSAGE_SIZE} byte limit.")
+    try:
+        payload = await reader.readexactly(length)
+    except EOFError:
+        raise ProtocolError(f"Connection closed in the middle of a {length} byte message.")
+    try:
+        message = json.loads(payload.decode('utf-8'))
+    except ValueError as e:
+        raise ProtocolError(f"Malformed message: {e}")
+    if not isinstance(message, dict) or 'type' not in message:
+        raise ProtocolError("Message must be a JSON object with a type.")
+    return message
@@ -0,0 +1,97 @@
+# server/table_manager.py
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from .game_table import GameTable, RESPONSE_TIMEOUT
+
+class TableManager:
+    """
+    Runs many independent tables in one process.
+
+    Connections are routed to the table they ask for, or to the first table with a free
+    seat. A table starts once it is full and its engine runs on a worker of a pool sized
+    to the maximum number of tables, so a table waiting on a slow player only holds its
+    own worker and never delays the other tables. Finished tables are dropped and their
+    statistics kept.
+
+    :param journal_dir: Directory where each table appends its games to a journal file.
+    :param response_timeout: Seconds a player has to answer a prompt.
+    """
+    def __init__(self, num_players, max_tables=1, deck_path="assets/cardDB.txt", debug=False, on_table_end=None,
+                 journal_dir=None, response_timeout=RESPONSE_TIMEOUT):
+        self.num_players = num_players
+        self.max_tables = max_tables
+        self.deck_path = deck_path
+        self.journal_dir = journal_dir
+        self.debug = debug
+        self.response_timeout = response_timeout
+        self.tables = {}
+        self.finished = []
+        self._on_table_end = on_table_end
+        self._table_ids = count(1)
+        self._running = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_tables, thread_name_prefix="table")
+
+    def _open_table(self, loop):
+        table_id = next(self._table_ids)
+        journal_path = None
+        if self.journal_dir is not None:
+            journal_path = os.path.join(self.journal_dir, f"table-{table_id}.rjl.gz")
+        table = GameTable(table_id, self.num_players, loop, deck_path=self.deck_path, debug=self.debug,
+                          journal_path=journal_path, response_timeout=self.response_timeout)
+        self.tables[table.table_id] = table
+        return table
+
+    def assign(self, client, table_id=None):
+        """
+        Seats client and returns its table. Raises ValueError if the requested table
+        cannot take the client, or if every table is busy.
+        """
+        loop = asyncio.get_running_loop()
+        if table_id is not None:
+            table = self.tables.get(table_id)
+            if table is None or table.is_full():
+                raise ValueError(f"Table {table_id} is not open.")
+        else:
+            table = next((t for t in self.tables.values() if not t.is_full()), None)
+            if table is None:
+                if len(self.tables) >= self.max_tables:
+                    raise ValueError("Every table is busy.")
+                table = self._open_table(loop)
+        table.seat(client)
+        if table.is_full():
+            table.started = True
+            task = loop.create_task(self._run_table(table))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        return table
+
+    async def _run_table(self, table):
+        error = None
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, table.run)
+        except Exception as e:
+            error = e
+        finally:
+            table.close()
+            del self.tables[table.table_id]
+            self.finished.append((table.table_id, table.stats.summary()))
+            if self._on_table_end is not None:
+                self._on_table_end(table, error)
+
+    def stats(self):
+        """
+        Returns (table id, stats summary) of every running and finished table.
+        """
+        running = [(table.table_id, table.stats.summary()) for table in self.tables.values()]
+        return self.finished + running
+
+    def num_games_finished(self):
+        return len(self.finished)
+
+    async def wait_closed(self):
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,35 @@
+# simulation/__init__.py
+
+import importlib
+from .simulator import Simulator, run_game, build_headless_config, create_agent
+from .tournament import Tournament, TournamentStats
+
+# These need NumPy, which only the batch and training tools use, so they are imported
+# on first access and the rest of the game runs without NumPy installed.
+_NUMPY_EXPORTS = {
+    'BatchSimulator': '.batch_simulator',
+    'cross_check': '.batch_simulator',
+    'ObservationEncoder': '.observation',
+    'VecEnv': '.vec_env',
+    'ActionSpace': '.vec_env',
+}
+
+def __getattr__(name):
+    module = _NUMPY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
+__all__ = [
+    'Simulator',
+    'run_game',
+    'build_headless_config',
+    'create_agent',
+    'Tournament',
+    'TournamentStats',
+    'BatchSimulator',
+    'cross_check',
+    'ObservationEncoder',
+    'VecEnv',
+    'ActionSpace',
+]
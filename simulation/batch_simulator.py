@@ -0,0 +1,558 @@
+# simulation/batch_simulator.py
+
+import random
+import time
+import numpy as np
+from game_engine import GameEngine
+from agents import PriorityAgent
+from models import CardTable
+from .simulator import build_headless_config
+
+# Attack types of a pending attack
+ATTACK = 0
+COUNTER = 1
+MAGIC_BULLET = 2
+
+MAX_HAND_SIZE = 6
+TEAM_MAX_JEWELS = 5
+PLAYER_MAX_JEWELS = 3
+INITIAL_MORALE = 15
+INITIAL_HEAL = 2
+WINNING_GRAIL = 5
+
+# Turn action categories of the batched policy, in priority order
+(SYNTHESIS, ATTACK_CARD, MAGIC_BULLET_CARD, POISON_CARD, WEAKNESS_OPPONENT, HOLY_SHIELD_ALLY,
+ PURCHASE, REFINE, WEAKNESS_ANY, HOLY_SHIELD_ANY) = range(10)
+
+class BatchSimulator:
+    """
+    Plays many games in lockstep on NumPy arrays, following the rules of GameEngine,
+    Team, Jewel and the action classes, with every player using the PriorityAgent policy.
+
+    Every array has the game as its first axis: team morale, grail and jewels are
+    (games, 2) with red first, player heal and jewels are (games, players), hands are
+    (games, players, cards) boolean card-id masks and effects hold card ids (-1 for none).
+    All games take their turn at the same time, and each rule is applied to every game
+    it concerns with one array operation.
+
+    :param exact_shuffle: Shuffle each game's deck with random.Random(seed) like Deck does,
+                          so that a game plays exactly like GameEngine with the same seed.
+                          Otherwise decks are shuffled by NumPy, which is much faster.
+    """
+    def __init__(self, num_players=4, deck_path="assets/cardDB.txt", max_turns=500, exact_shuffle=False):
+        if num_players < 2:
+            raise ValueError("A game needs at least two players.")
+        self.num_players = num_players
+        self.max_turns = max_turns
+        self.exact_shuffle = exact_shuffle
+
+        table = CardTable.load(deck_path)
+        self._initial_order = [card.get_card_id() for card in table]
+        self.num_cards = max(self._initial_order) + 1
+        def card_mask(predicate):
+            mask = np.zeros(self.num_cards, dtype=bool)
+            for card in table:
+                mask[card.get_card_id()] = predicate(card)
+            return mask
+        self._is_attack = card_mask(lambda card: card.is_attack())
+        self._is_magic_bullet = card_mask(lambda card: card.is_magic_bullet())
+        self._is_poison = card_mask(lambda card: card.is_poison())
+        self._is_weakness = card_mask(lambda card: card.is_weakness())
+        self._is_holy_shield = card_mask(lambda card: card.is_holy_shield())
+        self._is_holy_light = card_mask(lambda card: card.is_holy_light())
+        self._is_dark_extinction = card_mask(lambda card: card.is_dark_extinction())
+        element = np.full(self.num_cards, -1, dtype=np.int8)
+        for card in table:
+            element[card.get_card_id()] = card.get_element_id()
+        # _counters[card]: attack cards that can counter an attack made with card
+        self._counters = self._is_attack & ((element[None, :] == element[:, None]) | self._is_dark_extinction)
+        self._max_poisons = max(int(self._is_poison.sum()), 1)
+
+        # Seating, as in build_headless_config: seats alternate red and blue
+        seats = np.arange(num_players)
+        self._team = seats % 2
+        self._opponents = self._team[:, None] != self._team[None, :]
+        self._allies = ~self._opponents
+        self._next_opponent = np.array([next(q % num_players for q in range(p + 1, p + num_players)
+                                             if self._team[q % num_players] != self._team[p])
+                                        for p in seats])
+        # _seat_rank[target, source]: order in which target's poisons resolve, own poison last
+        self._seat_rank = (seats[None, :] - seats[:, None] - 1) % num_players
+
+    # Setup
+    def _setup(self, num_games, seeds, rng):
+        games, players, cards = num_games, self.num_players, self.num_cards
+        self._rng = rng
+        self._morale = np.full((games, 2), INITIAL_MORALE, dtype=np.int32)
+        self._grail = np.zeros((games, 2), dtype=np.int32)
+        self._team_gem = np.full((games, 2), 3, dtype=np.int32)
+        self._team_crystal = np.full((games, 2), 2, dtype=np.int32)
+        self._heal = np.full((games, players), INITIAL_HEAL, dtype=np.int32)
+        self._gem = np.zeros((games, players), dtype=np.int32)
+        self._crystal = np.zeros((games, players), dtype=np.int32)
+        self._action_points = np.zeros((games, players), dtype=np.int32)
+        self._hand = np.zeros((games, players, cards), dtype=bool)
+        self._hand_size = np.zeros((games, players), dtype=np.int32)
+        self._poison_card = np.full((games, players, self._max_poisons), -1, dtype=np.int32)
+        self._poison_source = np.zeros((games, players, self._max_poisons), dtype=np.int32)
+        self._poison_count = np.zeros((games, players), dtype=np.int32)
+        self._weakness_card = np.full((games, players), -1, dtype=np.int32)
+        self._holy_shield_card = np.full((games, players), -1, dtype=np.int32)
+        self._running = np.ones(games, dtype=bool)
+        self._winner = np.full(games, -1, dtype=np.int8)
+        self._error = np.zeros(games, dtype=bool)
+        self._turns = np.zeros(games, dtype=np.int32)
+
+        self._deck = np.zeros((games, cards), dtype=np.int32)
+        self._discards = np.zeros((games, cards), dtype=np.int32)
+        self._discard_count = np.zeros(games, dtype=np.int32)
+        num_deck = len(self._initial_order)
+        self._deck_count = np.full(games, num_deck, dtype=np.int32)
+        if self.exact_shuffle:
+            self._rngs = [random.Random(seed) for seed in seeds]
+            for game, game_rng in enumerate(self._rngs):
+                order = list(self._initial_order)
+                game_rng.shuffle(order)
+                self._deck[game, :num_deck] = order
+        else:
+            keys = rng.random((games, num_deck))
+            self._deck[:, :num_deck] = np.asarray(self._initial_order)[np.argsort(keys, axis=1)]
+
+        all_games = np.arange(games)
+        for player in range(players):
+            self._deal(all_games, np.full(games, player), np.full(games, 3))
+
+    # Deck
+    def _reset_decks(self, games):
+        games = games[self._discard_count[games] > 0]
+        if len(games) == 0:
+            return
+        counts = self._discard_count[games]
+        if self.exact_shuffle:
+            for game, count in zip(games.tolist(), counts.tolist()):
+                cards = self._discards[game, :count].tolist()
+                self._rngs[game].shuffle(cards)
+                self._deck[game, :count] = cards
+        else:
+            keys = self._rng.random((len(games), self.num_cards))
+            keys[np.arange(self.num_cards)[None, :] >= counts[:, None]] = 2.0
+            order = np.argsort(keys, axis=1)
+            self._deck[games] = np.take_along_axis(self._discards[games], order, axis=1)
+        self._deck_count[games] = counts
+        self._discard_count[games] = 0
+
+    def _deal(self, games, players, amounts):
+        """
+        Deals amounts[i] cards to players[i] in games[i], one at a time like Deck.deal,
+        refilling a deck from its discards when it runs out. Games must be unique.
+        """
+        for step in range(int(amounts.max(initial=0))):
+            selected = amounts > step
+            step_games, step_players = games[selected], players[selected]
+            empty = self._deck_count[step_games] == 0
+            if empty.any():
+                self._reset_decks(step_games[empty])
+                has_cards = self._deck_count[step_games] > 0
+                step_games, step_players = step_games[has_cards], step_players[has_cards]
+            self._deck_count[step_games] -= 1
+            cards = self._deck[step_games, self._deck_count[step_games]]
+            self._hand[step_games, step_players, cards] = True
+            self._hand_size[step_games, step_players] += 1
+
+    def _recycle(self, games, cards):
+        self._discards[games, self._discard_count[games]] = cards
+        self._discard_count[games] += 1
+
+    def _remove_card(self, games, players, cards, recycle=True):
+        self._hand[games, players, cards] = False
+        self._hand_size[games, players] -= 1
+        if recycle:
+            self._recycle(games, cards)
+
+    # Team
+    def _end_game(self, games, winning_teams):
+        running = self._running[games]
+        self._winner[games[running]] = winning_teams[running]
+        self._running[games] = False
+
+    def _add_morale(self, games, teams, amounts):
+        self._morale[games, teams] += amounts
+        lost = self._morale[games, teams] <= 0
+        if lost.any():
+            self._end_game(games[lost], 1 - teams[lost])
+
+    def _add_grail(self, games, teams):
+        self._grail[games, teams] += 1
+        won = self._grail[games, teams] >= WINNING_GRAIL
+        if won.any():
+            self._end_game(games[won], teams[won])
+
+    # Players
+    def _take_damage(self, games, players, amounts):
+        """
+        Draws amounts cards, discards the lowest card ids above the hand limit and
+        lowers the team morale by the number of discarded cards.
+        """
+        self._deal(games, players, amounts)
+        excess = self._hand_size[games, players] - MAX_HAND_SIZE
+        exploded = excess > 0
+        if not exploded.any():
+            return
+        games, players, excess = games[exploded], players[exploded], excess[exploded]
+        hands = self._hand[games, players]
+        ranks = np.cumsum(hands, axis=1)
+        discarded = hands & (ranks <= excess[:, None])
+        rows, cards = np.nonzero(discarded)
+        self._discards[games[rows], self._discard_count[games[rows]] + ranks[rows, cards] - 1] = cards
+        self._discard_count[games] += excess
+        self._hand[games[rows], players[rows], cards] = False
+        self._hand_size[games, players] -= excess
+        self._add_morale(games, self._team[players], -excess)
+
+    def _respond_to_damage(self, games, players, amounts):
+        """
+        Heals as much of amounts as possible and returns the damage left.
+        """
+        healing = np.minimum(self._heal[games, players], amounts)
+        self._heal[games, players] -= healing
+        return amounts - healing
+
+    def _most_cards(self, games, candidates):
+        """
+        Returns, per game, the candidate seat holding the most cards (the earliest seat on
+        ties) and whether there was any candidate. candidates is a (games, players) mask.
+        """
+        scores = np.where(candidates, self._hand_size[games], -1)
+        return np.argmax(scores, axis=1), candidates.any(axis=1)
+
+    # Damage timeline
+    def _resolve_attacks(self, games, attackers, defenders, cards, attack_types, damages):
+        """
+        Plays the damage timeline of one pending attack per game, counters included,
+        until every attack has missed or dealt its damage.
+        """
+        while len(games):
+            hands = self._hand[games, defenders]
+            normal = attack_types != MAGIC_BULLET
+            matching = hands & self._counters[cards]
+            counter_targets = self._opponents[defenders] & (np.arange(self.num_players)[None, :] != attackers[:, None])
+            counter_target, has_target = self._most_cards(games, counter_targets)
+            counter = normal & matching.any(axis=1) & has_target
+            bullet = ~normal & (hands & self._is_magic_bullet).any(axis=1)
+            holy_light = ~counter & ~bullet & (hands & self._is_holy_light).any(axis=1)
+            no_response = ~counter & ~bullet & ~holy_light
+
+            # Holy light cancels the attack
+            if holy_light.any():
+                light_cards = np.argmax(hands[holy_light] & self._is_holy_light, axis=1)
+                self._remove_card(games[holy_light], defenders[holy_light], light_cards)
+
+            # Holy shield blocks an unanswered attack
+            shielded = no_response & (self._holy_shield_card[games, defenders] >= 0)
+            if shielded.any():
+                shield_games, shield_players = games[shielded], defenders[shielded]
+                self._recycle(shield_games, self._holy_shield_card[shield_games, shield_players])
+                self._holy_shield_card[shield_games, shield_players] = -1
+
+            hit = no_response & ~shielded
+            if hit.any():
+                self._apply_hit(games[hit], attackers[hit], defenders[hit], attack_types[hit], damages[hit])
+
+            # Counters continue as new attacks
+            next_games, next_attackers, next_defenders, next_cards, next_types, next_damages = [], [], [], [], [], []
+            if counter.any():
+                counter_cards = np.argmax(matching[counter], axis=1)
+                self._remove_card(games[counter], defenders[counter], counter_cards)
+                next_games.append(games[counter])
+                next_attackers.append(defenders[counter])
+                next_defenders.append(counter_target[counter])
+                next_cards.append(counter_cards)
+                next_types.append(np.full(int(counter.sum()), COUNTER))
+                next_damages.append(np.full(int(counter.sum()), 2))
+            if bullet.any():
+                bullet_cards = np.argmax(hands[bullet] & self._is_magic_bullet, axis=1)
+                self._remove_card(games[bullet], defenders[bullet], bullet_cards)
+                next_games.append(games[bullet])
+                next_attackers.append(defenders[bullet])
+                next_defenders.append(self._next_opponent[defenders[bullet]])
+                next_cards.append(bullet_cards)
+                next_types.append(np.full(int(bullet.sum()), MAGIC_BULLET))
+                next_damages.append(damages[bullet] + 1)
+            if not next_games:
+                break
+            games = np.concatenate(next_games)
+            attackers = np.concatenate(next_attackers)
+            defenders = np.concatenate(next_defenders)
+            cards = np.concatenate(next_cards)
+            attack_types = np.concatenate(next_types)
+            damages = np.concatenate(next_damages)
+
+    def _apply_hit(self, games, attackers, defenders, attack_types, damages):
+        final_damages = self._respond_to_damage(games, defenders, damages)
+        damaged = final_damages > 0
+        if damaged.any():
+            self._take_damage(games[damaged], defenders[damaged], final_damages[damaged])
+
+        teams = self._team[attackers]
+        total = self._team_gem[games, teams] + self._team_crystal[games, teams]
+        attack = attack_types == ATTACK
+        gain = attack & (total < TEAM_MAX_JEWELS)
+        convert = attack & ~gain & (self._team_crystal[games, teams] > 0)
+        self._team_gem[games[gain | convert], teams[gain | convert]] += 1
+        self._team_crystal[games[convert], teams[convert]] -= 1
+        counter_gain = (attack_types == COUNTER) & (total < TEAM_MAX_JEWELS)
+        self._team_crystal[games[counter_gain], teams[counter_gain]] += 1
+
+    # Turn phases
+    def _poison_phase(self, games, seat):
+        games = games[self._poison_count[games, seat] > 0]
+        if len(games) == 0:
+            return
+        counts = self._poison_count[games, seat]
+        poison_cards = self._poison_card[games, seat]
+        slots = np.arange(self._max_poisons)
+        keys = np.where(poison_cards >= 0, self._seat_rank[seat][self._poison_source[games, seat]] * self._max_poisons + slots, 1 << 30)
+        poison_cards = np.take_along_axis(poison_cards, np.argsort(keys, axis=1, kind='stable'), axis=1)
+        players = np.full(len(games), seat)
+        for slot in range(int(counts.max())):
+            selected = counts > slot
+            slot_games = games[selected]
+            final_damages = self._respond_to_damage(slot_games, players[selected], np.ones(len(slot_games), dtype=np.int32))
+            damaged = final_damages > 0
+            if damaged.any():
+                self._take_damage(slot_games[damaged], players[selected][damaged], final_damages[damaged])
+            self._recycle(slot_games, poison_cards[selected, slot])
+        self._poison_card[games, seat] = -1
+        self._poison_count[games, seat] = 0
+
+    def _weakness_phase(self, games, seat):
+        """
+        Returns, per game, whether the turn continues.
+        """
+        continue_turn = np.ones(len(games), dtype=bool)
+        weakened = self._weakness_card[games, seat] >= 0
+        if not weakened.any():
+            return continue_turn
+        weak_games = games[weakened]
+        draw = self._hand_size[weak_games, seat] + 3 <= MAX_HAND_SIZE
+        if draw.any():
+            self._take_damage(weak_games[draw], np.full(int(draw.sum()), seat), np.full(int(draw.sum()), 3))
+        self._recycle(weak_games, self._weakness_card[weak_games, seat])
+        self._weakness_card[weak_games, seat] = -1
+        continue_turn[np.flatnonzero(weakened)[~draw]] = False
+        return continue_turn
+
+    def _action_phase(self, games, seat):
+        self._action_points[games, seat] = 1
+        while len(games):
+            self._perform_action(games, seat)
+            self._action_points[games, seat] -= 1
+            games = games[self._running[games] & (self._action_points[games, seat] > 0)]
+
+    def _perform_action(self, games, seat):
+        team = self._team[seat]
+        hands = self._hand[games, seat]
+        hand_size = self._hand_size[games, seat]
+        team_gem, team_crystal = self._team_gem[games, team], self._team_crystal[games, team]
+        team_total = team_gem + team_crystal
+        can_draw = hand_size + 3 <= MAX_HAND_SIZE
+
+        attack_cards = hands & self._is_attack
+        bullet_cards = hands & self._is_magic_bullet
+        poison_cards = hands & self._is_poison
+        weakness_cards = hands & self._is_weakness
+        shield_cards = hands & self._is_holy_shield
+        weakness_targets = self._weakness_card[games] < 0
+        shield_targets = self._holy_shield_card[games] < 0
+        has_weakness = weakness_cards.any(axis=1) & weakness_targets.any(axis=1)
+        has_shield = shield_cards.any(axis=1) & shield_targets.any(axis=1)
+        opponent_weakness_targets = weakness_targets & self._opponents[seat]
+        ally_shield_targets = shield_targets & self._allies[seat]
+
+        choice = np.select([
+            (team_total >= 3) & can_draw,
+            attack_cards.any(axis=1),
+            bullet_cards.any(axis=1),
+            poison_cards.any(axis=1),
+            has_weakness & opponent_weakness_targets.any(axis=1),
+            has_shield & ally_shield_targets.any(axis=1),
+            can_draw,
+            (team_total >= 1) & (self._gem[games, seat] + self._crystal[games, seat] < PLAYER_MAX_JEWELS),
+            has_weakness,
+            has_shield,
+        ], [SYNTHESIS, ATTACK_CARD, MAGIC_BULLET_CARD, POISON_CARD, WEAKNESS_OPPONENT, HOLY_SHIELD_ALLY,
+            PURCHASE, REFINE, WEAKNESS_ANY, HOLY_SHIELD_ANY], default=-1)
+
+        stuck = choice < 0
+        if stuck.any():
+            # GameEngine raises when a player has nothing to do
+            self._error[games[stuck]] = True
+            self._running[games[stuck]] = False
+
+        pending = []
+        opponents = np.broadcast_to(self._opponents[seat], (len(games), self.num_players))
+        for category in range(HOLY_SHIELD_ANY + 1):
+            selected = choice == category
+            if not selected.any():
+                continue
+            category_games = games[selected]
+            players = np.full(len(category_games), seat)
+            if category == SYNTHESIS:
+                crystals = np.minimum(team_crystal[selected], 3)
+                self._team_crystal[category_games, team] -= crystals
+                self._team_gem[category_games, team] -= 3 - crystals
+                self._take_damage(category_games, players, np.full(len(category_games), 3))
+                teams = np.full(len(category_games), team)
+                self._add_grail(category_games, teams)
+                self._add_morale(category_games, 1 - teams, -1)
+            elif category == ATTACK_CARD or category == MAGIC_BULLET_CARD:
+                if category == ATTACK_CARD:
+                    cards = np.argmax(attack_cards[selected], axis=1)
+                    targets, _ = self._most_cards(category_games, opponents[selected])
+                else:
+                    cards = np.argmax(bullet_cards[selected], axis=1)
+                    targets = np.full(len(category_games), self._next_opponent[seat])
+                self._remove_card(category_games, players, cards)
+                attack_type = ATTACK if category == ATTACK_CARD else MAGIC_BULLET
+                pending.append((category_games, players, targets, cards, np.full(len(category_games), attack_type)))
+            elif category == POISON_CARD:
+                cards = np.argmax(poison_cards[selected], axis=1)
+                targets, _ = self._most_cards(category_games, opponents[selected])
+                self._remove_card(category_games, players, cards, recycle=False)
+                slots = self._poison_count[category_games, targets]
+                self._poison_card[category_games, targets, slots] = cards
+                self._poison_source[category_games, targets, slots] = seat
+                self._poison_count[category_games, targets] += 1
+            elif category == WEAKNESS_OPPONENT or category == WEAKNESS_ANY:
+                cards = np.argmax(weakness_cards[selected], axis=1)
+                if category == WEAKNESS_OPPONENT:
+                    targets, _ = self._most_cards(category_games, opponent_weakness_targets[selected])
+                else:
+                    targets = np.argmax(weakness_targets[selected], axis=1)
+                self._remove_card(category_games, players, cards, recycle=False)
+                self._weakness_card[category_games, targets] = cards
+            elif category == HOLY_SHIELD_ALLY or category == HOLY_SHIELD_ANY:
+                cards = np.argmax(shield_cards[selected], axis=1)
+                if category == HOLY_SHIELD_ALLY:
+                    candidates = ally_shield_targets[selected]
+                    targets = np.where(candidates[:, seat], seat, np.argmax(candidates, axis=1))
+                else:
+                    targets = np.argmax(shield_targets[selected], axis=1)
+                self._remove_card(category_games, players, cards, recycle=False)
+                self._holy_shield_card[category_games, targets] = cards
+            elif category == PURCHASE:
+                self._take_damage(category_games, players, np.full(len(category_games), 3))
+                total = self._team_gem[category_games, team] + self._team_crystal[category_games, team]
+                both = total + 2 <= TEAM_MAX_JEWELS
+                one = ~both & (total + 1 <= TEAM_MAX_JEWELS)
+                self._team_gem[category_games[both | one], team] += 1
+                self._team_crystal[category_games[both], team] += 1
+            elif category == REFINE:
+                room = PLAYER_MAX_JEWELS - self._gem[category_games, seat] - self._crystal[category_games, seat]
+                amounts = np.minimum(np.minimum(team_total[selected], room), 2)
+                gems = np.minimum(team_gem[selected], amounts)
+                self._team_gem[category_games, team] -= gems
+                self._team_crystal[category_games, team] -= amounts - gems
+                self._gem[category_games, seat] += gems
+                self._crystal[category_games, seat] += amounts - gems
+
+        for attack_games, attackers, defenders, cards, attack_types in pending:
+            self._resolve_attacks(attack_games, attackers, defenders, cards, attack_types,
+                                  np.full(len(attack_games), 2))
+
+    # Game loop
+    def run(self, num_games=None, seed=None, seeds=None):
+        """
+        Plays num_games games, or one game per seed, to the end and returns the final
+        state of every game as arrays: winner (0 red, 1 blue, -1 none), turns, error,
+        morale, grail, team_gem and team_crystal (the last four of shape (games, 2)).
+
+        :param seed: Seed of the NumPy generator, and of the game seeds if seeds is not given.
+        :param seeds: Deck seed per game, used as random.Random(seed) in exact_shuffle mode.
+        """
+        if seeds is None:
+            if num_games is None:
+                raise ValueError("Either num_games or seeds must be given.")
+            seed_rng = random.Random(seed)
+            seeds = [seed_rng.getrandbits(32) for _ in range(num_games)]
+        num_games = len(seeds)
+        self._setup(num_games, seeds, np.random.default_rng(seed))
+
+        turn = 0
+        while self._running.any():
+            seat = turn % self.num_players
+            games = np.flatnonzero(self._running)
+            self._poison_phase(games, seat)
+            continue_turn = self._weakness_phase(games, seat)
+            acting = games[continue_turn & self._running[games]]
+            self._action_phase(acting, seat)
+            self._turns[games] += 1
+            if self.max_turns is not None:
+                self._running[games[self._turns[games] >= self.max_turns]] = False
+            turn += 1
+
+        return {
+            'winner': self._winner.copy(),
+            'turns': self._turns.copy(),
+            'error': self._error.copy(),
+            'morale': self._morale.copy(),
+            'grail': self._grail.copy(),
+            'team_gem': self._team_gem.copy(),
+            'team_crystal': self._team_crystal.copy(),
+        }
+
+def play_reference_game(seed, num_players=4, deck_path="assets/cardDB.txt", max_turns=500):
+    """
+    Plays one game on GameEngine with PriorityAgents and returns its final state in the
+    format of BatchSimulator.run, for a single game.
+    """
+    agents = {seat + 1: PriorityAgent() for seat in range(num_players)}
+    engine = GameEngine(build_headless_config(agents, deck_path=deck_path, max_turns=max_turns, seed=seed))
+    error = False
+    try:
+        engine.start_game()
+    except Exception:
+        error = True
+    winner = engine.get_winner()
+    teams = engine.get_teams()
+    return {
+        'winner': -1 if winner is None or error else (0 if winner.is_red() else 1),
+        'turns': engine.get_turn_count(),
+        'error': error,
+        'morale': [team.get_morale() for team in teams],
+        'grail': [team.get_grail() for team in teams],
+        'team_gem': [team.get_jewels().get_gem() for team in teams],
+        'team_crystal': [team.get_jewels().get_crystal() for team in teams],
+    }
+
+def cross_check(seeds, num_players=4, deck_path="assets/cardDB.txt", max_turns=500):
+    """
+    Plays every seed on GameEngine and on BatchSimulator in exact_shuffle mode and
+    returns the seeds whose final states differ. Errored games only compare the error.
+    """
+    simulator = BatchSimulator(num_players, deck_path=deck_path, max_turns=max_turns, exact_shuffle=True)
+    batch = simulator.run(seeds=seeds)
+    mismatches = []
+    for game, seed in enumerate(seeds):
+        reference = play_reference_game(seed, num_players, deck_path, max_turns)
+        if reference['error'] or batch['error'][game]:
+            same = reference['error'] == bool(batch['error'][game])
+        else:
+            same = all(np.array_equal(np.asarray(reference[key]), batch[key][game]) for key in reference)
+        if not same:
+            mismatches.append(seed)
+    return mismatches
+
+def benchmark(num_games, num_players=4, deck_path="assets/cardDB.txt", max_turns=500, seed=0, reference_games=200):
+    """
+    Returns the games per second of BatchSimulator and of GameEngine with the same policy.
+    """
+    simulator = BatchSimulator(num_players, deck_path=deck_path, max_turns=max_turns)
+    start = time.perf_counter()
+    simulator.run(num_games, seed=seed)
+    batch_rate = num_games / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for game_seed in range(reference_games):
+        play_reference_game(game_seed, num_players, deck_path, max_turns)
+    reference_rate = reference_games / (time.perf_counter() - start)
+    return batch_rate, reference_rate
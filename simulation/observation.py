@@ -0,0 +1,162 @@
+# simulation/observation.py
+
+import weakref
+import numpy as np
+from models import CardTable
+from models.card import ELEMENTS
+from models.effect import PoisonEffect, WeaknessEffect, HolyShieldEffect
+
+TEAM_FEATURES = ('morale', 'grail', 'gem', 'crystal')
+PLAYER_FEATURES = ('heal', 'gem', 'crystal', 'hand_size', 'poison', 'weakness', 'holy_shield',
+                   'general_points', 'attack_points', 'magic_points', 'special_points')
+EFFECT_TYPES = (PoisonEffect, WeaknessEffect, HolyShieldEffect)
+ACTION_POINT_TYPES = ('general', 'attack', 'magic', 'special')
+# attack cards are counted by element, magic cards by name
+DISCARD_KINDS = tuple(f"attack_{element}" for element in ELEMENTS) + (
+    'poison', 'weakness', 'holy_shield', 'magic_bullet', 'holy_light')
+# native-endian dtypes memoryview can write to; others (e.g. float16 or big-endian
+# buffers) are written by NumPy item assignment
+_MEMORYVIEW_DTYPES = frozenset('bBhHiIlLqQfd')
+
+def _discard_kind(card):
+    if card.is_attack():
+        return card.get_element_id()
+    for kind, predicate in enumerate((card.is_poison, card.is_weakness, card.is_holy_shield,
+                                      card.is_magic_bullet, card.is_holy_light)):
+        if predicate():
+            return len(ELEMENTS) + kind
+    raise ValueError(f"Card {card} has no discard kind.")
+
+def _check_dtype(dtype):
+    if not (np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating)):
+        raise ValueError(f"Observation buffers need an integer or floating point dtype, not {dtype}.")
+
+class ObservationEncoder:
+    """
+    Encodes a game as seen by one player into a fixed layout of numbers, written into
+    a buffer the caller owns:
+
+    - own team then the other team: TEAM_FEATURES
+    - every player in seat order from the observing one: PLAYER_FEATURES, where the
+      effects are counts (poisons stack) and the points are the action points left
+    - the observing player's hand as a multi-hot over card ids
+    - the discard pile as a count per DISCARD_KINDS
+
+    Buffers may have any integer or floating point dtype, in either byte order. Nothing
+    is allocated per call beyond a few Python numbers: the offsets and the card id to
+    discard kind table are built once, values go straight into the buffer through a
+    memoryview (much cheaper than NumPy item assignment; float16 and non-native byte
+    order buffers, which memoryview cannot write, fall back to it), the hand part is
+    cleared and set in place, and discard counts are kept per deck and only the cards
+    recycled since the previous call are added.
+    """
+    def __init__(self, num_players, deck_path="assets/cardDB.txt"):
+        table = CardTable.load(deck_path)
+        self.num_players = num_players
+        self.num_card_ids = max(card.get_card_id() for card in table) + 1
+        self._kind_of = [None] * self.num_card_ids
+        for card in table:
+            self._kind_of[card.get_card_id()] = _discard_kind(card)
+        self._players_offset = 2 * len(TEAM_FEATURES)
+        self._hand_offset = self._players_offset + num_players * len(PLAYER_FEATURES)
+        self._discard_offset = self._hand_offset + self.num_card_ids
+        self.size = self._discard_offset + len(DISCARD_KINDS)
+        # deck -> (discards list, cards counted, counts)
+        self._discard_counts = weakref.WeakKeyDictionary()
+
+    def get_size(self):
+        return self.size
+
+    def get_slices(self):
+        """
+        Returns the slice of every part of the layout, by name.
+        """
+        return {
+            'teams': slice(0, self._players_offset),
+            'players': slice(self._players_offset, self._hand_offset),
+            'hand': slice(self._hand_offset, self._discard_offset),
+            'discards': slice(self._discard_offset, self.size),
+        }
+
+    def new_buffer(self, num_rows=None, dtype=np.float32):
+        """
+        Returns a zeroed buffer for encode (num_rows None) or encode_batch.
+        """
+        _check_dtype(np.dtype(dtype))
+        shape = self.size if num_rows is None else (num_rows, self.size)
+        return np.zeros(shape, dtype=dtype)
+
+    def encode(self, game_engine, player_id, out):
+        """
+        Writes the observation of player_id into out, a 1-D integer or floating point
+        array of at least size numbers (e.g. a row of a 2-D buffer), and returns out.
+        """
+        dtype = out.dtype
+        if dtype.char in _MEMORYVIEW_DTYPES and dtype.isnative:
+            view = memoryview(out)
+        else:
+            _check_dtype(dtype)
+            view = out
+        player = game_engine.get_player(player_id)
+        red_team, blue_team = game_engine.get_teams()
+        own_team, other_team = (red_team, blue_team) if player.get_team().is_red() else (blue_team, red_team)
+        index = 0
+        for team in (own_team, other_team):
+            jewels = team.get_jewels()
+            view[index] = team.get_morale()
+            view[index + 1] = team.get_grail()
+            view[index + 2] = jewels.get_gem()
+            view[index + 3] = jewels.get_crystal()
+            index += 4
+
+        players = game_engine.get_players()
+        if len(players) != self.num_players:
+            raise ValueError(f"Expected {self.num_players} players, got {len(players)}.")
+        seat = players.index(player)
+        for offset in range(self.num_players):
+            other = players[(seat + offset) % self.num_players]
+            jewels = other.get_jewels()
+            view[index] = other.get_heal_amount()
+            view[index + 1] = jewels.get_gem()
+            view[index + 2] = jewels.get_crystal()
+            view[index + 3] = other.get_hand_size()
+            index += 4
+            has_effects = other.count_effects() > 0
+            for effect_type in EFFECT_TYPES:
+                view[index] = other.count_effects(effect_type) if has_effects else 0
+                index += 1
+            action_points = other.get_action_points()
+            for action_type in ACTION_POINT_TYPES:
+                view[index] = action_points[action_type]
+                index += 1
+
+        out[self._hand_offset:self._discard_offset] = 0
+        for card in player.get_hand_cards():
+            view[self._hand_offset + card.get_card_id()] = 1
+
+        index = self._discard_offset
+        for count in self._count_discards(game_engine.get_deck()):
+            view[index] = count
+            index += 1
+        return out
+
+    def encode_batch(self, game_engines, player_ids, out):
+        """
+        Writes the observation of player_ids[i] in game_engines[i] into row i of out and returns out.
+        """
+        for row, (game_engine, player_id) in enumerate(zip(game_engines, player_ids)):
+            self.encode(game_engine, player_id, out[row])
+        return out
+
+    def _count_discards(self, deck):
+        discards = deck.discards
+        state = self._discard_counts.get(deck)
+        # recycling appends to the same list; a reset or restore replaces it
+        if state is None or state[0] is not discards or state[1] > len(discards):
+            state = (discards, 0, [0] * len(DISCARD_KINDS))
+        _, counted, counts = state
+        kind_of = self._kind_of
+        for card in discards[counted:]:
+            counts[kind_of[card.get_card_id()]] += 1
+        self._discard_counts[deck] = (discards, len(discards), counts)
+        return counts
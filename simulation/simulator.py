@@ -0,0 +1,190 @@
+# simulation/simulator.py
+
+import json
+import random
+import time
+import traceback
+from game_engine import GameEngine
+from agents import RandomAgent, GreedyAgent, PriorityAgent, MCTSAgent, ScriptedAgent
+
+AGENT_TYPES = {
+    'random': RandomAgent,
+    'greedy': GreedyAgent,
+    'priority': PriorityAgent,
+    'mcts': MCTSAgent,
+    'scripted': ScriptedAgent,
+}
+
+# Seconds of search per MCTS decision in simulations; the agent's own default is meant
+# for play against people and makes a simulated game take minutes
+MCTS_BUDGET = 0.02
+
+def create_agent(agent_type, seed=None, mcts_budget=MCTS_BUDGET, script=None):
+    """
+    :param script: Choices of a scripted agent; once they run out it plays randomly.
+    """
+    if agent_type == 'random':
+        return RandomAgent(seed=seed)
+    elif agent_type == 'greedy':
+        return GreedyAgent()
+    elif agent_type == 'priority':
+        return PriorityAgent()
+    elif agent_type == 'mcts':
+        return MCTSAgent(time_budget=mcts_budget, seed=seed)
+    elif agent_type == 'scripted':
+        return ScriptedAgent(script or [], fallback=RandomAgent(seed=seed))
+    else:
+        raise ValueError(f"Unknown agent type: {agent_type}")
+
+def load_scripts(path, num_players):
+    """
+    Reads the choices of scripted agents from a JSON file, in ScriptedAgent's format:
+    either one list of choices for every scripted seat, or an object mapping player id
+    to its list.
+
+    :return: A dictionary mapping player id to its choices.
+    """
+    with open(path, encoding="UTF-8") as f:
+        scripts = json.load(f)
+    if isinstance(scripts, list):
+        return {pid: scripts for pid in range(1, num_players + 1)}
+    if isinstance(scripts, dict) and all(isinstance(choices, list) for choices in scripts.values()):
+        return {int(pid): choices for pid, choices in scripts.items()}
+    raise ValueError(f"Script file {path} must hold a list of choices or an object of them by player id.")
+
+def build_headless_config(agents, deck_path="assets/cardDB.txt", max_turns=None, seed=None):
+    """
+    Builds a GameEngine config for a headless game. Players sit in the order of
+    agents and alternate between the red and blue team.
+
+    :param agents: A dictionary mapping player id to agent.
+    :param seed: Seed for the deck shuffles.
+    """
+    players = []
+    for seat, pid in enumerate(agents):
+        players.append({'pid': pid, 'character_type': 'BasePlayer', 'team': 'red' if seat % 2 == 0 else 'blue'})
+    return {
+        'player': players,
+        'deck_path': deck_path,
+        'headless': True,
+        'agents': agents,
+        'max_turns': max_turns,
+        'seed': seed,
+        'debug': False,
+    }
+
+class TeamCurveRecorder:
+    """
+    Samples morale and grail of both teams at the end of every turn.
+    """
+    def __init__(self, game_engine):
+        self._red_team, self._blue_team = game_engine.get_teams()
+        self.morale = {'red': [], 'blue': []}
+        self.grail = {'red': [], 'blue': []}
+        event_manager = game_engine.get_event_manager()
+        priority = len(event_manager.handlers['turn_end_phase'])
+        event_manager.subscribe('turn_end_phase', self._on_turn_end, priority=priority, name='_record_team_curves')
+
+    def _on_turn_end(self, event):
+        self.morale['red'].append(self._red_team.get_morale())
+        self.morale['blue'].append(self._blue_team.get_morale())
+        self.grail['red'].append(self._red_team.get_grail())
+        self.grail['blue'].append(self._blue_team.get_grail())
+
+def run_game(agents, deck_path="assets/cardDB.txt", max_turns=None, seed=None, record_curves=False, journal=None,
+             profiler=None):
+    """
+    Plays one complete game without terminal I/O.
+
+    :param journal: GameJournal to record the game into.
+    :param profiler: EmitProfiler to add the handler timings of the game to.
+
+    The agents are closed once the game is over.
+
+    :return: A dictionary with the winner ('red', 'blue' or None) and the number of turns played.
+             With record_curves, also the per-turn 'morale' and 'grail' of both teams.
+    """
+    try:
+        config = build_headless_config(agents, deck_path=deck_path, max_turns=max_turns, seed=seed)
+        config['journal'] = journal
+        game_engine = GameEngine(config)
+        if profiler is not None:
+            game_engine.get_event_manager().enable_profiling(profiler)
+        recorder = TeamCurveRecorder(game_engine) if record_curves else None
+        game_engine.start_game()
+    finally:
+        for agent in agents.values():
+            agent.close()
+    winner = game_engine.get_winner()
+    result = {
+        'winner': None if winner is None else ('red' if winner.is_red() else 'blue'),
+        'turns': game_engine.get_turn_count(),
+    }
+    if recorder is not None:
+        result['morale'] = recorder.morale
+        result['grail'] = recorder.grail
+    return result
+
+class Simulator:
+    """
+    Runs many headless games in a row and tallies the results.
+
+    :param agent_types: Agent type per seat, e.g. ['greedy', 'random', 'greedy', 'random'].
+    :param journal: GameJournal to record every game into.
+    :param profiler: EmitProfiler to add the handler timings of every game to.
+    :param mcts_budget: Seconds of search per decision of MCTS agents.
+    :param scripts: Choices of the scripted agents by player id, replayed in every game.
+    """
+    def __init__(self, agent_types, deck_path="assets/cardDB.txt", max_turns=500, seed=None, journal=None,
+                 profiler=None, mcts_budget=MCTS_BUDGET, scripts=None):
+        self._agent_types = agent_types
+        self._deck_path = deck_path
+        self._max_turns = max_turns
+        self._journal = journal
+        self._profiler = profiler
+        self._mcts_budget = mcts_budget
+        self._scripts = scripts or {}
+        self._rng = random.Random(seed)
+
+    def _create_agents(self):
+        agents = {}
+        for seat, agent_type in enumerate(self._agent_types):
+            agents[seat + 1] = create_agent(agent_type, seed=self._rng.getrandbits(32), mcts_budget=self._mcts_budget,
+                                            script=self._scripts.get(seat + 1))
+        return agents
+
+    def run(self, num_games):
+        """
+        Plays num_games games and returns the tally. A game that raises counts as an
+        error, and the traceback of the first one is kept as first_error.
+        """
+        summary = {
+            'games': 0,
+            'red_wins': 0,
+            'blue_wins': 0,
+            'draws': 0,
+            'errors': 0,
+            'first_error': None,
+            'total_turns': 0,
+        }
+        start_time = time.perf_counter()
+        for _ in range(num_games):
+            try:
+                result = run_game(self._create_agents(), deck_path=self._deck_path, max_turns=self._max_turns,
+                                  seed=self._rng.getrandbits(32), journal=self._journal,
+                                  profiler=self._profiler)
+            except Exception:
+                summary['errors'] += 1
+                if summary['first_error'] is None:
+                    summary['first_error'] = traceback.format_exc()
+                continue
+            summary['games'] += 1
+            summary['total_turns'] += result['turns']
+            if result['winner'] == 'red':
+                summary['red_wins'] += 1
+            elif result['winner'] == 'blue':
+                summary['blue_wins'] += 1
+            else:
+                summary['draws'] += 1
+        summary['elapsed'] = time.perf_counter() - start_time
+        return summary
@@ -0,0 +1,138 @@
+# simulation/tournament.py
+
+import os
+import random
+import time
+import multiprocessing
+from .simulator import create_agent, run_game, MCTS_BUDGET
+
+def play_seeded_game(task):
+    """
+    Worker entry point. Plays the game described by task and returns its result.
+    Everything random in the game (deck shuffles and agents) is derived from the game seed,
+    so a game can be reproduced from its seed alone, whichever worker played it.
+    """
+    game_index, game_seed, agent_types, deck_path, max_turns, mcts_budget, scripts = task
+    rng = random.Random(game_seed)
+    deck_seed = rng.getrandbits(32)
+    agents = {}
+    for seat, agent_type in enumerate(agent_types):
+        agents[seat + 1] = create_agent(agent_type, seed=rng.getrandbits(32), mcts_budget=mcts_budget,
+                                        script=scripts.get(seat + 1))
+    try:
+        result = run_game(agents, deck_path=deck_path, max_turns=max_turns, seed=deck_seed, record_curves=True)
+    except Exception as e:
+        result = {'error': f"{type(e).__name__}: {e}"}
+    result['game'] = game_index
+    result['seed'] = game_seed
+    return result
+
+class TournamentStats:
+    """
+    Aggregates game results one at a time as they stream in.
+    Curves are averaged per turn over the games that lasted that long.
+    """
+    def __init__(self):
+        self.games = 0
+        self.errors = 0
+        self.wins = {'red': 0, 'blue': 0, None: 0}
+        self.total_turns = 0
+        self._morale_sums = {'red': [], 'blue': []}
+        self._grail_sums = {'red': [], 'blue': []}
+        self._curve_counts = []
+
+    def add(self, result):
+        if 'error' in result:
+            self.errors += 1
+            return
+        self.games += 1
+        self.wins[result['winner']] += 1
+        self.total_turns += result['turns']
+        turns = len(result['morale']['red'])
+        if turns > len(self._curve_counts):
+            extra = turns - len(self._curve_counts)
+            self._curve_counts.extend([0] * extra)
+            for sums in (self._morale_sums, self._grail_sums):
+                for team in sums:
+                    sums[team].extend([0] * extra)
+        for turn in range(turns):
+            self._curve_counts[turn] += 1
+        for curves, sums in ((result['morale'], self._morale_sums), (result['grail'], self._grail_sums)):
+            for team, curve in curves.items():
+                team_sums = sums[team]
+                for turn, value in enumerate(curve):
+                    team_sums[turn] += value
+
+    def _mean_curves(self, sums):
+        return {team: [total / count for total, count in zip(team_sums, self._curve_counts)]
+                for team, team_sums in sums.items()}
+
+    def summary(self):
+        return {
+            'games': self.games,
+            'errors': self.errors,
+            'red_wins': self.wins['red'],
+            'blue_wins': self.wins['blue'],
+            'draws': self.wins[None],
+            'average_turns': self.total_turns / self.games if self.games else 0,
+            'morale_curve': self._mean_curves(self._morale_sums),
+            'grail_curve': self._mean_curves(self._grail_sums),
+        }
+
+class Tournament:
+    """
+    Shards headless games across a process pool.
+
+    :param agent_types: Agent type per seat.
+    :param master_seed: Seed from which every game seed is derived.
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+    :param chunksize: Games handed to a worker at a time. Larger chunks mean less IPC per game.
+    :param mcts_budget: Seconds of search per decision of MCTS agents.
+    :param scripts: Choices of the scripted agents by player id, replayed in every game.
+    """
+    def __init__(self, agent_types, num_games, master_seed=0, workers=None, chunksize=16,
+                 deck_path="assets/cardDB.txt", max_turns=500, mcts_budget=MCTS_BUDGET, scripts=None):
+        self._agent_types = list(agent_types)
+        self._num_games = num_games
+        self._master_seed = master_seed
+        self._workers = workers or os.cpu_count() or 1
+        self._chunksize = chunksize
+        self._deck_path = deck_path
+        self._max_turns = max_turns
+        self._mcts_budget = mcts_budget
+        self._scripts = scripts or {}
+
+    def _tasks(self):
+        rng = random.Random(self._master_seed)
+        for game_index in range(self._num_games):
+            yield (game_index, rng.getrandbits(64), self._agent_types, self._deck_path, self._max_turns,
+                   self._mcts_budget, self._scripts)
+
+    def results(self):
+        """
+        Yields game results in completion order while the games are still running.
+        """
+        if self._workers == 1:
+            for task in self._tasks():
+                yield play_seeded_game(task)
+            return
+        with multiprocessing.Pool(processes=self._workers) as pool:
+            yield from pool.imap_unordered(play_seeded_game, self._tasks(), chunksize=self._chunksize)
+
+    def run(self, on_result=None):
+        """
+        Plays all games and aggregates them as they complete.
+
+        :param on_result: Optional callback called with (result, stats) after each game.
+        :return: The summary of the aggregated statistics.
+        """
+        stats = TournamentStats()
+        start_time = time.perf_counter()
+        for result in self.results():
+            stats.add(result)
+            if on_result is not None:
+                on_result(result, stats)
+        summary = stats.summary()
+        summary['elapsed'] = time.perf_counter() - start_time
+        summary['workers'] = self._workers
+        return summary
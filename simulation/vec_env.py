@@ -0,0 +1,337 @@
+# simulation/vec_env.py
+
+import random
+import threading
+import numpy as np
+from agents.mcts_agent import decision_key
+from game_engine import GameEngine
+from models.action import (
+    NoResponseAction,
+    SynthesisAction,
+    PurchaseAction,
+    RefineAction,
+    CounterCardAction,
+    HolyLightCardAction,
+    MagicBulletCounterCardAction,
+    AttackCardAction,
+    PoisonCardAction,
+    WeaknessCardAction,
+    HolyShieldCardAction,
+    MagicBulletCardAction
+)
+from views import HeadlessInterface
+from .simulator import build_headless_config, create_agent
+from .observation import ObservationEncoder
+
+PLAIN_ACTIONS = (NoResponseAction, SynthesisAction, PurchaseAction, RefineAction)
+CARD_ACTIONS = (CounterCardAction, HolyLightCardAction, MagicBulletCounterCardAction, AttackCardAction,
+                PoisonCardAction, WeaknessCardAction, HolyShieldCardAction, MagicBulletCardAction)
+MAX_HEAL = 8
+MAX_JEWELS = 5
+CHOICES = ('gem', 'crystal', 'skip turn', 'draw 3 cards')
+# ends a multiple selection once it has its minimum number of options
+STOP = 'stop selecting'
+RED = 0
+BLUE = 1
+
+class ActionSpace:
+    """
+    Numbers every option a prompt can offer, so that a decision is an integer below size:
+    each plain action, each card action type with each card, discarding each card, each
+    player as a target, heal amounts, jewel combinations, the named choices, yes/no and
+    STOP.
+    Options are identified by decision_key, so the same option has the same number in
+    every game.
+    """
+    def __init__(self, num_card_ids, player_ids):
+        keys = [action_type.__name__ for action_type in PLAIN_ACTIONS]
+        keys += [(action_type.__name__, card_id) for action_type in CARD_ACTIONS for card_id in range(num_card_ids)]
+        keys += [('card', card_id) for card_id in range(num_card_ids)]
+        keys += [('player', player_id) for player_id in player_ids]
+        keys += list(range(MAX_HEAL + 1))
+        keys += [(gems, crystals) for gems in range(MAX_JEWELS + 1) for crystals in range(MAX_JEWELS + 1)]
+        keys += list(CHOICES)
+        keys += [('answer', False), ('answer', True)]
+        keys.append(STOP)
+        self._keys = keys
+        # bools hash like 0 and 1, so yes/no answers get keys of their own above
+        self._ids = {(type(key), key): action_id for action_id, key in enumerate(keys)}
+        self.size = len(keys)
+
+    def get_id(self, key):
+        action_id = self._ids.get((type(key), key))
+        if action_id is None:
+            raise ValueError(f"Option {key!r} is not in the action space.")
+        return action_id
+
+    def get_key(self, action_id):
+        return self._keys[action_id]
+
+class _Closed(Exception):
+    """
+    Raised in an environment thread to abandon its game when the VecEnv is closed.
+    """
+
+class _EnvInterface(HeadlessInterface):
+    """
+    Interface of one sub-environment. Prompts for the seats the VecEnv plays are handed
+    to the main thread, one option at a time, and the game thread waits for the answer;
+    other seats are answered by their agents. A multiple selection becomes one decision
+    per selected option; once min_selections are selected, STOP is offered with the
+    remaining options until max_selections are.
+    """
+    def __init__(self, env, agents):
+        super().__init__(agents)
+        self._env = env
+
+    def prompt_action_selection(self, actions, player_id=None):
+        if player_id in self._agents:
+            return super().prompt_action_selection(actions, player_id)
+        return actions[self._env.decide(player_id, [decision_key(action) for action in actions])]
+
+    def prompt_multiple_action_selection(self, actions, min_selections, max_selections, player_id=None):
+        if player_id in self._agents:
+            return super().prompt_multiple_action_selection(actions, min_selections, max_selections, player_id)
+        keys = [decision_key(action) for action in actions]
+        selected = []
+        while len(selected) < max_selections:
+            remaining = [index for index in range(len(actions)) if index not in selected]
+            options = [keys[index] for index in remaining]
+            if len(selected) >= min_selections:
+                options.append(STOP)
+            choice = self._env.decide(player_id, options)
+            if choice == len(remaining):
+                break
+            selected.append(remaining[choice])
+        return [actions[index] for index in selected]
+
+    def prompt_yes_no(self, message, player_id=None):
+        if player_id in self._agents:
+            return super().prompt_yes_no(message, player_id)
+        return self._env.decide(player_id, [('answer', False), ('answer', True)]) == 1
+
+class _SubEnv:
+    """
+    One engine playing games back to back in its own thread. The thread and the main
+    thread take turns: the game runs until it needs a decision or ends, then waits
+    until the main thread has answered.
+    """
+    def __init__(self, config):
+        self.interface = _EnvInterface(self, config['agents'])
+        config = dict(config, interface=self.interface, headless=False)
+        self.engine = GameEngine(config)
+        self._agents = config['agents']
+        for agent in self._agents.values():
+            agent.bind(self.engine)
+        self.player_id = None
+        self.options = None
+        self.done = False
+        self.error = None
+        self._answer = None
+        self._closed = False
+        self._seed = None
+        self._to_game = threading.Lock()
+        self._to_main = threading.Lock()
+        self._to_game.acquire()
+        self._to_main.acquire()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._to_game.acquire()
+            if self._closed:
+                return
+            try:
+                self.engine.new_game(self._seed)
+                self.engine.start_game()
+            except _Closed:
+                return
+            except Exception as error:
+                self.error = error
+            self.player_id = None
+            self.options = None
+            self.done = True
+            self._to_main.release()
+
+    def decide(self, player_id, options):
+        """
+        Called in the game thread: hands the options to the main thread and returns the
+        index of the chosen one.
+        """
+        self.player_id = player_id
+        self.options = options
+        self._to_main.release()
+        self._to_game.acquire()
+        if self._closed:
+            raise _Closed()
+        return self._answer
+
+    def start_game(self, seed):
+        """
+        Starts a new game and returns once it needs a decision or has ended.
+        """
+        self._seed = seed
+        self.done = False
+        self._to_game.release()
+        self._to_main.acquire()
+
+    def answer(self, index):
+        self._answer = index
+        self._to_game.release()
+
+    def wait(self):
+        self._to_main.acquire()
+
+    def close(self):
+        self._closed = True
+        self._to_game.release()
+        self._thread.join()
+        for agent in self._agents.values():
+            agent.close()
+
+class VecEnv:
+    """
+    Runs num_envs games side by side for training. Every decision of a seat played by
+    the caller pauses its game; step() answers the pending decision of every game at
+    once and runs each game to its next decision.
+
+    Observations, legal action masks, rewards and done flags come back as arrays with
+    one row per game. An action is a number in the ActionSpace; the mask marks the
+    options of the pending decision. Rewards have a column per team, RED then BLUE:
+    when a game ends in a step, the winning team gets 1 and the other -1 (0 for both
+    on a draw), whichever seat took the last decision; get_acting_teams() gives the
+    column of the seat deciding next.
+    A game that ends is restarted on the same engine with the next seed, and its row
+    then holds the first decision of the new game.
+
+    Observations are written by ObservationEncoder, from the deciding player's view.
+
+    :param agents: Agent type per seat for the seats the caller does not play, e.g.
+                   {2: 'greedy', 4: 'greedy'}; by default the caller plays every seat.
+    """
+    def __init__(self, num_envs, num_players=4, agents=None, deck_path="assets/cardDB.txt", max_turns=500, seed=None):
+        self._rng = random.Random(seed)
+        self.num_envs = num_envs
+        self.encoder = ObservationEncoder(num_players, deck_path=deck_path)
+        player_ids = list(range(1, num_players + 1))
+        self.action_space = ActionSpace(self.encoder.num_card_ids, player_ids)
+        agents = agents or {}
+        if all(pid in agents for pid in player_ids):
+            raise ValueError("Every seat is played by an agent; leave at least one seat to the caller.")
+        self._envs = []
+        for _ in range(num_envs):
+            env_agents = {pid: create_agent(agent_type, seed=self._rng.getrandbits(32)) for pid, agent_type in agents.items()}
+            config = build_headless_config({pid: env_agents.get(pid) for pid in player_ids}, deck_path=deck_path,
+                                           max_turns=max_turns)
+            config['agents'] = env_agents
+            self._envs.append(_SubEnv(config))
+        self._obs = self.encoder.new_buffer(num_envs)
+        self._legal_mask = np.zeros((num_envs, self.action_space.size), dtype=bool)
+        self._reward = np.zeros((num_envs, 2), dtype=np.float32)
+        self._done = np.zeros(num_envs, dtype=bool)
+        self._acting = np.zeros(num_envs, dtype=np.int16)
+        self._acting_team = np.zeros(num_envs, dtype=np.int8)
+        self._option_ids = [None] * num_envs
+
+    def get_observation_size(self):
+        return self.encoder.get_size()
+
+    def _start_game(self, index):
+        env = self._envs[index]
+        while True:
+            env.start_game(self._rng.getrandbits(32))
+            self._check(env)
+            if not env.done:
+                return
+            # a game that ended before any decision of the caller's seats
+
+    def _check(self, env):
+        if env.error is not None:
+            error, env.error = env.error, None
+            raise error
+
+    def _encode(self, index):
+        """
+        Writes the observation and legal mask of the pending decision of game index.
+        """
+        env = self._envs[index]
+        self.encoder.encode(env.engine, env.player_id, self._obs[index])
+        option_ids = [self.action_space.get_id(key) for key in env.options]
+        mask = self._legal_mask[index]
+        mask[:] = False
+        mask[option_ids] = True
+        self._option_ids[index] = {action_id: option for option, action_id in enumerate(option_ids)}
+        self._acting[index] = env.player_id
+        self._acting_team[index] = RED if env.engine.get_player(env.player_id).get_team().is_red() else BLUE
+
+    def reset(self):
+        """
+        Starts a new game in every sub-environment and returns (obs, legal_mask).
+        """
+        for index in range(self.num_envs):
+            self._start_game(index)
+            self._encode(index)
+        return self._obs, self._legal_mask
+
+    def step(self, actions):
+        """
+        Answers the pending decision of every game with actions[i] and runs the games
+        to their next decision.
+
+        If a game raised, every game is still brought to its next decision and the failed
+        one restarted before the first error is raised, so stepping can go on.
+
+        :return: (obs, legal_mask, reward, done), reward of shape (num_envs, 2). The arrays
+                 are reused by the next call.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}.")
+        for index, env in enumerate(self._envs):
+            option = self._option_ids[index].get(int(actions[index]))
+            if option is None:
+                raise ValueError(f"Action {actions[index]} is not legal in environment {index}.")
+            env.answer(option)
+        self._reward[:] = 0.0
+        self._done[:] = False
+        # every game is brought back to a decision before an error is raised, so the
+        # next step does not answer games that are still running
+        for env in self._envs:
+            env.wait()
+        first_error = None
+        for index, env in enumerate(self._envs):
+            if env.error is not None:
+                # the failed game is dropped without a reward and replaced by a new one
+                first_error = first_error or env.error
+                env.error = None
+            elif env.done:
+                winner = env.engine.get_winner()
+                if winner is not None:
+                    self._reward[index] = (1.0, -1.0) if winner.is_red() else (-1.0, 1.0)
+            if env.done:
+                self._done[index] = True
+                self._start_game(index)
+            self._encode(index)
+        if first_error is not None:
+            raise first_error
+        return self._obs, self._legal_mask, self._reward, self._done
+
+    def get_acting_players(self):
+        """
+        Returns the id of the player deciding the pending decision of every game.
+        """
+        return self._acting
+
+    def get_acting_teams(self):
+        """
+        Returns the reward column (RED or BLUE) of the player deciding the pending decision of every game.
+        """
+        return self._acting_team
+
+    def get_engine(self, index):
+        return self._envs[index].engine
+
+    def close(self):
+        for env in self._envs:
+            env.close()
+        self._envs = []
@@ -1,5 +1,6 @@
 # views/__init__.py
 
 from .console_interface import ConsoleInterface, LocalConsoleInterface, NetworkedConsoleInterface
+from .headless_interface import HeadlessInterface
 
-__all__ = ['ConsoleInterface', 'LocalConsoleInterface', 'NetworkedConsoleInterface']
\ No newline at end of file
+__all__ = ['ConsoleInterface', 'LocalConsoleInterface', 'NetworkedConsoleInterface', 'HeadlessInterface']
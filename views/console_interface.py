@@ -1,14 +1,71 @@
 # views/console_interface.py
 from abc import ABC, abstractmethod
+from .public_state import PublicStateEncoder
+
+# Message levels, lowest first. Messages below an interface's level are never formatted.
+DEBUG = 10
+INFO = 20
+SILENT = 100
 
 class ConsoleInterface(ABC):
     def __init__(self, debug=False):
         self.debug = debug
+        self.level = DEBUG if debug else INFO
 
     @abstractmethod
     def send_message(self, message, player_id=None, broadcast=False, debug=False):
         pass
 
+    def is_enabled_for(self, level):
+        return level >= self.level
+
+    def log(self, level, template, *args, player_id=None, broadcast=False):
+        """
+        Sends a message if level is enabled. The message is built only then, either as
+        template.format(*args) or, if template is callable, as template(*args).
+        """
+        if level < self.level:
+            return
+        if callable(template):
+            message = template(*args)
+        else:
+            message = template.format(*args) if args else template
+        self.send_message(message, player_id=player_id, broadcast=broadcast, debug=level <= DEBUG)
+
+    def log_debug(self, template, *args):
+        """
+        Shorthand for log(DEBUG, template, *args) with the level check inlined.
+        """
+        if self.level > DEBUG:
+            return
+        self.log(DEBUG, template, *args)
+
+    def log_info(self, template, *args, player_id=None, broadcast=False):
+        """
+        Shorthand for log(INFO, ...), used for game output addressed to players.
+        """
+        if self.level > INFO:
+            return
+        self.log(INFO, template, *args, player_id=player_id, broadcast=broadcast)
+
+    def flush(self):
+        """
+        Delivers buffered messages. Called before prompts and at the end of every phase.
+        """
+        pass
+
+    def display_public_information(self, game_engine):
+        """
+        Shows every player the public state of the game.
+        """
+        if self.level > INFO:
+            return
+        red_team, blue_team = game_engine.get_teams()
+        self.send_message("\n--- Public Information ---", broadcast=True)
+        self.log_info("{}", red_team, broadcast=True)
+        self.log_info("{}", blue_team, broadcast=True)
+        self.send_message("--------------------------\n", broadcast=True)
+
     @abstractmethod
     def prompt_action_selection(self, actions, player_id=None):
         pass
@@ -103,63 +160,93 @@ class LocalConsoleInterface(ConsoleInterface):
         return selected_actions
 
 class NetworkedConsoleInterface(ConsoleInterface):
+    """
+    Interface of a game played by network clients. Outgoing messages are queued and
+    flushed at sync points (before every prompt and at the end of every phase), so
+    each client gets one frame per sync point instead of one per message.
+    """
     def __init__(self, game_server, debug=False):
         super().__init__(debug)
         self.game_server = game_server
+        self._public_state = PublicStateEncoder()
+        # (recipient player id, or None for everyone, message) in sending order
+        self._outbox = []
 
     def send_message(self, message, player_id=None, broadcast=False, debug=False):
         if broadcast:
-            self.game_server.broadcast({"type": "message", "content": message, 'debug': debug})
+            self._outbox.append((None, {"type": "message", "content": message, 'debug': debug}))
         elif player_id is not None:
-            self.game_server.send_to_player(player_id, {"type": "message", "content": message, 'debug': debug})
+            self._outbox.append((player_id, {"type": "message", "content": message, 'debug': debug}))
         else:
             raise ValueError("No player ID or broadcast flag provided.")
 
+    def flush(self, prompted_player_id=None):
+        if not self._outbox:
+            return
+        batches = {}
+        for player_id in self.game_server.get_player_ids():
+            messages = [message for recipient, message in self._outbox if recipient is None or recipient == player_id]
+            if messages:
+                batches[player_id] = messages
+        self._outbox = []
+        self.game_server.send_batches(batches, prompted_player_id)
+
+    def _prompt(self, player_id, message):
+        """
+        Sends a prompt together with everything queued so far and waits for the answer.
+        """
+        self._outbox.append((player_id, message))
+        self.flush(prompted_player_id=player_id)
+        return self.game_server.wait_for_response(player_id)
+
+    def display_public_information(self, game_engine):
+        """
+        Sends the structured public state the first time, then only the fields that changed.
+        Clients rebuild and render the view themselves.
+        """
+        message = self._public_state.encode(game_engine.get_public_state())
+        if message is not None:
+            self._outbox.append((None, message))
+
     def prompt_action_selection(self, actions, player_id):
-        self.game_server.send_to_player(player_id, {
-            "type": "action_selection",
-            "actions": [str(action) for action in actions]
-        })
-        response = self.game_server.wait_for_response(player_id)
-        return actions[response['selected_action']]
+        if not actions:
+            raise ValueError("No available actions to select.")
+        while True:
+            response = self._prompt(player_id, {
+                "type": "action_selection",
+                "actions": [str(action) for action in actions]
+            })
+            choice = response.get('selected_action')
+            if isinstance(choice, int) and 0 <= choice < len(actions):
+                return actions[choice]
+            self.send_message("Invalid selection. Please select a valid action.", player_id=player_id)
 
     def prompt_yes_no(self, message, player_id):
-        self.game_server.send_to_player(player_id, {
+        response = self._prompt(player_id, {
             "type": "yes_no_prompt",
             "message": message
         })
-        response = self.game_server.wait_for_response(player_id)
-        return response['choice']
-
-    def prompt_multiple_action_selection(self, actions, num_selections, player_id):
-        self.game_server.send_to_player(player_id, {
-            "type": "multiple_action_selection",
-            "actions": [str(action) for action in actions],
-            "num_selections": num_selections
-        })
-        response = self.game_server.wait_for_response(player_id)
-        return [actions[idx] for idx in response['selected_actions']]
+        return bool(response.get('choice'))
 
-
-    def prompt_action_selection(self, actions):
+    def prompt_multiple_action_selection(self, actions, min_selections, max_selections, player_id):
         if not actions:
-            print("\nNo available actions to select.")
             raise ValueError("No available actions to select.")
-
-        print("\nAvailable Actions:")
-        for idx, action in enumerate(actions):
-            print(f"{idx}: {action}")
+        if min_selections > max_selections:
+            raise ValueError("Minimum selections cannot be greater than maximum selections.")
+        if max_selections > len(actions):
+            raise ValueError("Maximum selections cannot be greater than the number of available actions.")
         while True:
-            try:
-                choice = int(input("Select an action number: "))
-                if 0 <= choice < len(actions):
-                    selected_action = actions[choice]
-                    print(f"You have selected: {selected_action}")
-                    return selected_action
-                else:
-                    print("Invalid selection. Please select a valid action.")
-            except ValueError:
-                print("Invalid input. Please enter a number.")
+            response = self._prompt(player_id, {
+                "type": "multiple_action_selection",
+                "actions": [str(action) for action in actions],
+                "min_selections": min_selections,
+                "max_selections": max_selections
+            })
+            choices = response.get('selected_actions')
+            if (isinstance(choices, list) and min_selections <= len(set(choices)) == len(choices) <= max_selections and
+                    all(isinstance(idx, int) and 0 <= idx < len(actions) for idx in choices)):
+                return [actions[idx] for idx in choices]
+            self.send_message(f"Select between {min_selections} and {max_selections} different action(s).", player_id=player_id)
 
     def prompt_target_selection(self, targets):
         if not targets:
@@ -201,16 +288,6 @@ class NetworkedConsoleInterface(ConsoleInterface):
             except ValueError:
                 print("Invalid input. Please enter a number.")
 
-    def prompt_yes_no(self, message):
-        while True:
-            choice = input(f"{message} [Y/N]: ").strip().lower()
-            if choice == 'y':
-                return True
-            elif choice == 'n':
-                return False
-            else:
-                print("Invalid input. Enter 'Y' or 'N'.")
-
     def prompt_defender_action(self, defender, attacker, valid_counter_actions):
         print(f"\nPlayer {defender.id} is being attacked by Player {attacker.id}.")
         defender.show_hand()
@@ -0,0 +1,61 @@
+# views/headless_interface.py
+
+from .console_interface import ConsoleInterface, SILENT
+
+class HeadlessInterface(ConsoleInterface):
+    """
+    Interface without any terminal I/O. Every prompt is answered by the agent
+    registered for the prompted player, and messages are dropped.
+    Logged messages are not even formatted unless debug is set.
+    """
+    def __init__(self, agents, debug=False):
+        super().__init__(debug)
+        self._agents = agents
+        self._decision_log = None
+        if not debug:
+            self.level = SILENT
+
+    def enable_decision_log(self):
+        """
+        Starts keeping the answer to every prompt and returns the list they are appended
+        to: the chosen option, a tuple of the chosen options for a multiple selection and
+        a bool for a yes/no question.
+        """
+        if self._decision_log is None:
+            self._decision_log = []
+        return self._decision_log
+
+    def send_message(self, message, player_id=None, broadcast=False, debug=False):
+        pass
+
+    def get_agent(self, player_id):
+        agent = self._agents.get(player_id)
+        if agent is None:
+            raise ValueError(f"No agent registered for player {player_id}.")
+        return agent
+
+    def prompt_action_selection(self, actions, player_id=None):
+        if not actions:
+            raise ValueError("No available actions to select.")
+        selected = self.get_agent(player_id).select_action(actions, player_id)
+        if self._decision_log is not None:
+            self._decision_log.append(selected)
+        return selected
+
+    def prompt_yes_no(self, message, player_id=None):
+        answer = self.get_agent(player_id).select_yes_no(message, player_id)
+        if self._decision_log is not None:
+            self._decision_log.append(bool(answer))
+        return answer
+
+    def prompt_multiple_action_selection(self, actions, min_selections, max_selections, player_id=None):
+        if not actions:
+            raise ValueError("No available actions to select.")
+        if min_selections > max_selections:
+            raise ValueError("Minimum selections cannot be greater than maximum selections.")
+        if max_selections > len(actions):
+            raise ValueError("Maximum selections cannot be greater than the number of available actions.")
+        selected = self.get_agent(player_id).select_multiple_actions(actions, min_selections, max_selections, player_id)
+        if self._decision_log is not None:
+            self._decision_log.append(tuple(selected))
+        return selected
@@ -0,0 +1,90 @@
+# views/public_state.py
+#
+# Public state sent to networked clients. The server sends the full state once, with
+# the dotted paths of its fields (e.g. "players.3.hand" or "teams.red.morale"), and
+# then only the fields that changed, as a flat [field index, value, ...] list.
+
+def flatten_state(state, prefix=""):
+    """
+    Returns a dict mapping the dotted path of every leaf of state to its value.
+    Lists are leaves.
+    """
+    fields = {}
+    for key, value in state.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            fields.update(flatten_state(value, f"{path}."))
+        else:
+            fields[path] = value
+    return fields
+
+def diff_states(old_values, new_values):
+    """
+    Returns the changes between two lists of field values as a flat
+    [field index, new value, ...] list.
+    """
+    changes = []
+    for index, (old_value, new_value) in enumerate(zip(old_values, new_values)):
+        if old_value != new_value:
+            changes.append(index)
+            changes.append(new_value)
+    return changes
+
+def apply_delta(state, fields, changes):
+    """
+    Applies a delta to a nested state in place. fields is the list of paths sent
+    with the full state.
+    """
+    for i in range(0, len(changes), 2):
+        keys = fields[changes[i]].split('.')
+        target = state
+        for key in keys[:-1]:
+            target = target.setdefault(key, {})
+        target[keys[-1]] = changes[i + 1]
+    return state
+
+def format_public_state(state):
+    """
+    Renders a public state as the text shown by the local console.
+    """
+    lines = ["\n--- Public Information ---"]
+    for team_name in ('red', 'blue'):
+        team = state['teams'][team_name]
+        lines.append(f"{team_name.capitalize()} Team - Morale: {team['morale']}, Grail: {team['grail']}, "
+                     f"Jewels(G/C): {team['gem']}/{team['crystal']}")
+        lines.append("Players:")
+        for player_id, player in state['players'].items():
+            if player['team'] == team_name:
+                lines.append(f"  Player {player_id}, Jewels(G/C): {player['gem']}/{player['crystal']}, "
+                             f"Hand: {player['hand']}/{player['hand_max']}, Effects: Effects: {player['effects']}, "
+                             f"Heal: {player['heal']}/{player['heal_max']}")
+    lines.append("--------------------------\n")
+    return "\n".join(lines)
+
+class PublicStateEncoder:
+    """
+    Turns successive public states into messages: a full "public_state" message the
+    first time (or whenever the set of fields changes), then "delta"
+    messages holding only the changed fields, or None when nothing changed.
+    """
+    def __init__(self):
+        self._paths = None
+        self._values = None
+
+    def reset(self):
+        self._paths = None
+        self._values = None
+
+    def encode(self, state):
+        fields = flatten_state(state)
+        paths = list(fields)
+        values = list(fields.values())
+        if paths != self._paths:
+            self._paths = paths
+            self._values = values
+            return {"type": "public_state", "state": state, "fields": paths}
+        changes = diff_states(self._values, values)
+        self._values = values
+        if not changes:
+            return None
+        return {"type": "delta", "changes": changes}